@@ -7,7 +7,9 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 
 from pystac import (
+    Asset,
     Catalog,
+    CatalogType,
     Collection,
     Extent,
     Item,
@@ -15,6 +17,7 @@ from pystac import (
     StacIO,
     TemporalExtent,
 )
+from pystac.stac_io import DefaultStacIO
 
 from ._base import Bench
 from ._util import get_data_path
@@ -91,6 +94,31 @@ class ReadCatalogBench(Bench):
         for _, _, _ in catalog.walk():
             pass
 
+    def peakmem_read_and_walk(self) -> None:
+        catalog = Catalog.from_file(self.path)
+        for _, _, _ in catalog.walk():
+            pass
+
+
+class ReadItemsBench(Bench):
+    params = [False, True]
+    param_names = ["intern_keys"]
+
+    def setup(self, intern_keys: bool) -> None:
+        self.stac_io = DefaultStacIO(intern_keys=intern_keys)
+        # Serialized, so that every item is parsed into its own strings
+        self.item_jsons = [
+            json.dumps(item.to_dict()) for item in make_large_items(10000)
+        ]
+
+    def peakmem_read_items(self, intern_keys: bool) -> None:
+        _ = [
+            self.stac_io.stac_object_from_dict(
+                self.stac_io.json_loads(item_json), preserve_dict=False
+            )
+            for item_json in self.item_jsons
+        ]
+
 
 class WriteCatalogBench(Bench):
     def setup(self) -> None:
@@ -104,6 +132,22 @@ class WriteCatalogBench(Bench):
         self.catalog.normalize_and_save(self.temporary_directory.name)
 
 
+class SaveCatalogAgainBench(Bench):
+    def setup(self) -> None:
+        self.catalog = make_large_catalog()
+        self.temporary_directory = TemporaryDirectory()
+        self.catalog.normalize_and_save(
+            self.temporary_directory.name, CatalogType.SELF_CONTAINED
+        )
+
+    def teardown(self) -> None:
+        shutil.rmtree(self.temporary_directory.name)
+
+    def time_save_again_incremental(self) -> None:
+        """Save a catalog that was saved before, skipping the unchanged files."""
+        self.catalog.save(incremental=True)
+
+
 def make_large_catalog() -> Catalog:
     catalog = Catalog("an-id", "a description")
     extent = Extent(
@@ -117,3 +161,32 @@ def make_large_catalog() -> Catalog:
             collection.add_item(item)
         catalog.add_child(collection)
     return catalog
+
+
+def make_large_items(count: int) -> list[Item]:
+    items = []
+    for i in range(count):
+        item = Item(
+            f"item-{i}",
+            {"type": "Point", "coordinates": [0.0, 0.0]},
+            [0.0, 0.0, 0.0, 0.0],
+            datetime(2023, 1, 1),
+            {"platform": "platform", "instruments": ["instrument"], "gsd": 10},
+            stac_extensions=[
+                "https://stac-extensions.github.io/eo/v1.1.0/schema.json",
+                "https://stac-extensions.github.io/projection/v2.0.0/schema.json",
+            ],
+            collection="a-collection",
+        )
+        for key in ["visual", "thumbnail", "red", "green", "blue", "nir"]:
+            item.add_asset(
+                key,
+                Asset(
+                    f"https://example.com/{i}/{key}.tif",
+                    media_type="image/tiff; application=geotiff",
+                    roles=["data"],
+                    extra_fields={"proj:code": "EPSG:4326", "eo:bands": []},
+                ),
+            )
+        items.append(item)
+    return items
@@ -20,6 +20,10 @@ class ItemBench(Bench):
         with open(self.item_path) as src:
             self.item_dict = json.load(src)
         self.item = Item.from_file(self.item_path)
+        self.current_item_dict = self.item.to_dict()
+        self.lazy_item = self.stac_io.stac_object_from_dict(
+            self.current_item_dict, href=self.item_path, lazy=True
+        )
 
     def teardown(self) -> None:
         shutil.rmtree(self.temp_dir, ignore_errors=True)
@@ -32,10 +36,30 @@ class ItemBench(Bench):
         """Deserialize an Item from dictionary."""
         _ = Item.from_dict(self.item_dict)
 
+    def time_item_from_dict_current_version(self) -> None:
+        """Deserialize an Item that does not need migrating from dictionary."""
+        _ = Item.from_dict(self.current_item_dict)
+
+    def time_stac_object_from_dict_current_version(self) -> None:
+        """Deserialize an Item that does not need migrating, without copying its
+        dictionary."""
+        _ = self.stac_io.stac_object_from_dict(
+            self.current_item_dict, preserve_dict=False
+        )
+
+    def peakmem_items_from_dict(self) -> None:
+        """Deserialize many Items with many assets and links from dictionary."""
+        _ = [Item.from_dict(self.item_dict) for _ in range(1000)]
+
     def time_item_to_dict(self) -> None:
         """Serialize an Item to a dictionary."""
         self.item.to_dict(include_self_link=True)
 
+    def time_lazy_item_to_dict(self) -> None:
+        """Serialize an Item whose assets and links were not accessed since it was
+        read lazily."""
+        self.lazy_item.to_dict(include_self_link=True)
+
     def time_item_save(self) -> None:
         """Serialize an Item to a JSON file."""
         self.item.save_object(
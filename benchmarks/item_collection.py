@@ -0,0 +1,18 @@
+from pystac import ItemCollection
+
+from ._base import Bench
+from .catalog import make_large_items
+
+
+class ItemCollectionFromDictBench(Bench):
+    params = [None, 2, 4]
+    param_names = ["max_workers"]
+
+    def setup(self, max_workers: int | None) -> None:
+        self.item_collection_dict = ItemCollection(
+            make_large_items(20000), clone_items=False
+        ).to_dict()
+
+    def time_item_collection_from_dict(self, max_workers: int | None) -> None:
+        """Deserialize a large FeatureCollection."""
+        ItemCollection.from_dict(self.item_collection_dict, max_workers=max_workers)
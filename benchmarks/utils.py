@@ -0,0 +1,32 @@
+from pystac.utils import _str_to_datetime, str_to_datetime
+
+from ._base import Bench
+
+
+class StrToDatetimeBench(Bench):
+    def setup(self) -> None:
+        # More distinct timestamps than str_to_datetime memoizes
+        self.timestamps = [
+            f"2023-{month:02d}-{day:02d}T{hour:02d}:30:00.123456Z"
+            for month in range(1, 13)
+            for day in range(1, 29)
+            for hour in range(0, 24, 6)
+        ]
+        self.offset_timestamps = [t[:-1] + "+01:00" for t in self.timestamps]
+
+    def time_str_to_datetime(self) -> None:
+        """Parse distinct canonical UTC timestamps."""
+        _str_to_datetime.cache_clear()
+        for timestamp in self.timestamps:
+            str_to_datetime(timestamp)
+
+    def time_str_to_datetime_repeated(self) -> None:
+        """Parse the same canonical UTC timestamp many times."""
+        for _ in self.timestamps:
+            str_to_datetime("2023-01-01T00:00:00Z")
+
+    def time_str_to_datetime_with_offset(self) -> None:
+        """Parse distinct timestamps with UTC offsets, which dateutil parses."""
+        _str_to_datetime.cache_clear()
+        for timestamp in self.offset_timestamps:
+            str_to_datetime(timestamp)
@@ -7,6 +7,7 @@ __all__ = [
     "__version__",
     "TemplateError",
     "STACError",
+    "STACSaveError",
     "STACTypeError",
     "DuplicateObjectKeyError",
     "ExtensionAlreadyExistsError",
@@ -24,6 +25,7 @@ __all__ = [
     "HIERARCHICAL_LINKS",
     "Catalog",
     "CatalogType",
+    "SaveResult",
     "Collection",
     "Extent",
     "SpatialExtent",
@@ -51,6 +53,7 @@ from typing import Any
 from pystac.errors import (
     TemplateError,
     STACError,
+    STACSaveError,
     STACTypeError,
     DuplicateObjectKeyError,
     ExtensionAlreadyExistsError,
@@ -71,7 +74,7 @@ from pystac.rel_type import RelType
 from pystac.stac_io import StacIO
 from pystac.stac_object import STACObject, STACObjectType
 from pystac.link import Link, HIERARCHICAL_LINKS
-from pystac.catalog import Catalog, CatalogType
+from pystac.catalog import Catalog, CatalogType, SaveResult
 from pystac.collection import (
     Collection,
     Extent,
@@ -0,0 +1,254 @@
+"""Conversion of STAC Items to and from `Apache Arrow <https://arrow.apache.org/>`__
+tables.
+
+The functions in this module are used by :meth:`ItemCollection.to_arrow
+<pystac.ItemCollection.to_arrow>` and :meth:`ItemCollection.from_arrow
+<pystac.ItemCollection.from_arrow>`, and require the ``pyarrow`` package:
+
+.. code-block:: shell
+
+    pip install pystac[arrow]
+
+Each table row is one Item. The top-level Item fields (``id``, ``collection``,
+``bbox``, ``links``, ``assets``, ...) and every property become their own column,
+so that they can be filtered and aggregated without deserializing the Items.
+Properties that share their name with a top-level field of another Item are
+stored in a ``properties.<name>`` column. Column types are inferred by
+``pyarrow``; ``datetime``, ``start_datetime``, ``end_datetime``, ``created`` and
+``updated`` are stored as UTC timestamps. The ``geometry``, and any column whose
+values do not share a single Arrow type, is stored as GeoJSON / JSON text.
+
+Missing values are stored as nulls, so properties (and fields of nested objects
+such as assets) that are explicitly set to ``null`` are dropped when a table is
+read back, except for the ``datetime`` property.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from pystac.utils import datetime_to_str, str_to_datetime
+
+if TYPE_CHECKING:
+    import pyarrow
+
+_import_error_message = (
+    "pyarrow is not installed.\n\n"
+    "Please install pystac with the arrow extra:\n\n"
+    "  pip install pystac[arrow]"
+)
+
+ITEM_FIELDS = frozenset(
+    [
+        "type",
+        "stac_version",
+        "stac_extensions",
+        "id",
+        "geometry",
+        "bbox",
+        "links",
+        "assets",
+        "collection",
+    ]
+)
+"""Top-level Item fields, which are read back into the Item rather than into its
+properties."""
+
+TIMESTAMP_PROPERTIES = frozenset(
+    ["datetime", "start_datetime", "end_datetime", "created", "updated"]
+)
+"""Properties that are stored as timestamp columns."""
+
+# Field metadata written by to_table
+_LOCATION = b"pystac:location"
+_NAME = b"pystac:name"
+_ENCODING = b"pystac:encoding"
+_EXTRA_FIELDS = b"pystac:extra_fields"
+
+_ITEM = b"item"
+_PROPERTIES = b"properties"
+_JSON = b"json"
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(_import_error_message) from e
+    return pyarrow
+
+
+def _import_parquet() -> Any:
+    try:
+        from pyarrow import parquet
+    except ImportError as e:
+        raise ImportError(_import_error_message) from e
+    return parquet
+
+
+def to_table(
+    item_dicts: Iterable[dict[str, Any]],
+    extra_fields: dict[str, Any] | None = None,
+) -> pyarrow.Table:
+    """Converts Item dictionaries to a :class:`pyarrow.Table` with one row per
+    Item.
+
+    Args:
+        item_dicts : The dictionaries of the Items to convert.
+        extra_fields : Additional top-level fields of the FeatureCollection, which
+            are stored in the table's schema metadata.
+
+    Returns:
+        pyarrow.Table: The table.
+    """
+    pa = _import_pyarrow()
+
+    columns: dict[tuple[bytes, str], list[Any]] = {}
+    num_rows = 0
+    for row, d in enumerate(item_dicts):
+        num_rows += 1
+        for location, obj in ((_ITEM, d), (_PROPERTIES, d.get("properties") or {})):
+            for key, value in obj.items():
+                if location == _ITEM and key == "properties":
+                    continue
+                column = columns.get((location, key))
+                if column is None:
+                    column = columns[(location, key)] = [None] * row
+                column.append(value)
+        for column in columns.values():
+            if len(column) < num_rows:
+                column.append(None)
+
+    arrays = []
+    fields = []
+    for (location, key), values in columns.items():
+        array, encoding = _to_array(pa, key, location, values)
+        metadata = {_LOCATION: location}
+        name = key
+        if location == _PROPERTIES and (_ITEM, key) in columns:
+            # e.g. "collection", which older Items have as a property
+            name = f"properties.{key}"
+            metadata[_NAME] = key.encode("utf-8")
+        if encoding is not None:
+            metadata[_ENCODING] = encoding
+        arrays.append(array)
+        fields.append(pa.field(name, array.type, metadata=metadata))
+
+    schema_metadata = None
+    if extra_fields:
+        schema_metadata = {_EXTRA_FIELDS: json.dumps(extra_fields).encode("utf-8")}
+    return pa.Table.from_arrays(
+        arrays, schema=pa.schema(fields, metadata=schema_metadata)
+    )
+
+
+def from_table(
+    table: pyarrow.Table,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Converts a :class:`pyarrow.Table` created by :func:`to_table` back to Item
+    dictionaries.
+
+    Tables that were not written by PySTAC can be read as long as their geometries
+    are GeoJSON (either text or nested columns): columns named after top-level
+    Item fields are read into the Item, and all other columns into its properties.
+
+    Args:
+        table : The table to convert.
+
+    Returns:
+        tuple[list[dict], dict]: The Item dictionaries, and the additional
+        top-level fields of the FeatureCollection.
+    """
+    columns = []
+    for field in table.schema:
+        metadata = field.metadata or {}
+        location = metadata.get(
+            _LOCATION, _ITEM if field.name in ITEM_FIELDS else _PROPERTIES
+        )
+        name = metadata[_NAME].decode("utf-8") if _NAME in metadata else field.name
+        columns.append((field.name, name, location, metadata.get(_ENCODING)))
+
+    item_dicts = []
+    for row in table.to_pylist():
+        d: dict[str, Any] = {}
+        properties: dict[str, Any] = {}
+        for column, name, location, encoding in columns:
+            target = d if location == _ITEM else properties
+            value = row[column]
+            if value is None:
+                if (location == _ITEM and name == "geometry") or (
+                    location == _PROPERTIES and name == "datetime"
+                ):
+                    target[name] = None
+                continue
+            if encoding == _JSON:
+                value = json.loads(value)
+            elif isinstance(value, datetime):
+                value = datetime_to_str(value)
+            else:
+                value = _strip_nulls(value)
+            if name == "geometry" and isinstance(value, str):
+                value = json.loads(value)
+            target[name] = value
+        d["properties"] = properties
+        item_dicts.append(d)
+
+    extra_fields: dict[str, Any] = {}
+    schema_metadata = table.schema.metadata or {}
+    if _EXTRA_FIELDS in schema_metadata:
+        extra_fields = json.loads(schema_metadata[_EXTRA_FIELDS])
+    return item_dicts, extra_fields
+
+
+def _to_array(
+    pa: Any, key: str, location: bytes, values: list[Any]
+) -> tuple[Any, bytes | None]:
+    if location == _PROPERTIES and key in TIMESTAMP_PROPERTIES:
+        try:
+            return (
+                pa.array(
+                    [None if v is None else str_to_datetime(v) for v in values],
+                    type=pa.timestamp("us", tz="UTC"),
+                ),
+                None,
+            )
+        except (ValueError, TypeError, OverflowError, pa.ArrowException):
+            pass
+    if not (location == _ITEM and key == "geometry"):
+        try:
+            array = pa.array(values)
+        except (ValueError, TypeError, OverflowError, pa.ArrowException):
+            pass
+        else:
+            if not _has_empty_struct(pa, array.type):
+                return array, None
+    return (
+        pa.array(
+            [None if v is None else json.dumps(v) for v in values], type=pa.string()
+        ),
+        _JSON,
+    )
+
+
+def _has_empty_struct(pa: Any, typ: Any) -> bool:
+    # Parquet cannot store structs without fields, e.g. from items without assets
+    if pa.types.is_struct(typ):
+        return typ.num_fields == 0 or any(
+            _has_empty_struct(pa, typ.field(i).type) for i in range(typ.num_fields)
+        )
+    if pa.types.is_list(typ) or pa.types.is_large_list(typ):
+        return _has_empty_struct(pa, typ.value_type)
+    return False
+
+
+def _strip_nulls(value: Any) -> Any:
+    # Struct columns have a field for every key seen in any row, so keys that were
+    # missing from a row come back as None.
+    if isinstance(value, dict):
+        return {k: _strip_nulls(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_strip_nulls(v) for v in value]
+    return value
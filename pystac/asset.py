@@ -8,7 +8,13 @@ from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 
 from pystac import MediaType, STACError, common_metadata, utils
 from pystac.html.jinja_env import get_jinja_env
-from pystac.utils import is_absolute_href, make_absolute_href, make_relative_href
+from pystac.utils import (
+    _intern,
+    _intern_all,
+    is_absolute_href,
+    make_absolute_href,
+    make_relative_href,
+)
 
 if TYPE_CHECKING:
     from pystac.common_metadata import CommonMetadata
@@ -38,6 +44,16 @@ class Asset:
             object JSON.
     """
 
+    __slots__ = (
+        "href",
+        "title",
+        "description",
+        "media_type",
+        "roles",
+        "owner",
+        "_extra_fields",
+    )
+
     href: str
     """Link to the asset object. Relative and absolute links are both allowed."""
 
@@ -61,9 +77,7 @@ class Asset:
     """The :class:`~pystac.Item` or :class:`~pystac.Collection` that this asset belongs
     to, or ``None`` if it has no owner."""
 
-    extra_fields: dict[str, Any]
-    """Optional, additional fields for this asset. This is used by extensions as a
-    way to serialize and deserialize properties on asset object JSON."""
+    _extra_fields: dict[str, Any] | None
 
     def __init__(
         self,
@@ -77,13 +91,26 @@ class Asset:
         self.href = utils.make_posix_style(href)
         self.title = title
         self.description = description
-        self.media_type = media_type
+        self.media_type = _intern(media_type)
         self.roles = roles
-        self.extra_fields = extra_fields or {}
+        # Assets without extra fields share no dict until one is needed
+        self._extra_fields = extra_fields or None
 
         # The Item which owns this Asset.
         self.owner = None
 
+    @property
+    def extra_fields(self) -> dict[str, Any]:
+        """Optional, additional fields for this asset. This is used by extensions as a
+        way to serialize and deserialize properties on asset object JSON."""
+        if self._extra_fields is None:
+            self._extra_fields = {}
+        return self._extra_fields
+
+    @extra_fields.setter
+    def extra_fields(self, v: dict[str, Any]) -> None:
+        self._extra_fields = v
+
     def set_owner(self, obj: Assets) -> None:
         """Sets the owning item of this Asset.
 
@@ -132,15 +159,31 @@ class Asset:
         if self.description is not None:
             d["description"] = self.description
 
-        if self.extra_fields is not None and len(self.extra_fields) > 0:
-            for k, v in self.extra_fields.items():
-                d[k] = v
+        if self._extra_fields:
+            d.update(self._extra_fields)
 
         if self.roles is not None:
             d["roles"] = self.roles
 
         return d
 
+    @staticmethod
+    def _is_normalized_dict(d: dict[str, Any]) -> bool:
+        # Whether ``d`` is what ``Asset.from_dict(d).to_dict()`` returns: the fields
+        # of to_dict without nulls, in its order, followed by the extra fields and
+        # the roles
+        keys = list(d)
+        if "roles" in d:
+            if keys.pop() != "roles" or d["roles"] is None:
+                return False
+        n = 0
+        for key in ("href", "type", "title", "description"):
+            if key in d:
+                if keys[n] != key or d[key] is None:
+                    return False
+                n += 1
+        return n > 0 and keys[0] == "href" and all(keys[n:])
+
     def clone(self) -> Asset:
         """Clones this asset. Makes a ``deepcopy`` of the
         :attr:`~pystac.Asset.extra_fields`.
@@ -155,7 +198,7 @@ class Asset:
             description=self.description,
             media_type=self.media_type,
             roles=self.roles,
-            extra_fields=deepcopy(self.extra_fields),
+            extra_fields=deepcopy(self._extra_fields),
         )
 
     def has_role(self, role: str) -> bool:
@@ -201,7 +244,7 @@ class Asset:
         media_type = d.pop("type", None)
         title = d.pop("title", None)
         description = d.pop("description", None)
-        roles = d.pop("roles", None)
+        roles: list[str] | None = _intern_all(d.pop("roles", None))
         properties = None
         if any(d):
             properties = d
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import warnings
-from collections.abc import Callable, Iterable, Iterator
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from copy import deepcopy
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
+    NamedTuple,
     TypeVar,
     cast,
 )
@@ -15,7 +20,7 @@ from typing import (
 import pystac
 import pystac.media_type
 from pystac.cache import ResolvedObjectCache
-from pystac.errors import STACError, STACTypeError
+from pystac.errors import STACError, STACSaveError, STACTypeError
 from pystac.layout import (
     APILayoutStrategy,
     BestPracticesLayoutStrategy,
@@ -27,11 +32,14 @@ from pystac.serialization import (
     identify_stac_object,
     identify_stac_object_type,
     migrate_to_latest,
+    needs_migration,
 )
+from pystac.stac_io import _json_options
 from pystac.stac_object import STACObject, STACObjectType
 from pystac.utils import (
     HREF,
     StringEnum,
+    _intern_all,
     _is_url,
     is_absolute_href,
     make_absolute_href,
@@ -43,10 +51,156 @@ if TYPE_CHECKING:
     from pystac.collection import Collection
     from pystac.extensions.ext import CatalogExt
     from pystac.item import Item
+    from pystac.stac_io import AsyncStacIO
 
 #: Generalized version of :class:`Catalog`
 C = TypeVar("C", bound="Catalog")
 
+T = TypeVar("T")
+
+
+def _iter_with_executor(
+    max_workers: int | None,
+    prefetch: int | None,
+    fn: Callable[[_Reader | None], Iterable[T]],
+) -> Iterator[T]:
+    # Keeps a thread pool alive for as long as the iteration runs. Pending reads are
+    # cancelled if the consumer stops early. Lazy iterables that were yielded, like
+    # those of walk, read without the pool once it is shut down.
+    if max_workers is None and prefetch is None:
+        yield from fn(None)
+        return
+    executor = ThreadPoolExecutor(max_workers=max_workers or prefetch)
+    try:
+        yield from fn(_Reader(executor, prefetch))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _Reader(NamedTuple):
+    # How the links of each catalog are read ahead during a traversal
+    executor: Executor
+    prefetch: int | None
+
+
+class SaveResult(NamedTuple):
+    """The number of files written by :meth:`Catalog.save`."""
+
+    written: int
+    """The number of files that were written."""
+
+    skipped: int
+    """The number of files that were left as they were, because an incremental
+    save found that they already held the serialized object."""
+
+
+def _overrides_save_object(obj: STACObject) -> bool:
+    # Objects whose class overrides save_object are saved by calling it, rather
+    # than by serializing and writing them in the writers below
+    return type(obj).save_object is not STACObject.save_object
+
+
+class _Writer:
+    # Writes the objects of a Catalog.save one at a time, and counts the files
+    # that were written and, if incremental, those that were already up to date.
+
+    def __init__(self, json_options: dict[str, bool], incremental: bool) -> None:
+        self.json_options = json_options
+        self.incremental = incremental
+        self.written = 0
+        self.skipped = 0
+
+    def save_object(
+        self,
+        obj: STACObject,
+        include_self_link: bool,
+        dest_href: str | None,
+        stac_io: pystac.StacIO | None,
+    ) -> None:
+        if self.incremental and not _overrides_save_object(obj):
+            stac_io, dest_href = obj._get_save_target(stac_io, dest_href)
+            d = obj.to_dict(include_self_link=include_self_link)
+            self._count(self._write(stac_io, dest_href, d))
+        else:
+            obj.save_object(
+                include_self_link=include_self_link,
+                dest_href=dest_href,
+                stac_io=stac_io,
+                **self.json_options,
+            )
+            self._count(True)
+
+    def _write(self, stac_io: pystac.StacIO, dest_href: str, d: dict[str, Any]) -> bool:
+        if self.incremental:
+            return stac_io.save_json_if_changed(dest_href, d, **self.json_options)
+        stac_io.save_json(dest_href, d, **self.json_options)
+        return True
+
+    def _count(self, written: bool) -> None:
+        if written:
+            self.written += 1
+        else:
+            self.skipped += 1
+
+    def result(self) -> SaveResult:
+        return SaveResult(self.written, self.skipped)
+
+    def __enter__(self) -> _Writer:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: Any) -> None:
+        pass
+
+
+class _ParallelWriter(_Writer):
+    # Serializes objects on the calling thread and hands the writes to a thread
+    # pool. At most ``max_pending`` writes are queued at once so that the
+    # serialized dictionaries of a large catalog are never all held in memory.
+    # Failed writes are collected and raised together as a STACSaveError on exit.
+
+    def __init__(
+        self, max_workers: int, json_options: dict[str, bool], incremental: bool
+    ) -> None:
+        super().__init__(json_options, incremental)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.max_pending = 2 * max_workers
+        self.pending: deque[tuple[str, Future[bool]]] = deque()
+        self.failures: dict[str, Exception] = {}
+
+    def save_object(
+        self,
+        obj: STACObject,
+        include_self_link: bool,
+        dest_href: str | None,
+        stac_io: pystac.StacIO | None,
+    ) -> None:
+        if _overrides_save_object(obj):
+            super().save_object(obj, include_self_link, dest_href, stac_io)
+            return
+        stac_io, dest_href = obj._get_save_target(stac_io, dest_href)
+        d = obj.to_dict(include_self_link=include_self_link)
+        while len(self.pending) >= self.max_pending:
+            self._wait_for_oldest()
+        self.pending.append(
+            (dest_href, self.executor.submit(self._write, stac_io, dest_href, d))
+        )
+
+    def _wait_for_oldest(self) -> None:
+        href, future = self.pending.popleft()
+        try:
+            self._count(future.result())
+        except Exception as e:
+            self.failures[href] = e
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: Any) -> None:
+        try:
+            while self.pending:
+                self._wait_for_oldest()
+        finally:
+            self.executor.shutdown(wait=True)
+        if exc_type is None and self.failures:
+            raise STACSaveError(self.failures)
+
 
 class CatalogType(StringEnum):
     SELF_CONTAINED = "SELF_CONTAINED"
@@ -434,16 +588,61 @@ class Catalog(STACObject):
                     return child
             return None
 
-    def get_children(self) -> Iterable[Catalog | Collection]:
+    def get_children(
+        self, max_workers: int | None = None, prefetch: int | None = None
+    ) -> Iterable[Catalog | Collection]:
         """Return all children of this catalog.
 
+        Args:
+            max_workers : If set, all unresolved child links are read in parallel
+                by a thread pool with this many workers. Children are still yielded
+                in link order.
+            prefetch : If set, only the next ``prefetch`` unresolved child links are
+                read in the background while the caller handles the current child,
+                by a thread pool with ``max_workers`` (or ``prefetch``) workers.
+
         Return:
             Iterable[Catalog or Collection]: Iterable of children who's parent
             is this catalog.
         """
+        if max_workers is None and prefetch is None:
+            return self._get_children(None)
+        return _iter_with_executor(max_workers, prefetch, self._get_children)
+
+    def _get_children(self, reader: _Reader | None) -> Iterator[Catalog | Collection]:
         return map(
             lambda x: cast(pystac.Catalog | pystac.Collection, x),
-            self.get_stac_objects(pystac.RelType.CHILD),
+            self._get_stac_objects(pystac.RelType.CHILD, reader),
+        )
+
+    def _get_stac_objects(
+        self, rel: pystac.RelType, reader: _Reader | None
+    ) -> Iterable[STACObject]:
+        if reader is None:
+            return self.get_stac_objects(rel)
+        return self.get_stac_objects(
+            rel, executor=reader.executor, prefetch=reader.prefetch
+        )
+
+    async def get_children_async(
+        self, stac_io: AsyncStacIO | None = None
+    ) -> list[Catalog | Collection]:
+        """Asynchronously return all children of this catalog.
+
+        All child links are resolved concurrently.
+
+        Args:
+            stac_io : Optional :class:`~pystac.stac_io.AsyncStacIO` to read children
+                with. If not provided, a :class:`~pystac.stac_io.DefaultAsyncStacIO`
+                wrapping this catalog's :class:`~pystac.StacIO` is used.
+
+        Return:
+            List[Catalog or Collection]: List of children who's parent
+            is this catalog, in link order.
+        """
+        return cast(
+            list[pystac.Catalog | pystac.Collection],
+            await self.get_stac_objects_async(pystac.RelType.CHILD, stac_io=stac_io),
         )
 
     def get_collections(self) -> Iterable[Collection]:
@@ -535,7 +734,13 @@ class Catalog(STACObject):
                     return item
             return None
 
-    def get_items(self, *ids: str, recursive: bool = False) -> Iterator[Item]:
+    def get_items(
+        self,
+        *ids: str,
+        recursive: bool = False,
+        max_workers: int | None = None,
+        prefetch: int | None = None,
+    ) -> Iterator[Item]:
         """Return all items or specific items of this catalog.
 
         Args:
@@ -543,28 +748,87 @@ class Catalog(STACObject):
             recursive : If True, search this catalog and all children for the
                 item; otherwise, only search the items of this catalog. Defaults
                 to False.
+            max_workers : If set, all unresolved item and child links of each
+                catalog are read in parallel by a thread pool with this many
+                workers. Items are still yielded in the same order.
+            prefetch : If set, only the next ``prefetch`` unresolved item (or child)
+                links of each catalog are read in the background while the caller
+                handles the current item, by a thread pool with ``max_workers`` (or
+                ``prefetch``) workers.
 
         Return:
             Iterator[Item]: Generator of items whose parent is this catalog, and
                 (if recursive) all catalogs or collections connected to this catalog
                 through child links.
         """
+        yield from _iter_with_executor(
+            max_workers,
+            prefetch,
+            lambda reader: self._get_items(ids, recursive, reader),
+        )
+
+    def _get_items(
+        self, ids: tuple[str, ...], recursive: bool, reader: _Reader | None
+    ) -> Iterator[Item]:
         items: Iterator[Item]
         if not recursive:
             items = map(
                 lambda x: cast(pystac.Item, x),
-                self.get_stac_objects(pystac.RelType.ITEM),
+                self._get_stac_objects(pystac.RelType.ITEM, reader),
             )
         else:
             items = chain(
-                self.get_items(recursive=False),
-                *(child.get_items(recursive=True) for child in self.get_children()),
+                self._get_items((), False, reader),
+                *(
+                    child._get_items((), True, reader)
+                    for child in self._get_children(reader)
+                ),
             )
         if ids:
             yield from (i for i in items if i.id in ids)
         else:
             yield from items
 
+    async def get_items_async(
+        self,
+        *ids: str,
+        recursive: bool = False,
+        stac_io: AsyncStacIO | None = None,
+    ) -> AsyncIterator[Item]:
+        """Asynchronously return all items or specific items of this catalog.
+
+        This is the asynchronous counterpart of :meth:`Catalog.get_items`. All item
+        links of a catalog are resolved concurrently, and items are yielded in the
+        same order as :meth:`Catalog.get_items`.
+
+        Args:
+            *ids : The IDs of the items to include.
+            recursive : If True, search this catalog and all children for the
+                item; otherwise, only search the items of this catalog. Defaults
+                to False.
+            stac_io : Optional :class:`~pystac.stac_io.AsyncStacIO` to read items
+                with. If not provided, a :class:`~pystac.stac_io.DefaultAsyncStacIO`
+                wrapping this catalog's :class:`~pystac.StacIO` is used.
+
+        Return:
+            AsyncIterator[Item]: Asynchronous generator of items whose parent is
+                this catalog, and (if recursive) all catalogs or collections
+                connected to this catalog through child links.
+        """
+        if stac_io is None:
+            stac_io = self._get_async_stac_io()
+        if recursive:
+            async for _, _, items in self.walk_async(stac_io=stac_io):
+                for item in items:
+                    if not ids or item.id in ids:
+                        yield item
+        else:
+            for obj in await self.get_stac_objects_async(
+                pystac.RelType.ITEM, stac_io=stac_io
+            ):
+                if not ids or obj.id in ids:
+                    yield cast(pystac.Item, obj)
+
     def clear_items(self) -> None:
         """Removes all items from this catalog.
 
@@ -710,7 +974,11 @@ class Catalog(STACObject):
         strategy: HrefLayoutStrategy | None = None,
         stac_io: pystac.StacIO | None = None,
         skip_unresolved: bool = False,
-    ) -> None:
+        max_workers: int | None = None,
+        compact: bool | None = None,
+        sort_keys: bool | None = None,
+        incremental: bool = False,
+    ) -> SaveResult:
         """Normalizes link HREFs to the given root_href, and saves the catalog.
 
         This is a convenience method that simply calls :func:`Catalog.normalize_hrefs
@@ -735,11 +1003,30 @@ class Catalog(STACObject):
                 Defaults to False. Because unresolved links are not saved, this
                 argument can be used to normalize and save only newly-added
                 objects.
+            max_workers : If set, files are written in parallel by a thread pool
+                with this many workers. See :meth:`Catalog.save`.
+            compact : If ``True``, write the JSON without indentation or whitespace.
+                Defaults to the ``compact`` attribute of the :class:`~pystac.StacIO`.
+            sort_keys : If ``True``, write the keys of JSON objects in sorted order.
+                Defaults to the ``sort_keys`` attribute of the
+                :class:`~pystac.StacIO`.
+            incremental : If ``True``, only write the files whose contents changed.
+                See :meth:`Catalog.save`.
+
+        Returns:
+            SaveResult: The number of files that were written and skipped.
         """
         self.normalize_hrefs(
             root_href, strategy=strategy, skip_unresolved=skip_unresolved
         )
-        self.save(catalog_type, stac_io=stac_io)
+        return self.save(
+            catalog_type,
+            stac_io=stac_io,
+            max_workers=max_workers,
+            compact=compact,
+            sort_keys=sort_keys,
+            incremental=incremental,
+        )
 
     def normalize_hrefs(
         self,
@@ -936,7 +1223,11 @@ class Catalog(STACObject):
         catalog_type: CatalogType | None = None,
         dest_href: str | None = None,
         stac_io: pystac.StacIO | None = None,
-    ) -> None:
+        max_workers: int | None = None,
+        compact: bool | None = None,
+        sort_keys: bool | None = None,
+        incremental: bool = False,
+    ) -> SaveResult:
         """Save this catalog and all it's children/item to files determined by the
         object's self link HREF or a specified path.
 
@@ -951,6 +1242,32 @@ class Catalog(STACObject):
             stac_io : Optional instance of :class:`~pystac.StacIO` to use. If not
                 provided, will use the instance set while reading in the catalog,
                 or the default instance if this is not available.
+            max_workers : If set, files are written in parallel by a thread pool
+                with this many workers. Objects are still serialized one at a
+                time, and only a bounded number of writes are queued at once.
+                Rather than stopping at the first file that cannot be written, all
+                remaining files are written and a :class:`~pystac.STACSaveError`
+                listing every failure is raised at the end.
+            compact : If ``True``, write the JSON without indentation or whitespace,
+                which makes the files smaller and faster to read. Defaults to the
+                ``compact`` attribute of the :class:`~pystac.StacIO`.
+            sort_keys : If ``True``, write the keys of JSON objects in sorted order.
+                Defaults to the ``sort_keys`` attribute of the
+                :class:`~pystac.StacIO`.
+            incremental : If ``True``, each object is serialized and compared with
+                the file that is already at its destination, which is only written
+                if it differs (see :meth:`StacIO.save_json_if_changed
+                <pystac.StacIO.save_json_if_changed>`). Files that are left as they
+                were are counted as skipped in the result.
+
+        Objects of classes that override :meth:`STACObject.save_object
+        <pystac.STACObject.save_object>` are always saved by calling it, on the
+        calling thread, even if ``max_workers`` or ``incremental`` is set. They are
+        counted as written.
+
+        Returns:
+            SaveResult: The number of files that were written and skipped.
+
         Note:
             If the catalog type is ``CatalogType.ABSOLUTE_PUBLISHED``,
             all self links will be included, and hierarchical links be absolute URLs.
@@ -960,7 +1277,6 @@ class Catalog(STACObject):
             If the catalog  type is ``CatalogType.SELF_CONTAINED``, no self links will
             be included and hierarchical links will be relative URLs.
         """
-
         root = self.get_root()
         if root is None:
             raise Exception("There is no root catalog")
@@ -968,6 +1284,37 @@ class Catalog(STACObject):
         if catalog_type is not None:
             root.catalog_type = catalog_type
 
+        json_options = _json_options(compact, sort_keys)
+        batch_stac_io = stac_io or root._stac_io
+        writer = (
+            _Writer(json_options, incremental)
+            if max_workers is None
+            else _ParallelWriter(max_workers, json_options, incremental)
+        )
+        with batch_stac_io.batch() if batch_stac_io is not None else nullcontext():
+            with writer:
+                self._save(dest_href, stac_io, writer)
+
+        if catalog_type is not None:
+            self.catalog_type = catalog_type
+
+        return writer.result()
+
+    def _save(
+        self,
+        dest_href: str | None,
+        stac_io: pystac.StacIO | None,
+        writer: _Writer,
+    ) -> None:
+        root = self.get_root()
+        if root is None:
+            raise Exception("There is no root catalog")
+
+        def save_object(
+            obj: STACObject, include_self_link: bool, dest_href: str | None
+        ) -> None:
+            writer.save_object(obj, include_self_link, dest_href, stac_io)
+
         items_include_self_link = root.catalog_type in [CatalogType.ABSOLUTE_PUBLISHED]
 
         for child_link in self.get_child_links():
@@ -978,12 +1325,9 @@ class Catalog(STACObject):
                     child_dest_href = make_absolute_href(
                         rel_href, dest_href, start_is_dir=True
                     )
-                    child.save(
-                        dest_href=os.path.dirname(child_dest_href),
-                        stac_io=stac_io,
-                    )
+                    child._save(os.path.dirname(child_dest_href), stac_io, writer)
                 else:
-                    child.save(stac_io=stac_io)
+                    child._save(None, stac_io, writer)
 
         for item_link in self.get_item_links():
             if item_link.is_resolved():
@@ -993,15 +1337,9 @@ class Catalog(STACObject):
                     item_dest_href = make_absolute_href(
                         rel_href, dest_href, start_is_dir=True
                     )
-                    item.save_object(
-                        include_self_link=items_include_self_link,
-                        dest_href=item_dest_href,
-                        stac_io=stac_io,
-                    )
+                    save_object(item, items_include_self_link, item_dest_href)
                 else:
-                    item.save_object(
-                        include_self_link=items_include_self_link, stac_io=stac_io
-                    )
+                    save_object(item, items_include_self_link, None)
 
         include_self_link = False
         # include a self link if this is the root catalog
@@ -1019,16 +1357,10 @@ class Catalog(STACObject):
             catalog_dest_href = make_absolute_href(
                 rel_href, dest_href, start_is_dir=True
             )
-        self.save_object(
-            include_self_link=include_self_link,
-            dest_href=catalog_dest_href,
-            stac_io=stac_io,
-        )
-        if catalog_type is not None:
-            self.catalog_type = catalog_type
+        save_object(self, include_self_link, catalog_dest_href)
 
     def walk(
-        self,
+        self, max_workers: int | None = None, prefetch: int | None = None
     ) -> Iterable[tuple[Catalog, Iterable[Catalog], Iterable[Item]]]:
         """Walks through children and items of catalogs.
 
@@ -1040,26 +1372,78 @@ class Catalog(STACObject):
 
         This has similar functionality to Python's :func:`os.walk`.
 
+        Args:
+            max_workers : If set, the unresolved child and item links of each
+                catalog are read in parallel by a thread pool with this many workers
+                as soon as the children or items are iterated. Iteration order is
+                unchanged. The pool is shut down when the walk ends; children and
+                items that are only iterated after that are read one at a time.
+            prefetch : If set, only the next ``prefetch`` unresolved child (or item)
+                links of each catalog are read in the background while the caller
+                handles the current one, by a thread pool with ``max_workers`` (or
+                ``prefetch``) workers.
+
         Returns:
            Generator[(Catalog, Generator[Catalog], Generator[Item])]: A generator that
            yields a 3-tuple (parent_catalog, children, items).
         """
-        children = self.get_children()
-        items = self.get_items()
+        yield from _iter_with_executor(max_workers, prefetch, self._walk)
+
+    def _walk(
+        self, reader: _Reader | None
+    ) -> Iterator[tuple[Catalog, Iterable[Catalog], Iterable[Item]]]:
+        children = self._get_children(reader)
+        items = self._get_items((), False, reader)
 
         yield self, children, items
-        for child in self.get_children():
-            yield from child.walk()
+        for child in self._get_children(reader):
+            yield from child._walk(reader)
+
+    async def walk_async(
+        self, stac_io: AsyncStacIO | None = None
+    ) -> AsyncIterator[tuple[Catalog, list[Catalog | Collection], list[Item]]]:
+        """Asynchronously walks through children and items of catalogs.
 
-    def fully_resolve(self) -> None:
+        This is the asynchronous counterpart of :meth:`Catalog.walk`, and yields
+        the same 3-tuples in the same order. Before a catalog is yielded, all of its
+        child and item links are resolved concurrently, so the children and items
+        are lists rather than lazy iterables.
+
+        Args:
+            stac_io : Optional :class:`~pystac.stac_io.AsyncStacIO` to read objects
+                with. Its ``max_concurrency`` bounds the number of reads in flight.
+                If not provided, a :class:`~pystac.stac_io.DefaultAsyncStacIO`
+                wrapping this catalog's :class:`~pystac.StacIO` is used.
+
+        Returns:
+           AsyncIterator[(Catalog, List[Catalog], List[Item])]: An asynchronous
+           generator that yields a 3-tuple (parent_catalog, children, items).
+        """
+        if stac_io is None:
+            stac_io = self._get_async_stac_io()
+        children, items = await asyncio.gather(
+            self.get_children_async(stac_io=stac_io),
+            self.get_stac_objects_async(pystac.RelType.ITEM, stac_io=stac_io),
+        )
+
+        yield self, children, cast(list[pystac.Item], items)
+        for child in children:
+            async for result in child.walk_async(stac_io=stac_io):
+                yield result
+
+    def fully_resolve(self, max_workers: int | None = None) -> None:
         """Resolves every link in this catalog.
 
         Useful if, e.g., you'd like to read a catalog from a filesystem, upgrade
         every object in the catalog to the latest STAC version, and save it back
         to the filesystem. By default, :py:meth:`~pystac.Catalog.save` skips
         unresolved links.
+
+        Args:
+            max_workers : If set, links are read in parallel by a thread pool with
+                this many workers. See :meth:`Catalog.walk`.
         """
-        for _, _, items in self.walk():
+        for _, _, items in self.walk(max_workers=max_workers):
             # items is a generator, so we need to consume it to resolve the
             # items
             for item in items:
@@ -1227,22 +1611,21 @@ class Catalog(STACObject):
         migrate: bool = True,
         preserve_dict: bool = True,
     ) -> C:
-        if migrate:
-            info = identify_stac_object(d)
-            d = migrate_to_latest(d, info)
+        if migrate and needs_migration(d):
+            # Migrating returns a copy
+            d = migrate_to_latest(d, identify_stac_object(d))
+        elif preserve_dict:
+            d = deepcopy(d)
 
         if not cls.matches_object_type(d):
             raise STACTypeError(d, cls)
 
         catalog_type = CatalogType.determine_type(d)
 
-        if preserve_dict:
-            d = deepcopy(d)
-
         id = d.pop("id")
         description = d.pop("description")
         title = d.pop("title", None)
-        stac_extensions = d.pop("stac_extensions", None)
+        stac_extensions: list[str] | None = _intern_all(d.pop("stac_extensions", None))
         links = d.pop("links")
 
         d.pop("stac_version")
@@ -27,9 +27,11 @@ from pystac.serialization import (
     identify_stac_object,
     identify_stac_object_type,
     migrate_to_latest,
+    needs_migration,
 )
 from pystac.summaries import Summaries
 from pystac.utils import (
+    _intern_all,
     datetime_to_str,
     str_to_datetime,
 )
@@ -637,24 +639,23 @@ class Collection(Catalog, Assets):
     ) -> C:
         from pystac.extensions.version import CollectionVersionExtension
 
-        if migrate:
-            info = identify_stac_object(d)
-            d = migrate_to_latest(d, info)
+        if migrate and needs_migration(d):
+            # Migrating returns a copy
+            d = migrate_to_latest(d, identify_stac_object(d))
+        elif preserve_dict:
+            d = deepcopy(d)
 
         if not cls.matches_object_type(d):
             raise STACTypeError(d, cls)
 
         catalog_type = CatalogType.determine_type(d)
 
-        if preserve_dict:
-            d = deepcopy(d)
-
         id = d.pop("id")
         description = d.pop("description")
         license = d.pop("license")
         extent = Extent.from_dict(d.pop("extent"))
         title = d.pop("title", None)
-        stac_extensions = d.pop("stac_extensions", None)
+        stac_extensions: list[str] | None = _intern_all(d.pop("stac_extensions", None))
         keywords = d.pop("keywords", None)
         providers = d.pop("providers", None)
         if providers is not None:
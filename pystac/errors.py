@@ -18,6 +18,26 @@ class STACError(Exception):
     pass
 
 
+class STACSaveError(STACError):
+    """Raised at the end of a parallel :meth:`~pystac.Catalog.save` if one or more
+    files could not be written.
+
+    Args:
+        failures : Mapping of the destination HREF of each file that could not be
+            written to the exception that was raised while writing it.
+    """
+
+    failures: dict[str, Exception]
+    """Mapping of destination HREFs to the exception raised while writing them."""
+
+    def __init__(self, failures: dict[str, Exception]):
+        message = f"Failed to write {len(failures)} file(s): " + ", ".join(
+            f"{href} ({e!r})" for href, e in failures.items()
+        )
+        super().__init__(message)
+        self.failures = failures
+
+
 class STACTypeError(Exception):
     """A STACTypeError is raised when encountering a representation of
     a STAC entity that is not correct for the context; for example, if
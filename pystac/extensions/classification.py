@@ -727,6 +727,11 @@ class ClassificationExtensionHooks(ExtensionHooks):
     }
     stac_object_types = {pystac.STACObjectType.ITEM}
 
+    def needs_migration(self, obj: dict[str, Any]) -> bool:
+        return self._has_prev_extension_id(obj) or SCHEMA_URI_PATTERN.format(
+            version="1.0.0"
+        ) in (obj.get("stac_extensions") or [])
+
     def migrate(
         self, obj: dict[str, Any], version: STACVersionID, info: STACJSONDescription
     ) -> None:
@@ -608,6 +608,10 @@ class EOExtensionHooks(ExtensionHooks):
     }
     stac_object_types = {pystac.STACObjectType.ITEM}
 
+    def needs_migration(self, obj: dict[str, Any]) -> bool:
+        # Fields are only moved for older STAC versions
+        return self._has_prev_extension_id(obj)
+
     def migrate(
         self, obj: dict[str, Any], version: STACVersionID, info: STACJSONDescription
     ) -> None:
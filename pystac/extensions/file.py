@@ -329,6 +329,10 @@ class FileExtensionHooks(ExtensionHooks):
         "file:unit",
     }
 
+    def needs_migration(self, obj: dict[str, Any]) -> bool:
+        # The checksum extension is only migrated for older STAC versions
+        return self._has_prev_extension_id(obj)
+
     def migrate(
         self, obj: dict[str, Any], version: STACVersionID, info: STACJSONDescription
     ) -> None:
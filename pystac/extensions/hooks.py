@@ -51,6 +51,31 @@ class ExtensionHooks(ABC):
             for uri in obj.get("stac_extensions", [])
         )
 
+    def needs_migration(self, obj: dict[str, Any]) -> bool:
+        """Returns whether :meth:`migrate` may change ``obj``, the dict of a STAC
+        object that is already at the latest STAC version.
+
+        Objects that no hooks need to migrate are read without migrating or copying
+        their dict. The base implementation checks ``obj`` for any of the
+        :attr:`prev_extension_ids`. Hooks that override :meth:`migrate` should also
+        override this method, as otherwise they are assumed to need to migrate every
+        object.
+        """
+        if type(self).migrate is not ExtensionHooks.migrate:
+            return True
+        return self._has_prev_extension_id(obj)
+
+    def _has_prev_extension_id(self, obj: dict[str, Any]) -> bool:
+        stac_extensions = obj.get("stac_extensions") or []
+        return any(prev_id in stac_extensions for prev_id in self.prev_extension_ids)
+
+    def _may_migrate(self, stac_extensions: frozenset[str]) -> bool:
+        """Whether :meth:`migrate` may change objects with the given extensions. The
+        base implementation only changes objects with previous extension IDs."""
+        if type(self).migrate is not ExtensionHooks.migrate:
+            return True
+        return not self.prev_extension_ids.isdisjoint(stac_extensions)
+
     def migrate(
         self, obj: dict[str, Any], version: STACVersionID, info: STACJSONDescription
     ) -> None:
@@ -75,8 +100,13 @@ class ExtensionHooks(ABC):
 class RegisteredExtensionHooks:
     hooks: dict[str, ExtensionHooks]
 
+    _migration_plans: dict[
+        tuple[pystac.STACObjectType, frozenset[str]], tuple[ExtensionHooks, ...]
+    ]
+
     def __init__(self, hooks: Iterable[ExtensionHooks]):
         self.hooks = {e.schema_uri: e for e in hooks}
+        self._migration_plans = {}
 
     def add_extension_hooks(self, hooks: ExtensionHooks) -> None:
         e_id = hooks.schema_uri
@@ -86,10 +116,12 @@ class RegisteredExtensionHooks:
             )
 
         self.hooks[e_id] = hooks
+        self._migration_plans.clear()
 
     def remove_extension_hooks(self, extension_id: str) -> None:
         if extension_id in self.hooks:
             del self.hooks[extension_id]
+            self._migration_plans.clear()
 
     def get_extended_object_links(self, obj: STACObject) -> list[str | pystac.RelType]:
         result: list[str | pystac.RelType] | None = None
@@ -103,9 +135,38 @@ class RegisteredExtensionHooks:
                         result.extend(ext_result)
         return result or []
 
+    def needs_migration(
+        self, obj: dict[str, Any], object_type: pystac.STACObjectType
+    ) -> bool:
+        """Returns whether any registered hooks may migrate ``obj``, the dict of a
+        STAC object of type ``object_type`` that is already at the latest STAC
+        version. See :meth:`ExtensionHooks.needs_migration`."""
+        return any(
+            hooks.needs_migration(obj)
+            for hooks in self.hooks.values()
+            if object_type in hooks._get_stac_object_types()
+        )
+
     def migrate(
         self, obj: dict[str, Any], version: STACVersionID, info: STACJSONDescription
     ) -> None:
-        for hooks in self.hooks.values():
-            if info.object_type in hooks._get_stac_object_types():
-                hooks.migrate(obj, version, info)
+        for hooks in self._get_migration_plan(
+            info.object_type, frozenset(info.extensions)
+        ):
+            hooks.migrate(obj, version, info)
+
+    def _get_migration_plan(
+        self, object_type: pystac.STACObjectType, stac_extensions: frozenset[str]
+    ) -> tuple[ExtensionHooks, ...]:
+        """Returns the hooks that may migrate objects of the given type and
+        extensions. Plans are cached until hooks are added or removed."""
+        key = (object_type, stac_extensions)
+        plan = self._migration_plans.get(key)
+        if plan is None:
+            plan = self._migration_plans[key] = tuple(
+                hooks
+                for hooks in self.hooks.values()
+                if object_type in hooks._get_stac_object_types()
+                and hooks._may_migrate(stac_extensions)
+            )
+        return plan
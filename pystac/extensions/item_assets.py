@@ -103,6 +103,12 @@ class ItemAssetsExtensionHooks(ExtensionHooks):
     prev_extension_ids = {"asset", "item-assets"}
     stac_object_types = {pystac.STACObjectType.COLLECTION}
 
+    def needs_migration(self, obj: dict[str, Any]) -> bool:
+        # The extension is removed, as item assets are part of core
+        return self._has_prev_extension_id(obj) or self.schema_uri in (
+            obj.get("stac_extensions") or []
+        )
+
     def migrate(
         self, obj: dict[str, Any], version: STACVersionID, info: STACJSONDescription
     ) -> None:
@@ -819,6 +819,10 @@ class LabelExtensionHooks(ExtensionHooks):
             return [LabelRelType.SOURCE]
         return None
 
+    def needs_migration(self, obj: dict[str, Any]) -> bool:
+        # Fields are only renamed for older STAC versions
+        return self._has_prev_extension_id(obj)
+
     def migrate(
         self, obj: dict[str, Any], version: STACVersionID, info: STACJSONDescription
     ) -> None:
@@ -470,6 +470,12 @@ class ProjectionExtensionHooks(ExtensionHooks):
     }
     stac_object_types = {pystac.STACObjectType.ITEM}
 
+    def needs_migration(self, obj: dict[str, Any]) -> bool:
+        return self.has_extension(obj) and (
+            PREFIX + "epsg" in (obj.get("properties") or {})
+            or self._has_prev_extension_id(obj)
+        )
+
     def migrate(
         self, obj: dict[str, Any], version: STACVersionID, info: STACJSONDescription
     ) -> None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Iterable
 from copy import copy, deepcopy
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
@@ -9,15 +10,19 @@ from pystac import RelType, STACError, STACObjectType
 from pystac.asset import Asset, Assets
 from pystac.catalog import Catalog
 from pystac.collection import Collection
-from pystac.errors import DeprecatedWarning, ExtensionNotImplemented
+from pystac.errors import DeprecatedWarning
 from pystac.link import Link
 from pystac.serialization import (
     identify_stac_object,
     identify_stac_object_type,
     migrate_to_latest,
+    needs_migration,
 )
-from pystac.stac_object import STACObject
+from pystac.stac_object import OptionalMediaType, STACObject
 from pystac.utils import (
+    _DATETIME_STR_UTC,
+    _intern,
+    _intern_all,
     datetime_to_str,
     is_absolute_href,
     make_absolute_href,
@@ -68,9 +73,6 @@ class Item(STACObject, Assets):
             :attr:`~pystac.Asset.owner` attribute set to the created Item.
     """
 
-    assets: dict[str, Asset]
-    """Dictionary of :class:`~pystac.Asset` objects, each with a unique key."""
-
     bbox: list[float] | None
     """Bounding Box of the asset represented by this item using either 2D or 3D
     geometries. The length of the array is 2*n where n is the number of dimensions.
@@ -99,10 +101,6 @@ class Item(STACObject, Assets):
     id: str
     """Provider identifier. Unique within the STAC."""
 
-    links: list[Link]
-    """A list of :class:`~pystac.Link` objects representing all links associated with
-    this Item."""
-
     properties: dict[str, Any]
     """A dictionary of additional metadata for the Item."""
 
@@ -111,6 +109,16 @@ class Item(STACObject, Assets):
 
     STAC_OBJECT_TYPE = STACObjectType.ITEM
 
+    # Asset and link dicts of lazily deserialized items that have not been
+    # accessed yet. Pending links follow the links in ``_links``.
+    _raw_assets: dict[str, dict[str, Any]] | None = None
+    _raw_links: list[dict[str, Any]] | None = None
+    # Self HREF changes made before the pending assets were deserialized
+    _asset_rebases: list[tuple[str, str]] = []
+    # The datetime of a lazily deserialized item and the string it was parsed from,
+    # which to_dict writes back for as long as neither has changed
+    _raw_datetime: tuple[Datetime, str] | None = None
+
     def __init__(
         self,
         id: str,
@@ -137,7 +145,7 @@ class Item(STACObject, Assets):
         else:
             self.extra_fields = extra_fields
 
-        self.assets: dict[str, Asset] = {}
+        self.assets = {}
 
         self.datetime: Datetime | None = None
         if start_datetime:
@@ -175,9 +183,49 @@ class Item(STACObject, Assets):
     def __repr__(self) -> str:
         return f"<Item id={self.id}>"
 
+    @property
+    def assets(self) -> dict[str, Asset]:
+        """Dictionary of :class:`~pystac.Asset` objects, each with a unique key."""
+        if self._raw_assets is not None:
+            raw_assets, self._raw_assets = self._raw_assets, None
+            for k, v in raw_assets.items():
+                self.add_asset(k, Asset.from_dict(v))
+            for prev_href, new_href in self._asset_rebases:
+                self._rebase_asset_hrefs(prev_href, new_href)
+            self._asset_rebases = []
+        return self._assets
+
+    @assets.setter
+    def assets(self, assets: dict[str, Asset]) -> None:
+        self._raw_assets = None
+        self._assets = assets
+
+    @property
+    def links(self) -> list[Link]:
+        """A list of :class:`~pystac.Link` objects representing all links associated
+        with this Item."""
+        if self._raw_links is not None:
+            raw_links, self._raw_links = self._raw_links, None
+            self._links.extend(Link.from_dict(d).set_owner(self) for d in raw_links)
+        return self._links
+
+    @links.setter
+    def links(self, links: list[Link]) -> None:
+        self._raw_links = None
+        self._links = links
+
     def __getstate__(self) -> dict[str, Any]:
         """Ensure that pystac does not encode too much information when pickling"""
+        links = self.links
+        _ = self.assets
         d = self.__dict__.copy()
+        # Pickles use the attribute names of earlier versions, so that they can
+        # be loaded by them
+        d.pop("_raw_assets", None)
+        d.pop("_raw_links", None)
+        d.pop("_asset_rebases", None)
+        d["assets"] = d.pop("_assets")
+        del d["_links"]
 
         d["links"] = [
             (
@@ -185,7 +233,7 @@ class Item(STACObject, Assets):
                 if link.get_href(transform_href=False)
                 else link
             )
-            for link in d["links"]
+            for link in links
         ]
 
         return d
@@ -194,9 +242,10 @@ class Item(STACObject, Assets):
         """Ensure that pystac knows how to decode the pickled object"""
         d = state.copy()
 
-        d["links"] = [
+        d["_assets"] = d.pop("assets")
+        d["_links"] = [
             Link.from_dict(link).set_owner(self) if isinstance(link, dict) else link
-            for link in d["links"]
+            for link in d.pop("links")
         ]
 
         self.__dict__ = d
@@ -223,13 +272,20 @@ class Item(STACObject, Assets):
         new_href = self.get_self_href()  # May have been made absolute.
 
         if prev_href is not None and new_href is not None:
-            # Make sure relative asset links remain valid.
-            for asset in self.assets.values():
-                asset_href = asset.href
-                if not is_absolute_href(asset_href):
-                    abs_href = make_absolute_href(asset_href, prev_href)
-                    new_relative_href = make_relative_href(abs_href, new_href)
-                    asset.href = new_relative_href
+            if self._raw_assets is not None:
+                # Applied when the assets are deserialized
+                self._asset_rebases = [*self._asset_rebases, (prev_href, new_href)]
+            else:
+                self._rebase_asset_hrefs(prev_href, new_href)
+
+    def _rebase_asset_hrefs(self, prev_href: str, new_href: str) -> None:
+        # Make sure relative asset links remain valid.
+        for asset in self.assets.values():
+            asset_href = asset.href
+            if not is_absolute_href(asset_href):
+                abs_href = make_absolute_href(asset_href, prev_href)
+                new_relative_href = make_relative_href(abs_href, new_href)
+                asset.href = new_relative_href
 
     def get_datetime(self, asset: Asset | None = None) -> Datetime | None:
         """Gets an Item or an Asset datetime.
@@ -352,14 +408,58 @@ class Item(STACObject, Assets):
     def to_dict(
         self, include_self_link: bool = True, transform_hrefs: bool = True
     ) -> dict[str, Any]:
-        links = self.links
-        if not include_self_link:
-            links = [x for x in links if x.rel != pystac.RelType.SELF]
-
-        assets = {k: v.to_dict() for k, v in self.assets.items()}
+        # The assets and links of lazily deserialized items that have not been
+        # accessed are written as they were read, if that is what Asset.to_dict and
+        # Link.to_dict would write. Like those dicts, they are shallow copies, so
+        # that changing the result does not change the item.
+        link_dicts = None
+        raw_links = self._raw_links
+        if raw_links is not None:
+            link_dicts = [
+                link.to_dict(transform_href=transform_hrefs)
+                for link in list(self._links)
+                if include_self_link or link.rel != pystac.RelType.SELF
+            ]
+            link_dicts.extend(
+                self._raw_link_to_dict(link, transform_hrefs)
+                for link in raw_links
+                if include_self_link or link.get("rel") != pystac.RelType.SELF
+            )
+            if self._raw_links is not raw_links:
+                # Resolving the root to transform an HREF deserialized the links,
+                # and may have replaced the root link
+                link_dicts = None
+        if link_dicts is None:
+            links = self.links
+            if not include_self_link:
+                links = [x for x in links if x.rel != pystac.RelType.SELF]
+            link_dicts = [
+                link.to_dict(transform_href=transform_hrefs) for link in links
+            ]
+
+        raw_assets = self._raw_assets
+        if (
+            raw_assets is not None
+            and not self._asset_rebases
+            # Asset.from_dict converts Windows paths
+            and not any("\\" in str(a.get("href")) for a in raw_assets.values())
+        ):
+            assets = {
+                k: dict(v)
+                if Asset._is_normalized_dict(v)
+                else Asset.from_dict(v).to_dict()
+                for k, v in raw_assets.items()
+            }
+        else:
+            assets = {k: v.to_dict() for k, v in self.assets.items()}
 
         if self.datetime is not None:
-            self.properties["datetime"] = datetime_to_str(self.datetime)
+            if not (
+                self._raw_datetime is not None
+                and self._raw_datetime[0] is self.datetime
+                and self._raw_datetime[1] is self.properties.get("datetime")
+            ):
+                self.properties["datetime"] = datetime_to_str(self.datetime)
         else:
             self.properties["datetime"] = None
 
@@ -371,7 +471,7 @@ class Item(STACObject, Assets):
             "geometry": self.geometry,
             "bbox": self.bbox if self.bbox is not None else [],
             "properties": self.properties,
-            "links": [link.to_dict(transform_href=transform_hrefs) for link in links],
+            "links": link_dicts,
             "assets": assets,
         }
 
@@ -387,6 +487,52 @@ class Item(STACObject, Assets):
 
         return d
 
+    def _raw_link_to_dict(
+        self, link: dict[str, Any], transform_href: bool
+    ) -> dict[str, Any]:
+        # Only self links, Windows paths and absolute HREFs, which are made relative
+        # in relative catalogs, are changed by Link.to_dict, apart from null fields
+        # and the order of the fields
+        if not Link._is_normalized_dict(link):
+            return Link.from_dict(link).set_owner(self).to_dict(transform_href)
+        href: str = link["href"]
+        if (
+            link["rel"] != pystac.RelType.SELF
+            and "\\" not in href
+            and not (
+                transform_href
+                and is_absolute_href(href)
+                and self.get_root_link() is not None
+            )
+        ):
+            return dict(link)
+        return Link.from_dict(link).set_owner(self).to_dict(transform_href)
+
+    def get_single_link(
+        self,
+        rel: str | pystac.RelType | None = None,
+        media_type: OptionalMediaType | Iterable[OptionalMediaType] = None,
+    ) -> Link | None:
+        # Avoids deserializing the pending links of a lazily deserialized item,
+        # e.g. to get its self HREF, when none of them can be the first match
+        if self._raw_links is not None and rel is not None:
+            if media_type and isinstance(media_type, (str, pystac.MediaType)):
+                media_type = [media_type]
+            match = next(
+                (
+                    link
+                    for link in self._links
+                    if link.rel == rel
+                    and (media_type is None or link.media_type in media_type)
+                ),
+                None,
+            )
+            if match is not None or all(
+                link.get("rel") != rel for link in self._raw_links
+            ):
+                return match
+        return super().get_single_link(rel, media_type)
+
     def clone(self) -> Item:
         cls = self.__class__
         clone = cls(
@@ -419,15 +565,28 @@ class Item(STACObject, Assets):
         migrate: bool = True,
         preserve_dict: bool = True,
     ) -> T:
-        from pystac.extensions.version import ItemVersionExtension
+        return cls._from_dict(d, href, root, migrate, preserve_dict)
 
-        if preserve_dict:
+    @classmethod
+    def _from_dict(
+        cls: type[T],
+        d: dict[str, Any],
+        href: str | None = None,
+        root: Catalog | None = None,
+        migrate: bool = True,
+        preserve_dict: bool = True,
+        lazy: bool = False,
+    ) -> T:
+        # With ``lazy``, the assets and links are only created from ``d`` when
+        # Item.assets or Item.links is first accessed
+        from pystac.extensions.version import DEPRECATED, ItemVersionExtension
+
+        if migrate and needs_migration(d):
+            # Migrating returns a copy
+            d = migrate_to_latest(d, identify_stac_object(d))
+        elif preserve_dict:
             d = deepcopy(d)
 
-        if migrate:
-            info = identify_stac_object(d)
-            d = migrate_to_latest(d, info)
-
         if not cls.matches_object_type(d):
             raise pystac.STACTypeError(d, cls)
 
@@ -459,32 +618,45 @@ class Item(STACObject, Assets):
             if k not in [*pass_through_fields, *parse_fields, *exclude_fields]
         }
 
+        init_fields = {k: d.get(k) for k in pass_through_fields}
+        # The extension URIs and collection ID repeat across many items
+        init_fields["stac_extensions"] = _intern_all(init_fields["stac_extensions"])
+        init_fields["collection"] = _intern(init_fields["collection"])
+
         item = cls(
-            **{k: d.get(k) for k in pass_through_fields},  # type: ignore
+            **init_fields,  # type: ignore
             datetime=datetime,
             properties=properties,
             extra_fields=extra_fields,
             href=href,
-            assets={k: Asset.from_dict(v) for k, v in assets.items()},
+            assets=None if lazy else {k: Asset.from_dict(v) for k, v in assets.items()},
         )
 
-        for link in links:
-            if href is None or link.get("rel", None) != RelType.SELF:
+        if href is not None:
+            links = [link for link in links if link.get("rel", None) != RelType.SELF]
+        if lazy:
+            item._raw_assets = assets
+            item._raw_links = links
+            # Other timestamps are written as formatted by datetime_to_str, like
+            # those of eagerly deserialized items
+            if datetime is not None and _DATETIME_STR_UTC.fullmatch(
+                properties["datetime"]
+            ):
+                item._raw_datetime = (datetime, properties["datetime"])
+        else:
+            for link in links:
                 item.add_link(Link.from_dict(link))
 
         if root:
             item.set_root(root)
 
-        try:
-            version = ItemVersionExtension.ext(item)
-            if version.deprecated:
-                warnings.warn(
-                    f"The item '{item.id}' is deprecated.",
-                    DeprecatedWarning,
-                )
+        # Checked without extending the item, which would resolve its links
+        if ItemVersionExtension.has_extension(item) and properties.get(DEPRECATED):
+            warnings.warn(
+                f"The item '{item.id}' is deprecated.",
+                DeprecatedWarning,
+            )
             # Item asset deprecation checks pending version extension support
-        except ExtensionNotImplemented:
-            pass
 
         return item
 
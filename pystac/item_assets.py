@@ -10,6 +10,7 @@ from copy import deepcopy
 from typing import TYPE_CHECKING, Any
 
 import pystac
+from pystac.utils import _intern
 
 if TYPE_CHECKING:
     from pystac.extensions.ext import ItemAssetExt
@@ -27,6 +28,8 @@ class ItemAssetDefinition:
     for use as values in the :attr:`~pystac.Collection.item_assets` dict.
     """
 
+    __slots__ = ("properties", "owner")
+
     properties: dict[str, Any]
 
     owner: pystac.Collection | None
@@ -161,7 +164,7 @@ class ItemAssetDefinition:
         if v is None:
             self.properties.pop(ASSET_TYPE_PROP, None)
         else:
-            self.properties[ASSET_TYPE_PROP] = v
+            self.properties[ASSET_TYPE_PROP] = _intern(v)
 
     @property
     def roles(self) -> list[str] | None:
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import warnings
 from collections.abc import Collection, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from html import escape
 from typing import (
+    TYPE_CHECKING,
     Any,
     TypeAlias,
     TypeVar,
@@ -13,13 +16,35 @@ import pystac
 from pystac.errors import STACTypeError
 from pystac.html.jinja_env import get_jinja_env
 from pystac.serialization.identify import identify_stac_object_type
+from pystac.stac_io import _json_options
 from pystac.utils import HREF, is_absolute_href, make_absolute_href, make_posix_style
 
+if TYPE_CHECKING:
+    import pyarrow
+
 ItemLike: TypeAlias = pystac.Item | dict[str, Any]
 
 #: Generalized version of :class:`ItemCollection`
 C = TypeVar("C", bound="ItemCollection")
 
+# Each worker process parses about this many chunks of features, so that the
+# chunks of slow workers can be picked up by the others
+_CHUNKS_PER_WORKER = 4
+# Smaller chunks do not make up for the cost of sending them to a worker process,
+# so FeatureCollections that fit in a single chunk are parsed without a pool
+_MIN_CHUNK_SIZE = 500
+
+
+def _items_from_dicts(
+    item_dicts: list[dict[str, Any]],
+) -> tuple[list[pystac.Item], list[tuple[str, type[Warning]]]]:
+    # Runs in a worker process of ItemCollection.from_dict. The dicts are the
+    # worker's own copies, and the warnings are returned to be raised by the caller.
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        items = [pystac.Item.from_dict(d, preserve_dict=False) for d in item_dicts]
+    return items, [(str(w.message), w.category) for w in caught]
+
 
 class ItemCollection(Collection[pystac.Item]):
     """Implementation of a GeoJSON FeatureCollection whose features are all STAC
@@ -168,6 +193,7 @@ class ItemCollection(Collection[pystac.Item]):
         d: dict[str, Any],
         preserve_dict: bool = True,
         root: pystac.Catalog | None = None,
+        max_workers: int | None = None,
     ) -> C:
         """Creates a :class:`ItemCollection` instance from a dictionary.
 
@@ -178,17 +204,55 @@ class ItemCollection(Collection[pystac.Item]):
                 Defaults to True, which results results in a deepcopy of the
                 parameter. Set to False when possible to avoid the performance
                 hit of a deepcopy.
+            root : Optional root catalog to set on every Item.
+            max_workers : If set, the features are parsed into Items by a pool of
+                this many worker processes, which are sent chunks of the features
+                and return the pickled Items in order. ``d`` is never modified by
+                the pool. This pays off for large FeatureCollections, with
+                many thousands of features; extension hooks that are registered at
+                runtime must also be registered in the worker processes. Smaller
+                FeatureCollections, and all of them if ``max_workers`` is 1, are
+                parsed without starting a pool.
         """
         if not cls.is_item_collection(d):
             raise STACTypeError(d, cls)
-
-        items = [
-            pystac.Item.from_dict(item, preserve_dict=preserve_dict, root=root)
-            for item in d.get("features", [])
-        ]
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be greater than 0")
+
+        features = d.get("features", [])
+        chunk_size = 0
+        if max_workers is not None:
+            chunk_size = max(
+                _MIN_CHUNK_SIZE,
+                -(-len(features) // (max_workers * _CHUNKS_PER_WORKER)),
+            )
+        parallel = (
+            max_workers is not None and max_workers > 1 and len(features) > chunk_size
+        )
+        if not parallel:
+            items = [
+                pystac.Item.from_dict(item, preserve_dict=preserve_dict, root=root)
+                for item in features
+            ]
+        else:
+            items = []
+            chunks = (
+                features[i : i + chunk_size]
+                for i in range(0, len(features), chunk_size)
+            )
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for chunk_items, caught in executor.map(_items_from_dicts, chunks):
+                    for message, category in caught:
+                        warnings.warn(message, category)
+                    items.extend(chunk_items)
+            if root:
+                for item in items:
+                    item.set_root(root)
         extra_fields = {k: v for k, v in d.items() if k not in ("features", "type")}
 
-        return cls(items=items, extra_fields=extra_fields)
+        # Items that were unpickled from the workers are not shared with anything
+        # else, so there is no need to clone them
+        return cls(items=items, extra_fields=extra_fields, clone_items=not parallel)
 
     @classmethod
     def from_file(cls: type[C], href: HREF, stac_io: pystac.StacIO | None = None) -> C:
@@ -209,10 +273,180 @@ class ItemCollection(Collection[pystac.Item]):
 
         return cls.from_dict(d, preserve_dict=False)
 
+    @classmethod
+    def iter_from_file(
+        cls, href: HREF, stac_io: pystac.StacIO | None = None
+    ) -> Iterator[pystac.Item]:
+        """Iterates over the items of a FeatureCollection JSON file without reading
+        the whole file into memory.
+
+        The ``features`` array is parsed incrementally with
+        :meth:`StacIO.iter_features <pystac.StacIO.iter_features>`, and each
+        :class:`~pystac.Item` is yielded as soon as it has been read. Use this
+        instead of :meth:`ItemCollection.from_file` for FeatureCollections that are
+        too large to hold in memory.
+
+        Arguments:
+            href : Path to the file.
+            stac_io : A :class:`~pystac.StacIO` instance to use for file I/O
+        """
+        if stac_io is None:
+            stac_io = pystac.StacIO.default()
+
+        href = make_posix_style(href)
+        if not is_absolute_href(href):
+            href = make_absolute_href(href)
+
+        for d in stac_io.iter_features(href):
+            yield pystac.Item.from_dict(d, preserve_dict=False)
+
+    @classmethod
+    def from_ndjson(
+        cls: type[C], href: HREF, stac_io: pystac.StacIO | None = None
+    ) -> C:
+        """Reads a :class:`ItemCollection` from a newline-delimited JSON file with
+        one Item per line.
+
+        Arguments:
+            href : Path to the file.
+            stac_io : A :class:`~pystac.StacIO` instance to use for file I/O
+        """
+        return cls(cls.iter_ndjson(href, stac_io=stac_io), clone_items=False)
+
+    @classmethod
+    def iter_ndjson(
+        cls, href: HREF, stac_io: pystac.StacIO | None = None
+    ) -> Iterator[pystac.Item]:
+        """Iterates over the items of a newline-delimited JSON file with one Item
+        per line, without reading the whole file into memory.
+
+        Arguments:
+            href : Path to the file.
+            stac_io : A :class:`~pystac.StacIO` instance to use for file I/O
+        """
+        if stac_io is None:
+            stac_io = pystac.StacIO.default()
+
+        href = make_posix_style(href)
+        if not is_absolute_href(href):
+            href = make_absolute_href(href)
+
+        for d in stac_io.iter_ndjson(href):
+            yield pystac.Item.from_dict(d, preserve_dict=False)
+
+    def to_ndjson(self, stac_io: pystac.StacIO | None = None) -> str:
+        """Serializes this instance to newline-delimited JSON with one Item per
+        line.
+
+        Top-level :attr:`extra_fields` are not included.
+
+        Arguments:
+            stac_io : A :class:`~pystac.StacIO` instance whose
+                :meth:`~pystac.StacIO.json_dumps` is used to serialize the items.
+                If not provided, will use the default instance.
+        """
+        if stac_io is None:
+            stac_io = pystac.StacIO.default()
+
+        return b"".join(
+            stac_io._json_dumps_line(item.to_dict(transform_hrefs=False))
+            for item in self.items
+        ).decode("utf-8")
+
+    def save_ndjson(
+        self,
+        dest_href: str,
+        stac_io: pystac.StacIO | None = None,
+        append: bool = False,
+    ) -> None:
+        """Saves the items of this instance to the ``dest_href`` location as
+        newline-delimited JSON with one Item per line.
+
+        Top-level :attr:`extra_fields` are not included.
+
+        Args:
+            dest_href : Location to which the file will be saved.
+            stac_io: Optional :class:`~pystac.StacIO` instance to use. If not provided,
+                will use the default instance.
+            append : If ``True``, add the items to the end of an existing file
+                instead of replacing it.
+        """
+        if stac_io is None:
+            stac_io = pystac.StacIO.default()
+
+        stac_io.save_ndjson(
+            dest_href,
+            (item.to_dict(transform_hrefs=False) for item in self.items),
+            append=append,
+        )
+
+    def to_arrow(self) -> pyarrow.Table:
+        """Converts this instance to a :class:`pyarrow.Table` with one row per
+        Item, and a column for each top-level Item field and each property.
+
+        See :mod:`pystac.arrow` for how Items are mapped to columns. Requires
+        ``pyarrow`` (``pip install pystac[arrow]``).
+        """
+        from pystac.arrow import to_table
+
+        return to_table(
+            (item.to_dict(transform_hrefs=False) for item in self.items),
+            self.extra_fields,
+        )
+
+    @classmethod
+    def from_arrow(cls: type[C], table: pyarrow.Table) -> C:
+        """Creates a :class:`ItemCollection` from a :class:`pyarrow.Table` with one
+        row per Item, such as one created by :meth:`ItemCollection.to_arrow`.
+
+        Requires ``pyarrow`` (``pip install pystac[arrow]``).
+
+        Arguments:
+            table : The table to read the Items from.
+        """
+        from pystac.arrow import from_table
+
+        item_dicts, extra_fields = from_table(table)
+        items = [pystac.Item.from_dict(d, preserve_dict=False) for d in item_dicts]
+        return cls(items=items, extra_fields=extra_fields, clone_items=False)
+
+    def to_parquet(self, where: Any, **kwargs: Any) -> None:
+        """Writes the table from :meth:`ItemCollection.to_arrow` to a Parquet file.
+
+        Requires ``pyarrow`` (``pip install pystac[arrow]``).
+
+        Arguments:
+            where : The path or file-like object to write to.
+            **kwargs : Additional keyword arguments to be passed to
+                :func:`pyarrow.parquet.write_table`.
+        """
+        from pystac.arrow import _import_parquet
+
+        _import_parquet().write_table(self.to_arrow(), where, **kwargs)
+
+    @classmethod
+    def from_parquet(cls: type[C], source: Any, **kwargs: Any) -> C:
+        """Reads a :class:`ItemCollection` from a Parquet file, such as one written
+        by :meth:`ItemCollection.to_parquet`.
+
+        Requires ``pyarrow`` (``pip install pystac[arrow]``).
+
+        Arguments:
+            source : The path or file-like object to read from.
+            **kwargs : Additional keyword arguments to be passed to
+                :func:`pyarrow.parquet.read_table`, e.g. ``filters`` to only read
+                matching Items.
+        """
+        from pystac.arrow import _import_parquet
+
+        return cls.from_arrow(_import_parquet().read_table(source, **kwargs))
+
     def save_object(
         self,
         dest_href: str,
         stac_io: pystac.StacIO | None = None,
+        compact: bool | None = None,
+        sort_keys: bool | None = None,
     ) -> None:
         """Saves this instance to the ``dest_href`` location.
 
@@ -220,11 +454,18 @@ class ItemCollection(Collection[pystac.Item]):
             dest_href : Location to which the file will be saved.
             stac_io: Optional :class:`~pystac.StacIO` instance to use. If not provided,
                 will use the default instance.
+            compact : If ``True``, write the JSON without indentation or whitespace.
+                Defaults to the ``compact`` attribute of the :class:`~pystac.StacIO`.
+            sort_keys : If ``True``, write the keys of JSON objects in sorted order.
+                Defaults to the ``sort_keys`` attribute of the
+                :class:`~pystac.StacIO`.
         """
         if stac_io is None:
             stac_io = pystac.StacIO.default()
 
-        stac_io.save_json(dest_href, self.to_dict())
+        stac_io.save_json(
+            dest_href, self.to_dict(), **_json_options(compact, sort_keys)
+        )
 
     @staticmethod
     def is_item_collection(d: dict[str, Any]) -> bool:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import Executor, Future
 from copy import copy
 from html import escape
 from typing import TYPE_CHECKING, Any, TypeVar
@@ -12,6 +13,7 @@ from pystac.utils import (
     HREF as HREF,
 )
 from pystac.utils import (
+    _intern,
     is_absolute_href,
     make_absolute_href,
     make_posix_style,
@@ -23,12 +25,15 @@ if TYPE_CHECKING:
     from pystac.collection import Collection
     from pystac.extensions.ext import LinkExt
     from pystac.item import Item
+    from pystac.stac_io import AsyncStacIO
     from pystac.stac_object import STACObject
 
     PathLike = os.PathLike[str]
 
 else:
-    PathLike = os.PathLike
+    # os.PathLike has no __slots__, so deriving from it would give every Link a
+    # __dict__. Links are still os.PathLike instances through its __subclasshook__.
+    PathLike = object
 
 #: Generalized version of :class:`Link`
 L = TypeVar("L", bound="Link")
@@ -72,6 +77,16 @@ class Link(PathLike):
             object JSON.
     """
 
+    __slots__ = (
+        "rel",
+        "media_type",
+        "owner",
+        "_extra_fields",
+        "_target_href",
+        "_target_object",
+        "_title",
+    )
+
     rel: str | pystac.RelType
     """The relation of the link (e.g. 'child', 'item'). Registered rel Types are
     preferred. See :class:`~pystac.RelType` for common media types."""
@@ -80,15 +95,12 @@ class Link(PathLike):
     """Optional description of the media type. Registered Media Types are preferred.
     See :class:`~pystac.MediaType` for common media types."""
 
-    extra_fields: dict[str, Any]
-    """Optional, additional fields for this link. This is used by extensions as a
-    way to serialize and deserialize properties on link object JSON."""
-
     owner: STACObject | None
     """The owner of this link. The link will use its owner's root catalog
     :class:`~pystac.cache.ResolvedObjectCache` to resolve objects, and
     will create absolute HREFs from relative HREFs against the owner's self HREF."""
 
+    _extra_fields: dict[str, Any] | None
     _target_href: str | None
     _target_object: STACObject | None
     _title: str | None
@@ -101,7 +113,7 @@ class Link(PathLike):
         title: str | None = None,
         extra_fields: dict[str, Any] | None = None,
     ) -> None:
-        self.rel = rel
+        self.rel = _intern(rel)
         if isinstance(target, str):
             if rel == pystac.RelType.SELF:
                 self._target_href = make_absolute_href(target)
@@ -111,9 +123,10 @@ class Link(PathLike):
         else:
             self._target_href = None
             self._target_object = target
-        self.media_type = media_type
+        self.media_type = _intern(media_type)
         self.title = title
-        self.extra_fields = extra_fields or {}
+        # Most links have no extra fields, so the dict is only created when needed
+        self._extra_fields = extra_fields or None
         self.owner = None
 
     def set_owner(self, owner: STACObject | None) -> Link:
@@ -125,6 +138,18 @@ class Link(PathLike):
         self.owner = owner
         return self
 
+    @property
+    def extra_fields(self) -> dict[str, Any]:
+        """Optional, additional fields for this link. This is used by extensions as a
+        way to serialize and deserialize properties on link object JSON."""
+        if self._extra_fields is None:
+            self._extra_fields = {}
+        return self._extra_fields
+
+    @extra_fields.setter
+    def extra_fields(self, v: dict[str, Any]) -> None:
+        self._extra_fields = v
+
     @property
     def title(self) -> str | None:
         """Optional title for this link. If not provided during instantiation, this will
@@ -175,21 +200,16 @@ class Link(PathLike):
         else:
             href = self._target_href
 
-        if (
-            transform_href
-            and href
-            and is_absolute_href(href)
-            and self.owner
-            and self.owner.get_root()
-        ):
+        if transform_href and href and is_absolute_href(href) and self.owner:
             root = self.owner.get_root()
-            rel_links = [
-                *HIERARCHICAL_LINKS,
-                *pystac.EXTENSION_HOOKS.get_extended_object_links(self.owner),
-            ]
             # if a hierarchical link with an owner and root, and relative catalog
             if root and root.is_relative():
-                if self.rel in rel_links or root.target_in_hierarchy(self.target):
+                if (
+                    self.rel in HIERARCHICAL_LINKS
+                    or self.rel
+                    in pystac.EXTENSION_HOOKS.get_extended_object_links(self.owner)
+                    or root.target_in_hierarchy(self.target)
+                ):
                     owner_href = self.owner.get_self_href()
                     if owner_href is not None:
                         href = make_relative_href(href, owner_href)
@@ -291,57 +311,187 @@ class Link(PathLike):
         if self._target_object:
             pass
         elif self._target_href:
-            target_href = self._target_href
-
-            # If it's a relative link, base it off the parent.
-            if not is_absolute_href(target_href):
-                if self.owner is None:
-                    raise pystac.STACError(
-                        "Relative path {} encountered "
-                        "without owner or start_href.".format(target_href)
-                    )
-                start_href = self.owner.get_self_href()
+            target_href = self._get_absolute_target_href()
+            obj = None
+            if root is not None:
+                obj = root._resolved_objects.get_by_href(target_href)
 
-                if start_href is None:
-                    raise pystac.STACError(
-                        "Relative path {} encountered "
-                        'without owner "self" link set.'.format(target_href)
-                    )
+            if obj is None:
+                stac_io = self._get_stac_io(root)
+                try:
+                    obj = stac_io.read_stac_object(target_href, root=root)
+                except Exception as e:
+                    raise STACError(
+                        f"HREF: '{target_href}' does not resolve to a STAC object"
+                    ) from e
+                obj = self._cache_resolved_object(obj, target_href, root)
+            self._target_object = obj
+        else:
+            raise ValueError("Cannot resolve STAC object without a target")
 
-                target_href = make_absolute_href(target_href, start_href)
-            obj = None
+        self._set_target_parent()
+
+        return self
 
-            stac_io: pystac.StacIO | None = None
+    async def resolve_stac_object_async(
+        self,
+        root: Catalog | None = None,
+        stac_io: AsyncStacIO | None = None,
+    ) -> Link:
+        """Asynchronously resolves a STAC object from the HREF of this link, if the
+        link is not already resolved.
 
+        This is the asynchronous counterpart of :meth:`Link.resolve_stac_object`,
+        and is used by :meth:`Catalog.walk_async <pystac.Catalog.walk_async>` and
+        :meth:`Catalog.get_items_async <pystac.Catalog.get_items_async>` to resolve
+        many links concurrently.
+
+        Args:
+            root : Optional root of the catalog for this link.
+                If provided, the root's resolved object cache is used to search for
+                previously resolved instances of the STAC object.
+            stac_io : Optional :class:`~pystac.stac_io.AsyncStacIO` to read the
+                object with. If not provided, a
+                :class:`~pystac.stac_io.DefaultAsyncStacIO` wrapping the
+                :class:`~pystac.StacIO` that :meth:`Link.resolve_stac_object` would
+                use is created.
+        """
+        if self._target_object:
+            pass
+        elif self._target_href:
+            target_href = self._get_absolute_target_href()
+            obj = None
             if root is not None:
                 obj = root._resolved_objects.get_by_href(target_href)
-                stac_io = root._stac_io
 
             if obj is None:
                 if stac_io is None:
-                    if self.owner is not None:
-                        if isinstance(self.owner, pystac.Catalog):
-                            stac_io = self.owner._stac_io
-                        elif self.rel != pystac.RelType.ROOT:
-                            owner_root = self.owner.get_root()
-                            if owner_root is not None:
-                                stac_io = owner_root._stac_io
-                    if stac_io is None:
-                        stac_io = pystac.StacIO.default()
+                    stac_io = pystac.stac_io.DefaultAsyncStacIO(self._get_stac_io(root))
                 try:
-                    obj = stac_io.read_stac_object(target_href, root=root)
+                    obj = await stac_io.read_stac_object(target_href, root=root)
                 except Exception as e:
                     raise STACError(
                         f"HREF: '{target_href}' does not resolve to a STAC object"
                     ) from e
-                obj.set_self_href(target_href)
-                if root is not None:
-                    obj = root._resolved_objects.get_or_cache(obj)
-                    obj.set_root(root)
-            self._target_object = obj
+                obj = self._cache_resolved_object(obj, target_href, root)
+            # Another task may have resolved this link while we were reading.
+            if self._target_object is None:
+                self._target_object = obj
         else:
             raise ValueError("Cannot resolve STAC object without a target")
 
+        self._set_target_parent()
+
+        return self
+
+    def _submit_read(
+        self, executor: Executor, root: Catalog | None
+    ) -> Future[dict[str, Any]] | None:
+        """Starts reading the target of this link in ``executor``.
+
+        Returns ``None`` if resolving this link does not need a read, if the read
+        would fail before any I/O, or if ``executor`` has been shut down;
+        :meth:`resolve_stac_object` then handles it.
+        """
+        if self._target_object or not self._target_href:
+            return None
+        try:
+            target_href = self._get_absolute_target_href()
+        except STACError:
+            return None
+        if root is not None and root._resolved_objects.get_by_href(target_href):
+            return None
+        # Only the JSON is read in the executor. It is deserialized with the root,
+        # as read_stac_object does, on the calling thread in
+        # _resolve_stac_object_from_future, so that the worker threads never touch
+        # the root's resolved object cache.
+        try:
+            return executor.submit(self._get_stac_io(root).read_json, target_href)
+        except RuntimeError:
+            # The iterables yielded by Catalog.walk may be consumed after the walk
+            # has ended and shut down its executor
+            return None
+
+    def _resolve_stac_object_from_future(
+        self, future: Future[dict[str, Any]], root: Catalog | None
+    ) -> Link:
+        if future.cancelled():
+            # Reads that were read ahead but had not started are cancelled when
+            # the executor is shut down
+            return self.resolve_stac_object(root)
+        if self._target_object is None:
+            target_href = self._get_absolute_target_href()
+            obj = None
+            if root is not None:
+                obj = root._resolved_objects.get_by_href(target_href)
+
+            if obj is None:
+                try:
+                    obj = self._get_stac_io(root).stac_object_from_dict(
+                        future.result(),
+                        href=target_href,
+                        root=root,
+                        preserve_dict=False,
+                    )
+                except Exception as e:
+                    raise STACError(
+                        f"HREF: '{target_href}' does not resolve to a STAC object"
+                    ) from e
+                obj = self._cache_resolved_object(obj, target_href, root)
+            self._target_object = obj
+
+        self._set_target_parent()
+
+        return self
+
+    def _get_absolute_target_href(self) -> str:
+        assert self._target_href is not None
+        target_href = self._target_href
+
+        # If it's a relative link, base it off the parent.
+        if not is_absolute_href(target_href):
+            if self.owner is None:
+                raise pystac.STACError(
+                    "Relative path {} encountered "
+                    "without owner or start_href.".format(target_href)
+                )
+            start_href = self.owner.get_self_href()
+
+            if start_href is None:
+                raise pystac.STACError(
+                    "Relative path {} encountered "
+                    'without owner "self" link set.'.format(target_href)
+                )
+
+            target_href = make_absolute_href(target_href, start_href)
+        return target_href
+
+    def _get_stac_io(self, root: Catalog | None) -> pystac.StacIO:
+        stac_io: pystac.StacIO | None = None
+        if root is not None:
+            stac_io = root._stac_io
+        if stac_io is None:
+            if self.owner is not None:
+                if isinstance(self.owner, pystac.Catalog):
+                    stac_io = self.owner._stac_io
+                elif self.rel != pystac.RelType.ROOT:
+                    owner_root = self.owner.get_root()
+                    if owner_root is not None:
+                        stac_io = owner_root._stac_io
+            if stac_io is None:
+                stac_io = pystac.StacIO.default()
+        return stac_io
+
+    def _cache_resolved_object(
+        self, obj: STACObject, target_href: str, root: Catalog | None
+    ) -> STACObject:
+        obj.set_self_href(target_href)
+        if root is not None:
+            obj = root._resolved_objects.get_or_cache(obj)
+            obj.set_root(root)
+        return obj
+
+    def _set_target_parent(self) -> None:
         if (
             self.owner
             and self.rel in [pystac.RelType.CHILD, pystac.RelType.ITEM]
@@ -353,8 +503,6 @@ class Link(PathLike):
             if self._target_object._allow_parent_to_override_href:
                 self._target_object.set_parent(self.owner)
 
-        return self
-
     def is_resolved(self) -> bool:
         """Determines if the link's target is a resolved STACObject.
 
@@ -399,11 +547,25 @@ class Link(PathLike):
         if self.title is not None:
             d["title"] = self.title
 
-        for k, v in self.extra_fields.items():
-            d[k] = v
+        if self._extra_fields:
+            d.update(self._extra_fields)
 
         return d
 
+    @staticmethod
+    def _is_normalized_dict(d: dict[str, Any]) -> bool:
+        # Whether ``d`` is what ``Link.from_dict(d).to_dict()`` returns, apart from
+        # transformed HREFs: the fields of to_dict without nulls, in its order,
+        # followed by the extra fields
+        keys = list(d)
+        n = 0
+        for key in ("rel", "href", "type", "title"):
+            if key in d:
+                if keys[n] != key or not isinstance(d[key], str):
+                    return False
+                n += 1
+        return keys[:2] == ["rel", "href"] and all(keys[n:])
+
     def clone(self) -> Link:
         """Clones this link.
 
@@ -1,6 +1,7 @@
 __all__ = [
     "merge_common_properties",
     "migrate_to_latest",
+    "needs_migration",
     "STACVersionRange",
     "identify_stac_object",
     "identify_stac_object_type",
@@ -11,4 +12,4 @@ from pystac.serialization.identify import (
     identify_stac_object,
     identify_stac_object_type,
 )
-from pystac.serialization.migrate import migrate_to_latest
+from pystac.serialization.migrate import migrate_to_latest, needs_migration
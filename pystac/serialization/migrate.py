@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import pystac
 from pystac.serialization.identify import (
     OldExtensionShortIDs,
     STACJSONDescription,
     STACVersionID,
+    identify_stac_object_type,
 )
 from pystac.version import STACVersion
 
@@ -78,21 +81,27 @@ def _migrate_datetime_range(
     return None
 
 
+@lru_cache(maxsize=None)
 def _get_object_migrations() -> (
-    dict[str, Callable[[dict[str, Any], STACVersionID, STACJSONDescription], None]]
+    Mapping[str, Callable[[dict[str, Any], STACVersionID, STACJSONDescription], None]]
 ):
-    return {
+    # Read-only, as the cached mapping is shared by all callers
+    migrations: dict[
+        str, Callable[[dict[str, Any], STACVersionID, STACJSONDescription], None]
+    ] = {
         pystac.STACObjectType.CATALOG: _migrate_catalog,
         pystac.STACObjectType.COLLECTION: _migrate_collection,
         pystac.STACObjectType.ITEM: _migrate_item,
     }
+    return MappingProxyType(migrations)
 
 
+@lru_cache(maxsize=None)
 def _get_removed_extension_migrations() -> (
-    dict[
+    Mapping[
         str,
         tuple[
-            list[STACObjectType] | None,
+            tuple[STACObjectType, ...] | None,
             None
             | (
                 Callable[
@@ -109,12 +118,12 @@ def _get_removed_extension_migrations() -> (
     by other extensions; for instance the FileExtensions handles the migration of
     the since replaced 'checksum' extension.
 
-    Dict of the extension ID to a tuple of optional list of STACObjectType which it was
-    removed for (or None if removed from all), and an optional migrate function
-    that can modify the object in case the extension was removed but the properties
-    were moved.
+    Read-only mapping of the extension ID to a tuple of optional tuple of
+    STACObjectType which it was removed for (or None if removed from all), and an
+    optional migrate function that can modify the object in case the extension was
+    removed but the properties were moved.
     """
-    return {
+    migrations = {
         # -- Removed in 1.0
         # assets in collections became a core property
         OldExtensionShortIDs.COLLECTION_ASSETS.value: (None, None),
@@ -123,24 +132,24 @@ def _get_removed_extension_migrations() -> (
         # property merging has went away these extensions are removed
         # from the collection. Note that a migrated Collection may still
         # have a "properties" in extra_fields with the extension fields.
-        OldExtensionShortIDs.EO.value: ([pystac.STACObjectType.COLLECTION], None),
-        OldExtensionShortIDs.FILE.value: ([pystac.STACObjectType.COLLECTION], None),
-        OldExtensionShortIDs.LABEL.value: ([pystac.STACObjectType.COLLECTION], None),
+        OldExtensionShortIDs.EO.value: ((pystac.STACObjectType.COLLECTION,), None),
+        OldExtensionShortIDs.FILE.value: ((pystac.STACObjectType.COLLECTION,), None),
+        OldExtensionShortIDs.LABEL.value: ((pystac.STACObjectType.COLLECTION,), None),
         OldExtensionShortIDs.POINTCLOUD.value: (
-            [pystac.STACObjectType.COLLECTION],
+            (pystac.STACObjectType.COLLECTION,),
             None,
         ),
         OldExtensionShortIDs.PROJECTION.value: (
-            [pystac.STACObjectType.COLLECTION],
+            (pystac.STACObjectType.COLLECTION,),
             None,
         ),
-        OldExtensionShortIDs.SAR.value: ([pystac.STACObjectType.COLLECTION], None),
-        OldExtensionShortIDs.SAT.value: ([pystac.STACObjectType.COLLECTION], None),
+        OldExtensionShortIDs.SAR.value: ((pystac.STACObjectType.COLLECTION,), None),
+        OldExtensionShortIDs.SAT.value: ((pystac.STACObjectType.COLLECTION,), None),
         OldExtensionShortIDs.TIMESTAMPS.value: (
-            [pystac.STACObjectType.COLLECTION],
+            (pystac.STACObjectType.COLLECTION,),
             None,
         ),
-        OldExtensionShortIDs.VIEW.value: ([pystac.STACObjectType.COLLECTION], None),
+        OldExtensionShortIDs.VIEW.value: ((pystac.STACObjectType.COLLECTION,), None),
         # tiled-assets was never a fully published extension;
         # remove reference to the pre-1.0 RC short ID
         OldExtensionShortIDs.TILED_ASSETS.value: (None, None),
@@ -152,6 +161,75 @@ def _get_removed_extension_migrations() -> (
         "datetime-range": (None, _migrate_datetime_range),
         "commons": (None, None),
     }
+    return MappingProxyType(migrations)
+
+
+class _MigrationPlan(NamedTuple):
+    object_migration: (
+        Callable[[dict[str, Any], STACVersionID, STACJSONDescription], None] | None
+    )
+    """The migration of the core object fields, or None if the object is already at
+    the latest version."""
+
+    removed_extensions: Mapping[
+        str,
+        Callable[[dict[str, Any], STACVersionID, STACJSONDescription], set[str] | None]
+        | None,
+    ]
+    """The removed extensions of the object, mapped to their optional migration
+    functions."""
+
+
+@lru_cache(maxsize=None)
+def _get_migration_plan(
+    object_type: STACObjectType, stac_version: str, stac_extensions: frozenset[str]
+) -> _MigrationPlan:
+    """Returns the migrations that apply to objects of the given type, version and
+    extensions, so that they are only looked up once for all the objects of a
+    catalog."""
+    object_migration = None
+    if stac_version != STACVersion.DEFAULT_STAC_VERSION:
+        object_migration = _get_object_migrations()[object_type]
+
+    removed_extensions = {}
+    for ext, (
+        object_types,
+        migration_fn,
+    ) in _get_removed_extension_migrations().items():
+        if ext in stac_extensions and (
+            object_types is None or object_type in object_types
+        ):
+            removed_extensions[ext] = migration_fn
+
+    # Plans are shared by all the objects they apply to
+    return _MigrationPlan(object_migration, MappingProxyType(removed_extensions))
+
+
+def needs_migration(json_dict: dict[str, Any]) -> bool:
+    """Returns whether :func:`migrate_to_latest` may change the given STAC JSON.
+
+    This is ``False`` for objects that are already at the latest STAC version and
+    that no removed extension migrations or registered extension hooks apply to.
+    Such objects can be read without migrating or copying their dict.
+
+    Args:
+        json_dict : The dict of STAC JSON to check.
+
+    Returns:
+        bool: ``False`` if migrating would return an equal dict, otherwise ``True``.
+    """
+    if json_dict.get("stac_version") != STACVersion.DEFAULT_STAC_VERSION:
+        return True
+    stac_extensions = json_dict.get("stac_extensions")
+    if not isinstance(stac_extensions, list):
+        return True
+    object_type = identify_stac_object_type(json_dict)
+    if object_type is None:
+        return True
+    removed_extension_migrations = _get_removed_extension_migrations()
+    if any(ext in removed_extension_migrations for ext in stac_extensions):
+        return True
+    return pystac.EXTENSION_HOOKS.needs_migration(json_dict, object_type)
 
 
 def migrate_to_latest(
@@ -172,21 +250,22 @@ def migrate_to_latest(
     result = deepcopy(json_dict)
     version = info.version_range.latest_valid_version()
 
-    object_migrations = _get_object_migrations()
-    removed_extension_migrations = _get_removed_extension_migrations()
+    plan = _get_migration_plan(
+        info.object_type, str(version), frozenset(info.extensions)
+    )
 
-    if version != STACVersion.DEFAULT_STAC_VERSION:
-        object_migrations[info.object_type](result, version, info)
+    if plan.object_migration is not None:
+        plan.object_migration(result, version, info)
         result["stac_version"] = STACVersion.DEFAULT_STAC_VERSION
 
     # Ensure stac_extensions property for consistency
     result["stac_extensions"] = result.get("stac_extensions", None) or []
 
     pystac.EXTENSION_HOOKS.migrate(result, version, info)
-    for ext in result["stac_extensions"][:]:
-        if ext in removed_extension_migrations:
-            object_types, migration_fn = removed_extension_migrations[ext]
-            if object_types is None or info.object_type in object_types:
+    if plan.removed_extensions:
+        for ext in result["stac_extensions"][:]:
+            if ext in plan.removed_extensions:
+                migration_fn = plan.removed_extensions[ext]
                 if migration_fn:
                     migration_fn(result, version, info)
                 result["stac_extensions"].remove(ext)
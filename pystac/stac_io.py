@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import asyncio
+import codecs
+import hashlib
 import json
 import logging
 import os
+import sqlite3
+import tempfile
+import threading
+import time
+import warnings
+import zipfile
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, cast
 from urllib.error import HTTPError
 from urllib.request import Request, urlopen
 
@@ -15,8 +29,16 @@ from pystac.serialization import (
     identify_stac_object_type,
     merge_common_properties,
     migrate_to_latest,
+    needs_migration,
+)
+from pystac.utils import (
+    HREF,
+    _intern_keys,
+    _is_url,
+    make_absolute_href,
+    make_posix_style,
+    safe_urlparse,
 )
-from pystac.utils import HREF, _is_url, safe_urlparse
 
 # Use orjson if available
 try:
@@ -40,11 +62,173 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _defining_class(cls: type, name: str) -> type | None:
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return klass
+    return None
+
+
+@lru_cache(maxsize=None)
+def _prefers_bytes(cls: type, bytes_method: str, *text_methods: str) -> bool:
+    # A bytes hook is only used in place of its text counterparts if it is defined
+    # at least as far down the class hierarchy as all of them. Otherwise a subclass
+    # that only overrides e.g. ``read_text`` would silently be bypassed.
+    bytes_class = _defining_class(cls, bytes_method)
+    if bytes_class is None:
+        return False
+    for text_method in text_methods:
+        text_class = _defining_class(cls, text_method)
+        if text_class is not None and not issubclass(bytes_class, text_class):
+            return False
+    return True
+
+
+def _json_options(compact: bool | None, sort_keys: bool | None) -> dict[str, bool]:
+    # Only forwards the serialization options that were explicitly set, so that
+    # json_dumps implementations that predate them keep working.
+    options = {}
+    if compact is not None:
+        options["compact"] = compact
+    if sort_keys is not None:
+        options["sort_keys"] = sort_keys
+    return options
+
+
+_CHUNK_SIZE = 1024 * 1024
+_WHITESPACE = " \t\n\r"
+
+
+class _JsonStream:
+    # Incrementally decodes JSON values from an iterable of UTF-8 chunks. Each value
+    # is decoded with the C-accelerated json scanner once enough of the stream has
+    # been buffered to contain it, so only one value is held in memory at a time.
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def _read_more(self) -> bool:
+        if self.exhausted:
+            return False
+        if self.pos:
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        target = max(len(self.buffer), 1)
+        read = 0
+        # Read at least as much as is already buffered, so that a single value
+        # spanning many chunks is not re-scanned once per chunk.
+        while read < target:
+            try:
+                chunk = next(self.chunks)
+            except StopIteration:
+                self.buffer += self.decoder.decode(b"", final=True)
+                self.exhausted = True
+                return read > 0
+            text = self.decoder.decode(chunk)
+            self.buffer += text
+            read += len(chunk)
+        return True
+
+    def peek(self) -> str:
+        """Skips whitespace and returns the next character, or "" at the end."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read_more():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if char == "" or char not in chars:
+            raise json.JSONDecodeError(
+                f"Expected one of {chars!r}", self.buffer, self.pos
+            )
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._read_more():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and not self.exhausted:
+                self._read_more()
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    # Yields the elements of the array at ``key`` of a top-level JSON object
+    stream = _JsonStream(chunks)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        name = stream.value()
+        stream.expect(":")
+        if name == key and stream.peek() == "[":
+            stream.expect("[")
+            if stream.peek() == "]":
+                stream.expect("]")
+            else:
+                while True:
+                    yield stream.value()
+                    if stream.expect(",]") == "]":
+                        break
+        else:
+            stream.value()
+        if stream.expect(",}") == "}":
+            return
+
+
 class StacIO(ABC):
     _default_io: Callable[[], StacIO] | None = None
 
-    def __init__(self, headers: dict[str, str] | None = None):
+    compact: bool = False
+    """If ``True``, JSON is written without indentation or whitespace between
+    separators, which makes it smaller and faster to write and parse."""
+
+    sort_keys: bool = False
+    """If ``True``, the keys of JSON objects are written in sorted order."""
+
+    lazy_items: bool = False
+    """If ``True``, the assets and links of items read with this StacIO, including
+    items read while traversing a catalog, are only deserialized when
+    :attr:`Item.assets <pystac.Item.assets>` or :attr:`Item.links
+    <pystac.Item.links>` is first accessed. See :meth:`stac_object_from_dict`."""
+
+    intern_keys: bool = False
+    """If ``True``, the keys of every dict in the JSON of objects read with this
+    StacIO, such as property, asset and extra field keys, are interned, so that
+    objects that repeat the same keys share a single copy of each. Link rels, media
+    types, roles and extension URIs are always interned."""
+
+    def __init__(
+        self,
+        headers: dict[str, str] | None = None,
+        compact: bool = False,
+        sort_keys: bool = False,
+        lazy_items: bool = False,
+        intern_keys: bool = False,
+    ):
         self.headers = headers or {}
+        self.compact = compact
+        self.sort_keys = sort_keys
+        self.lazy_items = lazy_items
+        self.intern_keys = intern_keys
 
     @abstractmethod
     def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
@@ -91,9 +275,155 @@ class StacIO(ABC):
         """
         raise NotImplementedError
 
-    def json_loads(self, txt: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+    def read_bytes(self, source: HREF, *args: Any, **kwargs: Any) -> bytes:
+        """Read the raw bytes at the given URI.
+
+        :meth:`StacIO.read_json` uses this method instead of
+        :meth:`StacIO.read_text` when it is overridden at least as far down the
+        class hierarchy as :meth:`StacIO.read_text` and :meth:`StacIO.json_loads`,
+        so that the JSON parser is handed the bytes directly without decoding them
+        into an intermediate string. The default implementation encodes the result
+        of :meth:`StacIO.read_text` as UTF-8.
+
+        Args:
+            source : The source to read from.
+            *args : Arbitrary positional arguments that may be utilized by the concrete
+                implementation.
+            **kwargs : Arbitrary keyword arguments that may be utilized by the concrete
+                implementation.
+
+        Returns:
+            bytes: The contents of the file at the location specified by the uri.
+        """
+        return self.read_text(source, *args, **kwargs).encode("utf-8")
+
+    def write_bytes(
+        self,
+        dest: HREF,
+        data: bytes,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Write the given UTF-8 encoded bytes to a file at the given URI.
+
+        :meth:`StacIO.save_json` uses this method instead of
+        :meth:`StacIO.write_text` when it is overridden at least as far down the
+        class hierarchy as :meth:`StacIO.write_text` and :meth:`StacIO.json_dumps`.
+        The default implementation decodes ``data`` and passes it to
+        :meth:`StacIO.write_text`.
+
+        Args:
+            dest : The destination to write to.
+            data : The bytes to write.
+        """
+        self.write_text(dest, data.decode("utf-8"), *args, **kwargs)
+
+    def read_chunks(self, source: HREF, *args: Any, **kwargs: Any) -> Iterator[bytes]:
+        """Read the raw bytes at the given URI as an iterator of chunks.
+
+        This is used by :meth:`StacIO.iter_features` to stream large files without
+        reading them into memory all at once. The default implementation yields the
+        result of :meth:`StacIO.read_bytes` as a single chunk.
+
+        Args:
+            source : The source to read from.
+            *args : Arbitrary positional arguments that may be utilized by the concrete
+                implementation.
+            **kwargs : Arbitrary keyword arguments that may be utilized by the concrete
+                implementation.
+
+        Returns:
+            Iterator[bytes]: The contents of the file at the location specified by the
+            uri.
+        """
+        yield self.read_bytes(source, *args, **kwargs)
+
+    def write_chunks(
+        self,
+        dest: HREF,
+        chunks: Iterable[bytes],
+        *args: Any,
+        append: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Write an iterable of byte chunks to a file at the given URI.
+
+        This is used by :meth:`StacIO.save_ndjson` to write many items without
+        joining them in memory first. The default implementation joins the chunks
+        and passes them to :meth:`StacIO.write_bytes`, and does not support
+        appending.
+
+        Args:
+            dest : The destination to write to.
+            chunks : The bytes to write.
+            append : If ``True``, add the chunks to the end of an existing file
+                instead of replacing it.
+
+        Raises:
+            NotImplementedError : If ``append`` is ``True`` and this
+                implementation cannot append to files.
+        """
+        if append:
+            raise NotImplementedError(
+                f"{type(self).__name__} does not support appending to files"
+            )
+        self.write_bytes(dest, b"".join(chunks), *args, **kwargs)
+
+    def iter_features(
+        self, source: HREF, *args: Any, **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        """Incrementally reads the ``features`` of a GeoJSON FeatureCollection.
+
+        The file is read with :meth:`StacIO.read_chunks` and each feature is
+        decoded as soon as it has been read, so only one feature is held in memory
+        at a time (given an implementation of :meth:`StacIO.read_chunks` that
+        streams). Other top-level fields are parsed and discarded.
+
+        Args:
+            source : The source from which to read.
+            *args : Additional positional arguments to be passed to
+                :meth:`StacIO.read_chunks`.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`StacIO.read_chunks`.
+
+        Returns:
+            Iterator[dict]: The dictionaries of the features, in order.
+        """
+        yield from _iter_json_array(
+            self.read_chunks(source, *args, **kwargs), "features"
+        )
+
+    def iter_ndjson(
+        self, source: HREF, *args: Any, **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        """Incrementally reads a newline-delimited JSON file.
+
+        The file is read with :meth:`StacIO.read_chunks` and each non-empty line is
+        deserialized with :meth:`StacIO.json_loads` as soon as it has been read.
+
+        Args:
+            source : The source from which to read.
+            *args : Additional positional arguments to be passed to
+                :meth:`StacIO.read_chunks`.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`StacIO.read_chunks`.
+
+        Returns:
+            Iterator[dict]: The dictionaries on each line, in order.
+        """
+        rest = b""
+        for chunk in self.read_chunks(source, *args, **kwargs):
+            lines = (rest + chunk).split(b"\n")
+            rest = lines.pop()
+            for line in lines:
+                if line.strip():
+                    yield self._json_loads_bytes(line)
+        if rest.strip():
+            yield self._json_loads_bytes(rest)
+
+    def json_loads(self, txt: str | bytes, *args: Any, **kwargs: Any) -> dict[str, Any]:
         """Method used internally by :class:`StacIO` instances to deserialize a
-        dictionary from a JSON string.
+        dictionary from a JSON string or UTF-8 encoded bytes.
 
         This method may be overwritten in :class:`StacIO` sub-classes to provide custom
         deserialization logic. The method accepts arbitrary keyword arguments. These are
@@ -102,7 +432,7 @@ class StacIO(ABC):
 
         Args:
 
-            txt : The JSON string to deserialize to a dictionary.
+            txt : The JSON string or bytes to deserialize to a dictionary.
         """
         result: dict[str, Any]
         if orjson is not None:
@@ -111,7 +441,14 @@ class StacIO(ABC):
             result = json.loads(txt, *args, **kwargs)
         return result
 
-    def json_dumps(self, json_dict: dict[str, Any], *args: Any, **kwargs: Any) -> str:
+    def json_dumps(
+        self,
+        json_dict: dict[str, Any],
+        *args: Any,
+        compact: bool | None = None,
+        sort_keys: bool | None = None,
+        **kwargs: Any,
+    ) -> str:
         """Method used internally by :class:`StacIO` instances to serialize a dictionary
         to a JSON string.
 
@@ -123,13 +460,70 @@ class StacIO(ABC):
         Args:
 
             json_dict : The dictionary to serialize
+            compact : If ``True``, write the JSON without indentation or whitespace.
+                Defaults to :attr:`StacIO.compact`.
+            sort_keys : If ``True``, write the keys of JSON objects in sorted
+                order. Defaults to :attr:`StacIO.sort_keys`.
         """
         if orjson is not None:
-            return orjson.dumps(json_dict, option=orjson.OPT_INDENT_2, **kwargs).decode(
-                "utf-8"
+            return self._json_dumps_bytes(
+                json_dict, *args, compact=compact, sort_keys=sort_keys, **kwargs
+            ).decode("utf-8")
+        else:
+            return json.dumps(
+                json_dict,
+                *args,
+                **self._json_dumps_options(compact, sort_keys),
+                **kwargs,
             )
+
+    def _json_dumps_bytes(
+        self,
+        json_dict: dict[str, Any],
+        *args: Any,
+        compact: bool | None = None,
+        sort_keys: bool | None = None,
+        **kwargs: Any,
+    ) -> bytes:
+        if orjson is not None:
+            if compact is None:
+                compact = self.compact
+            if sort_keys is None:
+                sort_keys = self.sort_keys
+            option = 0 if compact else orjson.OPT_INDENT_2
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(json_dict, option=option, **kwargs)
+        else:
+            return json.dumps(
+                json_dict,
+                *args,
+                **self._json_dumps_options(compact, sort_keys),
+                **kwargs,
+            ).encode("utf-8")
+
+    def _json_dumps_options(
+        self, compact: bool | None, sort_keys: bool | None
+    ) -> dict[str, Any]:
+        if compact is None:
+            compact = self.compact
+        if sort_keys is None:
+            sort_keys = self.sort_keys
+        if compact:
+            return {"indent": None, "separators": (",", ":"), "sort_keys": sort_keys}
+        return {"indent": 2, "sort_keys": sort_keys}
+
+    def _json_loads_bytes(self, data: bytes) -> dict[str, Any]:
+        if _prefers_bytes(type(self), "read_bytes", "json_loads"):
+            return self.json_loads(data)
+        return self.json_loads(data.decode("utf-8"))
+
+    def _json_dumps_line(self, json_dict: dict[str, Any]) -> bytes:
+        if _prefers_bytes(type(self), "write_bytes", "json_dumps"):
+            data = self._json_dumps_bytes(json_dict, compact=True)
         else:
-            return json.dumps(json_dict, *args, indent=2, **kwargs)
+            data = self.json_dumps(json_dict, compact=True).encode("utf-8")
+        return data + b"\n"
 
     def stac_object_from_dict(
         self,
@@ -137,6 +531,7 @@ class StacIO(ABC):
         href: HREF | None = None,
         root: Catalog | None = None,
         preserve_dict: bool = True,
+        lazy: bool | None = None,
     ) -> STACObject:
         """Deserializes a :class:`~pystac.STACObject` sub-class instance from a
         dictionary.
@@ -152,9 +547,22 @@ class StacIO(ABC):
                 Defaults to ``True``, which results results in a deepcopy of the
                 parameter. Set to ``False`` when possible to avoid the performance
                 hit of a deepcopy.
+            lazy: If ``True``, the :class:`~pystac.Asset` and :class:`~pystac.Link`
+                objects of an item are only created when :attr:`Item.assets
+                <pystac.Item.assets>` or :attr:`Item.links <pystac.Item.links>` is
+                first accessed, which makes reading items that are only filtered
+                on a few fields cheaper. Until then, :meth:`Item.to_dict
+                <pystac.Item.to_dict>` returns the asset and link dicts as they were
+                read rather than rebuilding them, so the returned dict shares them
+                with the item. Defaults to :attr:`StacIO.lazy_items`.
         """
         href_str = None if href is None else str(os.fspath(href))
-        if identify_stac_object_type(d) == pystac.STACObjectType.ITEM:
+        if self.intern_keys:
+            # Interning the keys rebuilds, and so copies, the dict
+            d = _intern_keys(d)
+            preserve_dict = False
+        object_type = identify_stac_object_type(d)
+        if object_type == pystac.STACObjectType.ITEM:
             collection_cache = None
             if root is not None:
                 collection_cache = root._resolved_objects.as_collection_cache()
@@ -164,27 +572,37 @@ class StacIO(ABC):
                 d, json_href=href_str, collection_cache=collection_cache
             )
 
-        info = identify_stac_object(d)
-        d = migrate_to_latest(d, info)
+        # JSON that is already at the latest version is used as it is
+        if needs_migration(d):
+            info = identify_stac_object(d)
+            d = migrate_to_latest(d, info)
+            object_type = info.object_type
+            # Migrating returns a copy
+            preserve_dict = False
 
-        if info.object_type == pystac.STACObjectType.CATALOG:
+        if object_type == pystac.STACObjectType.CATALOG:
             result = pystac.Catalog.from_dict(
-                d, href=href_str, root=root, migrate=True, preserve_dict=preserve_dict
+                d, href=href_str, root=root, migrate=False, preserve_dict=preserve_dict
             )
             result._stac_io = self
             return result
 
-        if info.object_type == pystac.STACObjectType.COLLECTION:
+        if object_type == pystac.STACObjectType.COLLECTION:
             return pystac.Collection.from_dict(
-                d, href=href_str, root=root, migrate=True, preserve_dict=preserve_dict
+                d, href=href_str, root=root, migrate=False, preserve_dict=preserve_dict
             )
 
-        if info.object_type == pystac.STACObjectType.ITEM:
-            return pystac.Item.from_dict(
-                d, href=href_str, root=root, migrate=True, preserve_dict=preserve_dict
+        if object_type == pystac.STACObjectType.ITEM:
+            return pystac.Item._from_dict(
+                d,
+                href=href_str,
+                root=root,
+                migrate=False,
+                preserve_dict=preserve_dict,
+                lazy=self.lazy_items if lazy is None else lazy,
             )
 
-        raise ValueError(f"Unknown STAC object type {info.object_type}")
+        raise ValueError(f"Unknown STAC object type {object_type}")
 
     def read_json(self, source: HREF, *args: Any, **kwargs: Any) -> dict[str, Any]:
         """Read a dict from the given source.
@@ -203,6 +621,8 @@ class StacIO(ABC):
             dict: A dict representation of the JSON contained in the file at the
             given source.
         """
+        if _prefers_bytes(type(self), "read_bytes", "read_text", "json_loads"):
+            return self.json_loads(self.read_bytes(source, *args, **kwargs))
         txt = self.read_text(source, *args, **kwargs)
         return self.json_loads(txt)
 
@@ -257,9 +677,105 @@ class StacIO(ABC):
             **kwargs : Additional keyword arguments to be passed to
                 :meth:`StacIO.json_dumps`.
         """
+        if _prefers_bytes(type(self), "write_bytes", "write_text", "json_dumps"):
+            self.write_bytes(dest, self._json_dumps_bytes(json_dict, *args, **kwargs))
+            return
         txt = self.json_dumps(json_dict, *args, **kwargs)
         self.write_text(dest, txt)
 
+    def save_json_if_changed(
+        self,
+        dest: HREF,
+        json_dict: dict[str, Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> bool:
+        """Write a dict to the given URI as JSON, unless the file at that URI
+        already holds exactly the same JSON.
+
+        The dict is serialized as :meth:`StacIO.save_json` would serialize it and
+        compared with the bytes returned by :meth:`StacIO.read_bytes`. If the
+        destination does not exist yet, it is written. Destinations with a URL
+        scheme (e.g. "https://") are always written without being read first.
+
+        Args:
+            dest : The destination file to write the text to.
+            json_dict : The JSON dict to write.
+            *args : Additional positional arguments to be passed to
+                :meth:`StacIO.json_dumps`.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`StacIO.json_dumps`.
+
+        Returns:
+            bool: ``True`` if the file was written, ``False`` if it was left
+            unchanged.
+        """
+        prefers_bytes = _prefers_bytes(
+            type(self), "write_bytes", "write_text", "json_dumps"
+        )
+        if prefers_bytes:
+            data = self._json_dumps_bytes(json_dict, *args, **kwargs)
+        else:
+            data = self.json_dumps(json_dict, *args, **kwargs).encode("utf-8")
+        if not _is_url(str(os.fspath(dest))):
+            try:
+                if self.read_bytes(dest) == data:
+                    return False
+            except FileNotFoundError:
+                pass
+        self._save_json_data(dest, json_dict, data, *args, **kwargs)
+        return True
+
+    def _save_json_data(
+        self,
+        dest: HREF,
+        json_dict: dict[str, Any],
+        data: bytes,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        # Writes ``data``, which is ``json_dict`` serialized as save_json would
+        # serialize it. Overrides of save_json are still called, and serialize the
+        # dict again, unless this method is overridden as well.
+        if type(self).save_json is not StacIO.save_json:
+            self.save_json(dest, json_dict, *args, **kwargs)
+        elif _prefers_bytes(type(self), "write_bytes", "write_text", "json_dumps"):
+            self.write_bytes(dest, data)
+        else:
+            self.write_text(dest, data.decode("utf-8"))
+
+    def save_ndjson(
+        self,
+        dest: HREF,
+        json_dicts: Iterable[dict[str, Any]],
+        append: bool = False,
+    ) -> None:
+        """Write dicts to the given URI as newline-delimited JSON.
+
+        Each dict is serialized with :meth:`StacIO.json_dumps` with
+        ``compact=True`` onto its own line, and the lines are written with
+        :meth:`StacIO.write_chunks` as they are serialized.
+
+        Args:
+            dest : The destination file to write to.
+            json_dicts : The JSON dicts to write.
+            append : If ``True``, add the lines to the end of an existing file
+                instead of replacing it.
+        """
+        self.write_chunks(
+            dest, (self._json_dumps_line(d) for d in json_dicts), append=append
+        )
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Returns a context manager that groups the writes made within it.
+
+        :meth:`Catalog.save <pystac.Catalog.save>` makes all of its writes within
+        a batch, so that implementations backed by a database can commit them in
+        a single transaction. The default implementation does nothing.
+        """
+        yield
+
     @classmethod
     def set_default(cls, stac_io_class: Callable[[], StacIO]) -> None:
         """Set the default StacIO instance to use."""
@@ -285,6 +801,105 @@ class DefaultStacIO(StacIO):
     def read_text_from_href(self, href: str) -> str:
         """Reads file as a UTF-8 string.
 
+        This decodes the result of :meth:`DefaultStacIO.read_bytes_from_href`.
+
+        Args:
+
+            href : The URI of the file to open.
+        """
+        return self.read_bytes_from_href(href).decode("utf-8")
+
+    def read_bytes(self, source: HREF, *_: Any, **__: Any) -> bytes:
+        """A concrete implementation of :meth:`StacIO.read_bytes
+        <pystac.StacIO.read_bytes>`. Converts the ``source`` argument to a string (if
+        it is not already) and delegates to
+        :meth:`DefaultStacIO.read_bytes_from_href` for opening and reading the file.
+        """
+        href = str(os.fspath(source))
+        if _prefers_bytes(type(self), "read_bytes_from_href", "read_text_from_href"):
+            return self.read_bytes_from_href(href)
+        return self.read_text_from_href(href).encode("utf-8")
+
+    def read_chunks(self, source: HREF, *_: Any, **__: Any) -> Iterator[bytes]:
+        """A concrete implementation of :meth:`StacIO.read_chunks
+        <pystac.StacIO.read_chunks>`. Converts the ``source`` argument to a string
+        (if it is not already) and delegates to
+        :meth:`DefaultStacIO.read_chunks_from_href`.
+
+        If a sub-class overrides one of the other read methods but not this one,
+        the file is read with :meth:`StacIO.read_bytes` as a single chunk instead.
+        """
+        if not _prefers_bytes(
+            type(self),
+            "read_chunks",
+            "read_text",
+            "read_bytes",
+            "read_text_from_href",
+            "read_bytes_from_href",
+        ):
+            yield self.read_bytes(source)
+            return
+        yield from self.read_chunks_from_href(str(os.fspath(source)))
+
+    def write_chunks(
+        self,
+        dest: HREF,
+        chunks: Iterable[bytes],
+        *args: Any,
+        append: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """A concrete implementation of :meth:`StacIO.write_chunks
+        <pystac.StacIO.write_chunks>` that writes (or appends) each chunk to a
+        local file as soon as it is produced.
+
+        If a sub-class overrides one of the other write methods but not this one,
+        the chunks are joined and written with :meth:`StacIO.write_bytes` instead.
+        """
+        if not _prefers_bytes(
+            type(self),
+            "write_chunks",
+            "write_text",
+            "write_bytes",
+            "write_text_to_href",
+            "write_bytes_to_href",
+        ):
+            return super().write_chunks(dest, chunks, append=append)
+        href = str(os.fspath(dest))
+        if _is_url(href):
+            raise NotImplementedError("DefaultStacIO cannot write to urls")
+        with self._open_for_writing(href, "ab" if append else "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+
+    def read_chunks_from_href(
+        self, href: str, chunk_size: int = _CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Reads the raw bytes of a file in chunks of ``chunk_size`` bytes.
+
+        Args:
+
+            href : The URI of the file to open.
+            chunk_size : The maximum size of each chunk.
+        """
+        if _is_url(href):
+            try:
+                logger.debug(f"GET {href} Headers: {self.headers}")
+                req = Request(href, headers=self.headers)
+                with urlopen(req) as f:
+                    while chunk := f.read(chunk_size):
+                        yield chunk
+            except HTTPError as e:
+                raise Exception(f"Could not read uri {href}") from e
+        else:
+            href = safe_urlparse(href).path
+            with open(href, "rb") as f:
+                while chunk := f.read(chunk_size):
+                    yield chunk
+
+    def read_bytes_from_href(self, href: str) -> bytes:
+        """Reads the raw bytes of a file.
+
         If ``href`` has a "scheme" (e.g. if it starts with "https://") then this will
         use :func:`urllib.request.urlopen` to open the file and read the contents;
         otherwise, :func:`open` will be used to open a local file.
@@ -293,18 +908,18 @@ class DefaultStacIO(StacIO):
 
             href : The URI of the file to open.
         """
-        href_contents: str
+        href_contents: bytes
         if _is_url(href):
             try:
                 logger.debug(f"GET {href} Headers: {self.headers}")
                 req = Request(href, headers=self.headers)
                 with urlopen(req) as f:
-                    href_contents = f.read().decode("utf-8")
+                    href_contents = f.read()
             except HTTPError as e:
                 raise Exception(f"Could not read uri {href}") from e
         else:
             href = safe_urlparse(href).path
-            with open(href, encoding="utf-8") as f:
+            with open(href, "rb") as f:
                 href_contents = f.read()
         return href_contents
 
@@ -320,22 +935,54 @@ class DefaultStacIO(StacIO):
     def write_text_to_href(self, href: str, txt: str) -> None:
         """Writes text to file using UTF-8 encoding.
 
-        This implementation uses :func:`open` and therefore can only write to the local
-        file system.
+        This encodes ``txt`` and delegates to
+        :meth:`DefaultStacIO.write_bytes_to_href`.
 
         Args:
 
             href : The path to which the file will be written.
             txt : The string content to write to the file.
         """
+        self.write_bytes_to_href(href, txt.encode("utf-8"))
+
+    def write_bytes(self, dest: HREF, data: bytes, *_: Any, **__: Any) -> None:
+        """A concrete implementation of :meth:`StacIO.write_bytes
+        <pystac.StacIO.write_bytes>`. Converts the ``dest`` argument to a string (if it
+        is not already) and delegates to
+        :meth:`DefaultStacIO.write_bytes_to_href` for opening and writing the file."""
+        href = str(os.fspath(dest))
+        if _prefers_bytes(type(self), "write_bytes_to_href", "write_text_to_href"):
+            return self.write_bytes_to_href(href, data)
+        return self.write_text_to_href(href, data.decode("utf-8"))
+
+    def write_bytes_to_href(self, href: str, data: bytes) -> None:
+        """Writes bytes to a file.
+
+        This implementation uses :func:`open` and therefore can only write to the local
+        file system. Missing parent directories are created the first time a write
+        into them fails, rather than being checked for on every write.
+
+        Args:
+
+            href : The path to which the file will be written.
+            data : The content to write to the file.
+        """
         if _is_url(href):
             raise NotImplementedError("DefaultStacIO cannot write to urls")
+        with self._open_for_writing(href, "wb") as f:
+            f.write(data)
+
+    @staticmethod
+    def _open_for_writing(href: str, mode: str) -> BinaryIO:
         href = safe_urlparse(href).path
-        dirname = os.path.dirname(href)
-        if dirname != "" and not os.path.isdir(dirname):
-            os.makedirs(dirname)
-        with open(href, "w", encoding="utf-8") as f:
-            f.write(txt)
+        try:
+            return cast(BinaryIO, open(href, mode))
+        except FileNotFoundError:
+            dirname = os.path.dirname(href)
+            if dirname == "":
+                raise
+            os.makedirs(dirname, exist_ok=True)
+            return cast(BinaryIO, open(href, mode))
 
 
 class DuplicateKeyReportingMixin(StacIO):
@@ -345,7 +992,7 @@ class DuplicateKeyReportingMixin(StacIO):
     See https://github.com/stac-utils/pystac/issues/313
     """
 
-    def json_loads(self, txt: str, *_: Any, **__: Any) -> dict[str, Any]:
+    def json_loads(self, txt: str | bytes, *_: Any, **__: Any) -> dict[str, Any]:
         """Overwrites :meth:`StacIO.json_loads <pystac.StacIO.json_loads>` as the
         internal method used by :class:`DuplicateKeyReportingMixin` for deserializing
         a JSON string to a dictionary while checking for duplicate object keys.
@@ -391,11 +1038,1058 @@ class DuplicateKeyReportingMixin(StacIO):
         return result
 
 
-if HAS_URLLIB3:
-    from typing import cast
+class DiskCacheStacIO(DefaultStacIO):
+    """A customized StacIO that caches remote responses on local disk and
+    revalidates them with conditional requests.
+
+    Responses that carry an ``ETag`` or ``Last-Modified`` header are stored in
+    ``cache_dir``. The next read of the same URL sends ``If-None-Match`` /
+    ``If-Modified-Since``, and a ``304 Not Modified`` response is served from the
+    cached copy, so re-walking an unchanged remote catalog costs one round trip
+    per object but no downloads. Local files are read directly and never cached.
+
+    When the total size of the cached responses exceeds ``max_size`` bytes, the
+    least recently used responses are removed. The cache directory can be reused
+    across processes; a single instance is safe to share between threads.
+
+    Args:
+        cache_dir : The directory to store responses in. It is created if it does
+            not exist.
+        max_size : The maximum total size, in bytes, of the cached responses.
+            Defaults to 512 MiB.
+        headers : Headers to send with every request.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_size: int = 512 * 1024 * 1024,
+        headers: dict[str, str] | None = None,
+    ):
+        super().__init__(headers)
+
+        self.cache_dir = cache_dir
+        """The directory responses are stored in."""
+
+        self.max_size = max_size
+        """The maximum total size, in bytes, of the cached responses."""
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        # Sizes of the cached bodies, from least to most recently used
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        paths = []
+        for name in os.listdir(cache_dir):
+            if name.endswith(".json"):
+                path = os.path.join(cache_dir, name)
+                stat = os.stat(path)
+                paths.append((stat.st_mtime, name[: -len(".json")], stat.st_size))
+        for _, key, size in sorted(paths):
+            self._entries[key] = size
+            self._size += size
+
+    def read_bytes_from_href(self, href: str) -> bytes:
+        """Reads the raw bytes of a file, revalidating cached copies of remote files
+        with a conditional request.
+
+        Args:
+            href : The URI of the file to open.
+        """
+        if not _is_url(href):
+            return super().read_bytes_from_href(href)
+
+        key = hashlib.sha256(href.encode("utf-8")).hexdigest()
+        body_path = os.path.join(self.cache_dir, key + ".json")
+        meta_path = os.path.join(self.cache_dir, key + ".meta")
+
+        headers = dict(self.headers)
+        meta = self._read_meta(meta_path)
+        if meta is not None and os.path.exists(body_path):
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        logger.debug(f"GET {href} Headers: {headers}")
+        try:
+            with urlopen(Request(href, headers=headers)) as f:
+                data: bytes = f.read()
+                etag = f.headers.get("ETag")
+                last_modified = f.headers.get("Last-Modified")
+        except HTTPError as e:
+            if e.code == 304:
+                try:
+                    with open(body_path, "rb") as cached:
+                        data = cached.read()
+                except FileNotFoundError:
+                    # Evicted by another process after the request was made
+                    self._forget(key)
+                    return self.read_bytes_from_href(href)
+                self._touch(key, body_path, len(data))
+                return data
+            raise Exception(f"Could not read uri {href}") from e
+
+        if etag or last_modified:
+            self._store(
+                key,
+                body_path,
+                meta_path,
+                data,
+                {"href": href, "etag": etag, "last_modified": last_modified},
+            )
+        return data
+
+    def clear(self) -> None:
+        """Removes all cached responses."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    @property
+    def size(self) -> int:
+        """The total size, in bytes, of the cached responses."""
+        return self._size
 
+    @staticmethod
+    def _read_meta(meta_path: str) -> dict[str, Any] | None:
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta: dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def _store(
+        self,
+        key: str,
+        body_path: str,
+        meta_path: str,
+        data: bytes,
+        meta: dict[str, Any],
+    ) -> None:
+        if len(data) > self.max_size:
+            return
+        _atomic_write(body_path, data)
+        _atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+        with self._lock:
+            self._size -= self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._size += len(data)
+            while self._size > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def _touch(self, key: str, body_path: str, size: int) -> None:
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+        with self._lock:
+            self._size -= self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._size += size
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._size -= self._entries.pop(key, 0)
+        try:
+            os.remove(os.path.join(self.cache_dir, key + ".meta"))
+        except OSError:
+            pass
+
+    def _remove(self, key: str) -> None:
+        # Must be called with the lock held
+        self._size -= self._entries.pop(key, 0)
+        for suffix in (".json", ".meta"):
+            try:
+                os.remove(os.path.join(self.cache_dir, key + suffix))
+            except OSError:
+                pass
+
+
+def _wrapped_attribute(name: str) -> Any:
+    # An attribute of a wrapping StacIO that reads and writes the attribute of the
+    # same name of the wrapped ``stac_io``
+    return property(
+        lambda self: getattr(self.stac_io, name),
+        lambda self, value: setattr(self.stac_io, name, value),
+    )
+
+
+class CachingStacIO(StacIO):
+    """A StacIO that wraps another :class:`StacIO` and keeps the JSON it reads in
+    a size-bounded, in-memory LRU cache.
+
+    Reads through :meth:`read_json` (and therefore :meth:`read_stac_object`) are
+    keyed by absolute HREF. The raw bytes or text are cached rather than the parsed
+    dictionaries, so every read returns a fresh dictionary that callers are free
+    to modify. Writes through this instance invalidate the written HREF.
+
+    The :attr:`~StacIO.headers`, :attr:`~StacIO.compact`,
+    :attr:`~StacIO.sort_keys`, :attr:`~StacIO.lazy_items` and
+    :attr:`~StacIO.intern_keys` settings are those of the wrapped instance.
+
+    :meth:`StacIO.default` creates a new instance on every call, so reads that
+    PySTAC makes with the default instance, e.g. of the collection of pre-1.0
+    items in :func:`~pystac.serialization.merge_common_properties`, only share a
+    cache if a single instance is installed as the default:
+
+    .. code-block:: python
+
+        stac_io = CachingStacIO()
+        StacIO.set_default(lambda: stac_io)
+
+    Args:
+        stac_io : The :class:`StacIO` to read and write with. Defaults to
+            :meth:`StacIO.default`.
+        max_size : The maximum total size, in bytes (or characters, for wrapped
+            instances that read text), of the cached responses. Defaults to 64 MiB.
+    """
+
+    headers = _wrapped_attribute("headers")
+    compact = _wrapped_attribute("compact")
+    sort_keys = _wrapped_attribute("sort_keys")
+    lazy_items = _wrapped_attribute("lazy_items")
+    intern_keys = _wrapped_attribute("intern_keys")
+
+    def __init__(self, stac_io: StacIO | None = None, max_size: int = 64 * 1024 * 1024):
+        # StacIO.__init__ is not called, as its settings are those of the wrapped
+        # instance
+        self.stac_io = stac_io or StacIO.default()
+        """The wrapped :class:`StacIO`."""
+
+        self.max_size = max_size
+        """The maximum total size of the cached responses."""
+
+        self.hits = 0
+        """The number of reads served from the cache."""
+
+        self.misses = 0
+        """The number of reads that were not in the cache."""
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, str | bytes] = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached responses."""
+        return self._size
+
+    def clear(self) -> None:
+        """Removes all cached responses and resets the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+        return self.stac_io.read_text(source, *args, **kwargs)
+
+    def read_bytes(self, source: HREF, *args: Any, **kwargs: Any) -> bytes:
+        return self.stac_io.read_bytes(source, *args, **kwargs)
+
+    def write_text(self, dest: HREF, txt: str, *args: Any, **kwargs: Any) -> None:
+        self._invalidate(dest)
+        self.stac_io.write_text(dest, txt, *args, **kwargs)
+
+    def write_bytes(self, dest: HREF, data: bytes, *args: Any, **kwargs: Any) -> None:
+        self._invalidate(dest)
+        self.stac_io.write_bytes(dest, data, *args, **kwargs)
+
+    def read_chunks(self, source: HREF, *args: Any, **kwargs: Any) -> Iterator[bytes]:
+        return self.stac_io.read_chunks(source, *args, **kwargs)
+
+    def write_chunks(
+        self,
+        dest: HREF,
+        chunks: Iterable[bytes],
+        *args: Any,
+        append: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        self._invalidate(dest)
+        self.stac_io.write_chunks(dest, chunks, *args, append=append, **kwargs)
+
+    def json_loads(self, txt: str | bytes, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        return self.stac_io.json_loads(txt, *args, **kwargs)
+
+    def json_dumps(self, json_dict: dict[str, Any], *args: Any, **kwargs: Any) -> str:
+        return self.stac_io.json_dumps(json_dict, *args, **kwargs)
+
+    def read_json(self, source: HREF, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Reads a dict from the given source, serving repeated reads of the same
+        HREF from the cache.
+
+        See :meth:`StacIO.read_json <pystac.StacIO.read_json>`.
+        """
+        key = self._key(source)
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if data is None:
+            if _prefers_bytes(
+                type(self.stac_io), "read_bytes", "read_text", "json_loads"
+            ):
+                data = self.stac_io.read_bytes(source, *args, **kwargs)
+            else:
+                data = self.stac_io.read_text(source, *args, **kwargs)
+            self._store(key, data)
+        return self.stac_io.json_loads(data)
+
+    def save_json(
+        self,
+        dest: HREF,
+        json_dict: dict[str, Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Writes a dict to the given URI as JSON with the wrapped :class:`StacIO`,
+        and invalidates any cached copy of it.
+
+        See :meth:`StacIO.save_json <pystac.StacIO.save_json>`.
+        """
+        self._invalidate(dest)
+        self.stac_io.save_json(dest, json_dict, *args, **kwargs)
+
+    def save_json_if_changed(
+        self,
+        dest: HREF,
+        json_dict: dict[str, Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> bool:
+        """Writes a dict to the given URI as JSON with the wrapped
+        :class:`StacIO` if it changed, and then invalidates any cached copy of it.
+
+        See :meth:`StacIO.save_json_if_changed
+        <pystac.StacIO.save_json_if_changed>`.
+        """
+        written = self.stac_io.save_json_if_changed(dest, json_dict, *args, **kwargs)
+        if written:
+            self._invalidate(dest)
+        return written
+
+    def batch(self) -> Any:
+        return self.stac_io.batch()
+
+    @staticmethod
+    def _key(href: HREF) -> str:
+        return make_absolute_href(str(os.fspath(href)))
+
+    def _store(self, key: str, data: str | bytes) -> None:
+        if len(data) > self.max_size:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _invalidate(self, href: HREF) -> None:
+        with self._lock:
+            data = self._entries.pop(self._key(href), None)
+            if data is not None:
+                self._size -= len(data)
+
+
+class ZipStacIO(DefaultStacIO):
+    """A StacIO that reads and writes the files of a catalog as members of a
+    single zip archive.
+
+    The archive behaves like a directory at ``path``: an HREF such as
+    ``/data/catalog.zip/items/item-1.json`` refers to the member
+    ``items/item-1.json`` of ``/data/catalog.zip``. All other HREFs are read and
+    written like :class:`DefaultStacIO` does. This lets a whole catalog be saved
+    to, and read from, one file:
+
+    .. code-block:: python
+
+        with ZipStacIO("/data/catalog.zip", mode="w") as stac_io:
+            catalog.normalize_and_save(stac_io.root_href, stac_io=stac_io)
+
+        stac_io = ZipStacIO("/data/catalog.zip", mode="r")
+        catalog = Catalog.from_file("/data/catalog.zip/catalog.json", stac_io=stac_io)
+
+    Members are read directly through the archive's central directory. Writes are
+    appended to the archive, and the central directory is written once when the
+    archive is closed. Zip archives cannot replace members in place, so when a
+    member is written more than once the archive is rewritten without the stale
+    copies on :meth:`close`. A single instance is safe to share between threads.
+
+    Args:
+        path : The path of the zip archive.
+        mode : ``"r"`` to only read an existing archive, ``"a"`` to read and add to
+            an archive (creating it if needed), or ``"w"`` to create a new, empty
+            archive.
+        compression : The :mod:`zipfile` compression method for new members.
+        headers : Headers to send with every request for HREFs outside of the
+            archive.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: Literal["r", "a", "w"] = "a",
+        compression: int = zipfile.ZIP_DEFLATED,
+        headers: dict[str, str] | None = None,
+    ):
+        super().__init__(headers)
+        if mode not in ("r", "a", "w"):
+            raise ValueError(f"Invalid mode {mode!r}, must be one of 'r', 'a', 'w'")
+
+        self.path = os.path.abspath(path)
+        """The path of the zip archive."""
+
+        self.mode = mode
+        """The mode the archive was opened in."""
+
+        self.root_href = make_posix_style(self.path).rstrip("/") + "/"
+        """The HREF of the directory that the members of the archive are in, e.g.
+        ``/data/catalog.zip/``. Pass this as the ``root_href`` of
+        :meth:`Catalog.normalize_and_save <pystac.Catalog.normalize_and_save>`."""
+
+        self._lock = threading.Lock()
+        self._zipfile = zipfile.ZipFile(self.path, mode, compression=compression)
+        self._has_duplicates = False
+
+    def __enter__(self) -> ZipStacIO:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def namelist(self) -> list[str]:
+        """Returns the names of the members of the archive."""
+        with self._lock:
+            return list(dict.fromkeys(self._zipfile.namelist()))
+
+    def read_bytes_from_href(self, href: str) -> bytes:
+        """Reads a member of the archive, or a file outside of it.
+
+        Args:
+            href : The HREF of the member or file to read.
+        """
+        name = self._member_name(href)
+        if name is None:
+            return super().read_bytes_from_href(href)
+        with self._lock:
+            try:
+                return self._zipfile.read(name)
+            except KeyError:
+                raise FileNotFoundError(
+                    f"No member {name!r} in archive {self.path}"
+                ) from None
+
+    def write_bytes_to_href(self, href: str, data: bytes) -> None:
+        """Writes a member of the archive, or a file outside of it.
+
+        Args:
+            href : The HREF of the member or file to write.
+            data : The content to write.
+        """
+        name = self._member_name(href)
+        if name is None:
+            return super().write_bytes_to_href(href, data)
+        with self._lock:
+            if name in self._zipfile.NameToInfo:
+                self._has_duplicates = True
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", "Duplicate name", UserWarning)
+                self._zipfile.writestr(name, data)
+
+    def close(self) -> None:
+        """Writes the central directory and closes the archive, first removing
+        stale copies of members that were written more than once."""
+        with self._lock:
+            if self._zipfile.fp is None:
+                return
+            if self._has_duplicates:
+                self._compact()
+            else:
+                self._zipfile.close()
+
+    def _compact(self) -> None:
+        # Rewrites the archive with only the latest copy of each member, and
+        # closes it.
+        latest = {info.filename: info for info in self._zipfile.infolist()}
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(tmp_path, "w") as out:
+                for info in latest.values():
+                    out.writestr(info, self._zipfile.read(info))
+            self._zipfile.close()
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self._has_duplicates = False
+
+    def _member_name(self, href: str) -> str | None:
+        if _is_url(href):
+            return None
+        path = make_posix_style(os.path.abspath(safe_urlparse(href).path))
+        if not path.startswith(self.root_href):
+            return None
+        return path[len(self.root_href) :]
+
+
+class SQLiteStacIO(DefaultStacIO):
+    """A StacIO that stores the JSON of STAC objects in a SQLite database, keyed
+    by HREF.
+
+    Every write (e.g. from :meth:`Catalog.save <pystac.Catalog.save>` or
+    :meth:`STACObject.save_object <pystac.STACObject.save_object>`) is stored as a
+    row of the database instead of a file, so a whole catalog lives in one file.
+    Reads look the HREF up in the database first, and fall back to
+    :class:`DefaultStacIO` for HREFs that are not stored (e.g. remote schemas).
+    Any HREF can be used as the root of the stored catalog:
+
+    .. code-block:: python
+
+        with SQLiteStacIO("/data/catalog.db") as stac_io:
+            catalog.normalize_and_save("/catalog/", stac_io=stac_io)
+            catalog = Catalog.from_file("/catalog/catalog.json", stac_io=stac_io)
+            items = list(stac_io.search(collections=["landsat"], bbox=bbox))
+
+    The ``id``, ``collection``, temporal range and ``bbox`` of each object are
+    stored in indexed columns that :meth:`search` queries. Writes made within
+    :meth:`batch`, which includes all the writes of :meth:`Catalog.save
+    <pystac.Catalog.save>`, are committed in a single transaction; other writes
+    are committed immediately. A single instance is safe to share between threads.
+
+    Args:
+        path : The path of the SQLite database. It is created if it does not exist.
+        headers : Headers to send with every request for HREFs that are not stored
+            in the database.
+    """
+
+    def __init__(self, path: str, headers: dict[str, str] | None = None):
+        super().__init__(headers)
+
+        self.path = path
+        """The path of the SQLite database."""
+
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.executescript(_SQLITE_SCHEMA)
+
+    def __enter__(self) -> SQLiteStacIO:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def read_bytes_from_href(self, href: str) -> bytes:
+        """Reads the JSON stored for ``href``, or reads the file at ``href`` if
+        nothing is stored for it.
+
+        Args:
+            href : The HREF to read.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content FROM stac_objects WHERE href = ?", (href,)
+            ).fetchone()
+        if row is None:
+            return super().read_bytes_from_href(href)
+        return bytes(row[0])
+
+    def write_bytes_to_href(self, href: str, data: bytes) -> None:
+        """Stores ``data`` for ``href``, replacing anything stored for it before.
+
+        Args:
+            href : The HREF to store the data for.
+            data : The JSON to store.
+        """
+        try:
+            d = json.loads(data)
+        except ValueError:
+            d = None
+        self._put(href, data, d if isinstance(d, dict) else None)
+
+    def save_json(
+        self,
+        dest: HREF,
+        json_dict: dict[str, Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Stores a dict as JSON for the given HREF.
+
+        See :meth:`StacIO.save_json <pystac.StacIO.save_json>`.
+        """
+        data = self._json_dumps_bytes(json_dict, *args, **kwargs)
+        self._put(str(os.fspath(dest)), data, json_dict)
+
+    def _save_json_data(
+        self,
+        dest: HREF,
+        json_dict: dict[str, Any],
+        data: bytes,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self._put(str(os.fspath(dest)), data, json_dict)
+
+    def delete(self, href: HREF) -> None:
+        """Removes the JSON stored for ``href``, if any.
+
+        Args:
+            href : The HREF to remove.
+        """
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM stac_objects WHERE href = ?", (str(os.fspath(href)),)
+            )
+
+    def hrefs(self) -> list[str]:
+        """Returns the HREFs of all stored objects."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT href FROM stac_objects ORDER BY href"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Returns a context manager that commits all writes made within it in a
+        single transaction, or rolls them back if an exception is raised.
+
+        Batches can be nested; the transaction is committed when the outermost
+        batch exits.
+        """
+        with self._lock:
+            if self._batch_depth == 0:
+                self._connection.execute("BEGIN")
+            self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._connection.execute("ROLLBACK")
+            raise
+        else:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._connection.execute("COMMIT")
+
+    def search(
+        self,
+        ids: Iterable[str] | None = None,
+        collections: Iterable[str] | None = None,
+        bbox: tuple[float, float, float, float] | list[float] | None = None,
+        datetime: tuple[datetime | None, datetime | None] | None = None,
+        object_type: pystac.STACObjectType | str | None = None,
+    ) -> Iterator[STACObject]:
+        """Yields the stored objects that match all of the given criteria, using
+        the database indexes.
+
+        Args:
+            ids : Only match objects with one of these ids.
+            collections : Only match objects in one of these collections.
+            bbox : Only match objects whose bbox intersects this 2D
+                ``[min_x, min_y, max_x, max_y]`` bounding box.
+            datetime : Only match objects whose ``datetime`` (or
+                ``start_datetime`` to ``end_datetime`` range) intersects this
+                ``(start, end)`` range. Either end may be ``None`` for an open range.
+            object_type : Only match objects of this type, e.g.
+                :attr:`STACObjectType.ITEM <pystac.STACObjectType.ITEM>`.
+
+        Returns:
+            Iterator[STACObject]: The matching objects, ordered by HREF.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if ids is not None:
+            ids = list(ids)
+            clauses.append(f"id IN ({', '.join('?' * len(ids))})")
+            params.extend(ids)
+        if collections is not None:
+            collections = list(collections)
+            clauses.append(f"collection IN ({', '.join('?' * len(collections))})")
+            params.extend(collections)
+        if bbox is not None:
+            min_x, min_y, max_x, max_y = bbox
+            clauses.append("min_x <= ? AND max_x >= ? AND min_y <= ? AND max_y >= ?")
+            params.extend([max_x, min_x, max_y, min_y])
+        if datetime is not None:
+            start, end = datetime
+            if end is not None:
+                clauses.append("start_datetime <= ?")
+                params.append(_sortable_datetime(end))
+            if start is not None:
+                clauses.append("end_datetime >= ?")
+                params.append(_sortable_datetime(start))
+        if object_type is not None:
+            clauses.append("type = ?")
+            params.append(str(object_type))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT href, content FROM stac_objects{where} ORDER BY href",
+                params,
+            ).fetchall()
+        for href, content in rows:
+            yield self.stac_object_from_dict(
+                self.json_loads(bytes(content)), href=href, preserve_dict=False
+            )
+
+    def _put(self, href: str, data: bytes, d: dict[str, Any] | None) -> None:
+        row = _index_columns(d or {})
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO stac_objects (href, id, type, collection, "
+                "start_datetime, end_datetime, min_x, min_y, max_x, max_y, content) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (href, *row, data),
+            )
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stac_objects (
+    href TEXT PRIMARY KEY,
+    id TEXT,
+    type TEXT,
+    collection TEXT,
+    start_datetime TEXT,
+    end_datetime TEXT,
+    min_x REAL,
+    min_y REAL,
+    max_x REAL,
+    max_y REAL,
+    content BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS stac_objects_id ON stac_objects (id);
+CREATE INDEX IF NOT EXISTS stac_objects_collection ON stac_objects (collection);
+CREATE INDEX IF NOT EXISTS stac_objects_datetime
+    ON stac_objects (start_datetime, end_datetime);
+CREATE INDEX IF NOT EXISTS stac_objects_bbox
+    ON stac_objects (min_x, max_x, min_y, max_y);
+"""
+
+
+def _sortable_datetime(dt: datetime) -> str:
+    # Fixed-width UTC timestamps compare correctly as strings
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _index_columns(d: dict[str, Any]) -> tuple[Any, ...]:
+    object_type = identify_stac_object_type(d)
+
+    bbox = d.get("bbox")
+    if object_type == pystac.STACObjectType.COLLECTION:
+        # The overall extent of a collection is the first of its extents
+        extent = d.get("extent") or {}
+        bbox = next(iter((extent.get("spatial") or {}).get("bbox") or []), None)
+        intervals = (extent.get("temporal") or {}).get("interval") or [[None, None]]
+        start, end = intervals[0]
+        start = start or _OPEN_START
+        end = end or _OPEN_END
+    else:
+        properties = d.get("properties") or {}
+        start = properties.get("start_datetime") or properties.get("datetime")
+        end = properties.get("end_datetime") or properties.get("datetime")
+    try:
+        if start not in (None, _OPEN_START):
+            start = _sortable_datetime(pystac.utils.str_to_datetime(start))
+        if end not in (None, _OPEN_END):
+            end = _sortable_datetime(pystac.utils.str_to_datetime(end))
+    except (ValueError, TypeError, OverflowError):
+        start = end = None
+
+    min_x = min_y = max_x = max_y = None
+    if isinstance(bbox, list) and len(bbox) in (4, 6):
+        half = len(bbox) // 2
+        min_x, min_y = bbox[0], bbox[1]
+        max_x, max_y = bbox[half], bbox[half + 1]
+
+    return (
+        d.get("id"),
+        None if object_type is None else str(object_type),
+        d.get("collection"),
+        start,
+        end,
+        min_x,
+        min_y,
+        max_x,
+        max_y,
+    )
+
+
+# Stored for the open ends of temporal intervals, so that they match any range
+_OPEN_START = ""
+_OPEN_END = "~"
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+class AsyncStacIO(ABC):
+    """Base class for asynchronous reading of STAC objects.
+
+    :class:`AsyncStacIO` instances are used by
+    :meth:`Link.resolve_stac_object_async <pystac.Link.resolve_stac_object_async>`,
+    :meth:`Catalog.walk_async <pystac.Catalog.walk_async>` and
+    :meth:`Catalog.get_items_async <pystac.Catalog.get_items_async>` to issue many
+    reads concurrently. Sub-classes only need to implement :meth:`read_text`;
+    deserialization is delegated to a synchronous :class:`StacIO`, so custom
+    :meth:`StacIO.json_loads` and :meth:`StacIO.stac_object_from_dict` logic is
+    respected.
+
+    Args:
+        stac_io : The :class:`StacIO` used to deserialize JSON and STAC objects. If
+            not provided, :meth:`StacIO.default` is used.
+        max_concurrency : The maximum number of reads through :meth:`read_json` that
+            may be in flight at the same time.
+    """
+
+    stac_io: StacIO
+    """The :class:`StacIO` used to deserialize JSON and STAC objects."""
+
+    max_concurrency: int
+    """The maximum number of reads that may be in flight at the same time."""
+
+    _semaphore: asyncio.Semaphore | None
+    _semaphore_loop: asyncio.AbstractEventLoop | None
+
+    def __init__(self, stac_io: StacIO | None = None, max_concurrency: int = 10):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.stac_io = stac_io or StacIO.default()
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    @abstractmethod
+    async def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+        """Asynchronously read text from the given URI.
+
+        See :meth:`StacIO.read_text` for usage of str vs Link as a parameter.
+
+        Args:
+            source : The source to read from.
+            *args : Arbitrary positional arguments that may be utilized by the concrete
+                implementation.
+            **kwargs : Arbitrary keyword arguments that may be utilized by the concrete
+                implementation.
+
+        Returns:
+            str: The text contained in the file at the location specified by the uri.
+        """
+        raise NotImplementedError
+
+    async def read_json(
+        self, source: HREF, *args: Any, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Asynchronously read a dict from the given source.
+
+        At most :attr:`max_concurrency` reads are in flight at the same time.
+
+        Args:
+            source : The source from which to read.
+            *args : Additional positional arguments to be passed to
+                :meth:`AsyncStacIO.read_text`.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`AsyncStacIO.read_text`.
+
+        Returns:
+            dict: A dict representation of the JSON contained in the file at the
+            given source.
+        """
+        async with self._get_semaphore():
+            txt = await self.read_text(source, *args, **kwargs)
+        return self.stac_io.json_loads(txt)
+
+    async def read_stac_object(
+        self,
+        source: HREF,
+        root: Catalog | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> STACObject:
+        """Asynchronously read a STACObject from a JSON file at the given source.
+
+        Args:
+            source : The source from which to read.
+            root : Optional root of the catalog for this object.
+            *args : Additional positional arguments to be passed to
+                :meth:`AsyncStacIO.read_json`.
+            **kwargs : Additional keyword arguments to be passed to
+                :meth:`AsyncStacIO.read_json`.
+
+        Returns:
+            STACObject: The deserialized STACObject from the serialized JSON
+            contained in the file at the given uri.
+        """
+        d = await self.read_json(source, *args, **kwargs)
+        return self.stac_io.stac_object_from_dict(
+            d, href=source, root=root, preserve_dict=False
+        )
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphores are bound to the event loop they are first used in, so make a
+        # new one if this instance is reused with another loop.
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+
+class DefaultAsyncStacIO(AsyncStacIO):
+    """An :class:`AsyncStacIO` that runs the blocking
+    :meth:`StacIO.read_text` of a synchronous :class:`StacIO` in an executor.
+
+    This makes any :class:`StacIO` usable for concurrent reads without any
+    additional dependencies.
+
+    Args:
+        stac_io : The :class:`StacIO` to read with. If not provided,
+            :meth:`StacIO.default` is used.
+        max_concurrency : The maximum number of reads that may be in flight at the
+            same time.
+        executor : Optional :class:`concurrent.futures.Executor` to run reads in.
+            If not provided, the running event loop's default executor is used.
+    """
+
+    executor: Executor | None
+    """The executor that reads are run in, or ``None`` for the loop's default."""
+
+    def __init__(
+        self,
+        stac_io: StacIO | None = None,
+        max_concurrency: int = 10,
+        executor: Executor | None = None,
+    ):
+        super().__init__(stac_io, max_concurrency)
+        self.executor = executor
+
+    async def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+        """A concrete implementation of :meth:`AsyncStacIO.read_text
+        <pystac.stac_io.AsyncStacIO.read_text>` that delegates to
+        :meth:`StacIO.read_text` in an executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, partial(self.stac_io.read_text, source, *args, **kwargs)
+        )
+
+
+class _HostLimiter:
+    """Per-host token-bucket rate limit and concurrency cap, shared by all threads
+    that use it.
+
+    Hosts can also be paused with :meth:`back_off`, e.g. for the ``Retry-After`` of
+    a 429 response, which delays every request to that host rather than only the
+    one that was throttled.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float | None,
+        burst: int,
+        max_concurrent_requests: int | None,
+    ):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_concurrent_requests = max_concurrent_requests
+        self._condition = threading.Condition()
+        self._hosts: dict[str, _HostState] = {}
+
+    @contextmanager
+    def acquire(self, host: str) -> Iterator[None]:
+        """Waits until a request to ``host`` is allowed, and holds one of its
+        concurrency slots until the context exits."""
+        rate = self.requests_per_second
+        with self._condition:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.burst)
+            while True:
+                now = time.monotonic()
+                if rate is not None:
+                    state.tokens = min(
+                        self.burst, state.tokens + (now - state.updated) * rate
+                    )
+                state.updated = now
+                delay = state.blocked_until - now
+                if delay <= 0 and rate is not None and state.tokens < 1:
+                    delay = (1 - state.tokens) / rate
+                full = (
+                    self.max_concurrent_requests is not None
+                    and state.active >= self.max_concurrent_requests
+                )
+                if delay <= 0 and not full:
+                    break
+                # Slots being released, or a longer back off, wake all waiters
+                self._condition.wait(delay if delay > 0 else None)
+            if rate is not None:
+                state.tokens -= 1
+            state.active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                state.active -= 1
+                self._condition.notify_all()
+
+    def back_off(self, host: str, seconds: float) -> None:
+        """Delays all requests to ``host`` for at least ``seconds``."""
+        with self._condition:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.burst)
+            state.blocked_until = max(state.blocked_until, time.monotonic() + seconds)
+            self._condition.notify_all()
+
+
+class _HostState:
+    def __init__(self, tokens: float):
+        self.tokens = tokens
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.active = 0
+
+
+# Statuses that throttle the whole host, rather than only the failed request
+_BACK_OFF_STATUSES = frozenset([429, 503])
+
+
+if HAS_URLLIB3:
     from urllib3 import PoolManager
-    from urllib3.util import Retry
+    from urllib3.exceptions import MaxRetryError
+    from urllib3.util import Retry, Timeout
 
     class RetryStacIO(DefaultStacIO):
         """A customized StacIO that retries requests, using
@@ -404,18 +2098,37 @@ if HAS_URLLIB3:
         The headers are passed to :py:class:`DefaultStacIO`. If retry is not
         provided, a default retry is used.
 
+        Requests can be limited per host, to stay within the limits of public STAC
+        APIs when reading concurrently. The limits are shared by all threads that
+        use the same instance. When any limit is set, a 429 or 503 response pauses
+        all requests to its host for the response's ``Retry-After`` (or the retry's
+        backoff time, if it has none) before the request is retried, for as long as
+        ``retry`` allows.
+
         To use this class, you'll need to install PySTAC with urllib3:
 
         .. code-block:: shell
 
             pip install pystac[urllib3]
 
+        Args:
+            headers : Headers to send with every request.
+            retry : The :py:class:`urllib3.util.retry.Retry` to use with all reading
+                network requests. If not provided, a default retry is used.
+            requests_per_second : The maximum average rate of requests to each host.
+            burst : The number of requests to a host that may be made at once before
+                ``requests_per_second`` applies.
+            max_concurrent_requests : The maximum number of requests to each host
+                that may be in flight at the same time.
         """
 
         def __init__(
             self,
             headers: dict[str, str] | None = None,
             retry: Retry | None = None,
+            requests_per_second: float | None = None,
+            burst: int = 1,
+            max_concurrent_requests: int | None = None,
         ):
             super().__init__(headers)
 
@@ -423,24 +2136,186 @@ if HAS_URLLIB3:
             """The :py:class:`urllib3.util.retry.Retry` to use with all reading network
             requests."""
 
-        def read_text_from_href(self, href: str) -> str:
-            """Reads file as a UTF-8 string, with retry support.
+            self._limiter: _HostLimiter | None = None
+            if requests_per_second is not None or max_concurrent_requests is not None:
+                self._limiter = _HostLimiter(
+                    requests_per_second, burst, max_concurrent_requests
+                )
+
+        def read_bytes_from_href(self, href: str) -> bytes:
+            """Reads the raw bytes of a file, with retry support.
 
             Args:
                 href : The URI of the file to open.
             """
             if _is_url(href):
-                # TODO provide a pooled StacIO to enable more efficient network
-                # access (probably named `PooledStacIO`).
+                # Use :py:class:`PooledStacIO` to reuse connections across reads.
                 http = PoolManager()
                 try:
-                    response = http.request(
-                        "GET",
-                        href,
-                        retries=self.retry,  # type: ignore
-                    )
-                    return cast(str, response.data.decode("utf-8"))
+                    request = partial(http.request, "GET", href)
+                    with self._request(href, request) as response:
+                        return cast(bytes, response.data)
                 except HTTPError as e:
                     raise Exception(f"Could not read uri {href}") from e
             else:
-                return super().read_text_from_href(href)
+                return super().read_bytes_from_href(href)
+
+        @contextmanager
+        def _request(self, href: str, request: Callable[..., Any]) -> Iterator[Any]:
+            # Yields the response of ``request(retries=...)`` within the per-host
+            # limits, backing off the host on 429 and 503 responses.
+            if self._limiter is None:
+                yield request(retries=self.retry)
+                return
+            host = safe_urlparse(href).netloc
+            retry = self.retry
+            # The limiter retries statuses that back off the host, so that the
+            # pause applies to every thread rather than only this one. urllib3
+            # would otherwise retry them itself when they have a Retry-After header,
+            # sleeping in this thread only.
+            retries = retry.new(
+                status_forcelist=set(retry.status_forcelist or ()) - _BACK_OFF_STATUSES,
+                respect_retry_after_header=False,
+            )
+            while True:
+                with self._limiter.acquire(host):
+                    response = request(retries=retries)
+                    if response.status not in _BACK_OFF_STATUSES:
+                        yield response
+                        return
+                    try:
+                        retry = retry.increment("GET", href, response=response)
+                    except MaxRetryError:
+                        yield response
+                        return
+                    response.drain_conn()
+                    delay = None
+                    if retry.respect_retry_after_header:
+                        delay = retry.get_retry_after(response)
+                    if delay is None:
+                        delay = retry.get_backoff_time()
+                    logger.debug(
+                        f"HTTP {response.status} from {host}, backing off {delay}s"
+                    )
+                    # Back off before releasing the slot, so that no other request
+                    # to the host starts in between
+                    self._limiter.back_off(host, delay)
+
+    class PooledStacIO(RetryStacIO):
+        """A customized StacIO that keeps a single
+        :py:class:`urllib3.PoolManager` for the lifetime of the instance, so that
+        connections are kept alive and reused across reads.
+
+        This is a good fit for walking large remote catalogs, where opening a new
+        connection (and doing a new TLS handshake) for every object dominates the
+        time spent reading. The pool manager is thread-safe, so a single instance
+        can be shared by concurrent readers.
+
+        To use this class, you'll need to install PySTAC with urllib3:
+
+        .. code-block:: shell
+
+            pip install pystac[urllib3]
+
+        Args:
+            headers : Headers to send with every request.
+            retry : The :py:class:`urllib3.util.retry.Retry` to use with all reading
+                network requests. If not provided, a default retry is used.
+            timeout : The :py:class:`urllib3.util.Timeout`, or a number of seconds,
+                to use for all reading network requests. If not provided,
+                urllib3's default is used.
+            num_pools : The number of per-host connection pools to keep.
+            maxsize : The maximum number of connections to keep alive per host.
+            block : If ``True``, no more than ``maxsize`` connections are opened per
+                host, and callers wait for a free connection instead.
+            requests_per_second : The maximum average rate of requests to each host.
+                See :class:`RetryStacIO`.
+            burst : The number of requests to a host that may be made at once before
+                ``requests_per_second`` applies.
+            max_concurrent_requests : The maximum number of requests to each host
+                that may be in flight at the same time.
+        """
+
+        def __init__(
+            self,
+            headers: dict[str, str] | None = None,
+            retry: Retry | None = None,
+            timeout: Timeout | float | None = None,
+            num_pools: int = 10,
+            maxsize: int = 10,
+            block: bool = False,
+            requests_per_second: float | None = None,
+            burst: int = 1,
+            max_concurrent_requests: int | None = None,
+        ):
+            super().__init__(
+                headers, retry, requests_per_second, burst, max_concurrent_requests
+            )
+
+            self.timeout = timeout
+            """The timeout to use with all reading network requests."""
+
+            connection_pool_kw: dict[str, Any] = {"maxsize": maxsize, "block": block}
+            if timeout is not None:
+                connection_pool_kw["timeout"] = timeout
+            self.pool_manager = PoolManager(
+                num_pools=num_pools,
+                headers=self.headers,
+                retries=self.retry,
+                **connection_pool_kw,
+            )
+            """The :py:class:`urllib3.PoolManager` shared by all reads."""
+
+        def read_bytes_from_href(self, href: str) -> bytes:
+            """Reads the raw bytes of a file, reusing pooled connections.
+
+            Args:
+                href : The URI of the file to open.
+            """
+            if _is_url(href):
+                logger.debug(f"GET {href} Headers: {self.headers}")
+                request = partial(self.pool_manager.request, "GET", href)
+                with self._request(href, request) as response:
+                    if response.status >= 400:
+                        raise Exception(
+                            f"Could not read uri {href}: HTTP status {response.status}"
+                        )
+                    return cast(bytes, response.data)
+            else:
+                return super().read_bytes_from_href(href)
+
+        def read_chunks(self, source: HREF, *_: Any, **__: Any) -> Iterator[bytes]:
+            """Reads the raw bytes of a file in chunks, streaming remote files
+            through pooled connections.
+
+            Args:
+                source : The source to read from.
+            """
+            href = str(os.fspath(source))
+            if not _is_url(href):
+                yield from super().read_chunks(source)
+                return
+            logger.debug(f"GET {href} Headers: {self.headers}")
+            request = partial(
+                self.pool_manager.request,
+                "GET",
+                href,
+                preload_content=False,
+            )
+            with self._request(href, request) as response:
+                try:
+                    if response.status >= 400:
+                        raise Exception(
+                            f"Could not read uri {href}: HTTP status {response.status}"
+                        )
+                    yield from response.stream(_CHUNK_SIZE)
+                finally:
+                    response.release_conn()
+
+        def close(self) -> None:
+            """Closes all pooled connections.
+
+            The instance can still be used afterwards; new connections will be
+            opened as needed.
+            """
+            self.pool_manager.clear()  # type: ignore
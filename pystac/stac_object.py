@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future
 from html import escape
 from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar, cast
 
@@ -9,6 +11,7 @@ import pystac
 from pystac import STACError
 from pystac.html.jinja_env import get_jinja_env
 from pystac.link import Link
+from pystac.stac_io import _json_options
 from pystac.utils import (
     HREF,
     StringEnum,
@@ -19,6 +22,7 @@ from pystac.utils import (
 
 if TYPE_CHECKING:
     from pystac.catalog import Catalog
+    from pystac.stac_io import AsyncStacIO
 
 S = TypeVar("S", bound="STACObject")
 
@@ -404,6 +408,8 @@ class STACObject(ABC):
         rel: str | pystac.RelType,
         typ: type[STACObject] | None = None,
         modify_links: Callable[[list[Link]], list[Link]] | None = None,
+        executor: Executor | None = None,
+        prefetch: int | None = None,
     ) -> Iterable[STACObject]:
         """Gets the :class:`STACObject` instances that are linked to
         by links with their ``rel`` property matching the passed in argument.
@@ -416,6 +422,13 @@ class STACObject(ABC):
             modify_links : A function that modifies the list of links before they are
                 iterated over. For instance, this option can be used to sort the list
                 so that links matching a particular pattern are earlier in the iterator.
+            executor : Optional :class:`concurrent.futures.Executor`. If provided,
+                all unresolved matching links are read in the executor as soon as
+                iteration starts, and objects are yielded in link order as their reads
+                complete.
+            prefetch : If set along with ``executor``, only the next ``prefetch``
+                unresolved matching links are read ahead of the object that was last
+                yielded, instead of all of them.
 
         Returns:
             Iterable[STACObject]: A possibly empty iterable of STACObjects that are
@@ -426,18 +439,96 @@ class STACObject(ABC):
         if modify_links:
             links = modify_links(links)
 
+        if prefetch is not None and prefetch < 1:
+            raise ValueError(f"prefetch must be at least 1, got {prefetch}")
+
+        futures: dict[int, Future[dict[str, Any]]] = {}
+        to_read = (i for i, link in enumerate(links) if link.rel == rel)
+
+        def read_ahead() -> None:
+            # Keeps up to ``prefetch`` reads in flight, in link order
+            if executor is None:
+                return
+            root = self.get_root()
+            while prefetch is None or len(futures) < prefetch:
+                i = next(to_read, None)
+                if i is None:
+                    return
+                future = links[i]._submit_read(executor, root)
+                if future is not None:
+                    futures[i] = future
+
+        read_ahead()
         for i in range(0, len(links)):
             link = links[i]
             if link.rel == rel:
-                link.resolve_stac_object(root=self.get_root())
+                if i in futures:
+                    future = futures.pop(i)
+                    read_ahead()
+                    link._resolve_stac_object_from_future(future, root=self.get_root())
+                else:
+                    link.resolve_stac_object(root=self.get_root())
                 if typ is None or isinstance(link.target, typ):
                     yield cast(STACObject, link.target)
 
+    async def get_stac_objects_async(
+        self,
+        rel: str | pystac.RelType,
+        typ: type[STACObject] | None = None,
+        stac_io: AsyncStacIO | None = None,
+    ) -> list[STACObject]:
+        """Asynchronously gets the :class:`STACObject` instances that are linked to
+        by links with their ``rel`` property matching the passed in argument.
+
+        All matching links are resolved concurrently, and the objects are returned
+        in link order.
+
+        Args:
+            rel : The relation to match each :class:`~pystac.Link`'s
+                ``rel`` property against.
+            typ : If not ``None``, objects will only be returned if they are
+                instances of ``typ``.
+            stac_io : Optional :class:`~pystac.stac_io.AsyncStacIO` to read objects
+                with. If not provided, a :class:`~pystac.stac_io.DefaultAsyncStacIO`
+                wrapping the root's :class:`~pystac.StacIO` is used.
+
+        Returns:
+            List[STACObject]: A possibly empty list of STACObjects that are
+                connected to this object through links with the given ``rel`` and are
+                of type ``typ`` (if given).
+        """
+        if stac_io is None:
+            stac_io = self._get_async_stac_io()
+        root = self.get_root()
+        links = [link for link in self.links if link.rel == rel]
+        await asyncio.gather(
+            *(
+                link.resolve_stac_object_async(root=root, stac_io=stac_io)
+                for link in links
+            )
+        )
+        return [
+            cast(STACObject, link.target)
+            for link in links
+            if typ is None or isinstance(link.target, typ)
+        ]
+
+    def _get_async_stac_io(self) -> AsyncStacIO:
+        stac_io: pystac.StacIO | None = None
+        root = self.get_root()
+        if root is not None:
+            stac_io = root._stac_io
+        if stac_io is None and isinstance(self, pystac.Catalog):
+            stac_io = self._stac_io
+        return pystac.stac_io.DefaultAsyncStacIO(stac_io)
+
     def save_object(
         self,
         include_self_link: bool = True,
         dest_href: str | None = None,
         stac_io: pystac.StacIO | None = None,
+        compact: bool | None = None,
+        sort_keys: bool | None = None,
     ) -> None:
         """Saves this :class:`STACObject` to it's 'self' HREF.
 
@@ -449,6 +540,11 @@ class STACObject(ABC):
             stac_io: Optional instance of StacIO to use. If not provided, will use the
                 instance set on the object's root if available, otherwise will use the
                 default instance.
+            compact : If ``True``, write the JSON without indentation or whitespace.
+                Defaults to the ``compact`` attribute of the :class:`~pystac.StacIO`.
+            sort_keys : If ``True``, write the keys of JSON objects in sorted order.
+                Defaults to the ``sort_keys`` attribute of the
+                :class:`~pystac.StacIO`.
 
 
         Raises:
@@ -459,6 +555,16 @@ class STACObject(ABC):
             section of the STAC best practices document
             <best-practices.md#use-of-links>`
         """
+        stac_io, dest_href = self._get_save_target(stac_io, dest_href)
+        stac_io.save_json(
+            dest_href,
+            self.to_dict(include_self_link=include_self_link),
+            **_json_options(compact, sort_keys),
+        )
+
+    def _get_save_target(
+        self, stac_io: pystac.StacIO | None, dest_href: str | None
+    ) -> tuple[pystac.StacIO, str]:
         if stac_io is None:
             root = self.get_root()
             if root is not None:
@@ -477,7 +583,7 @@ class STACObject(ABC):
                 )
             dest_href = self_href
 
-        stac_io.save_json(dest_href, self.to_dict(include_self_link=include_self_link))
+        return stac_io, dest_href
 
     def full_copy(
         self,
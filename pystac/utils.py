@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import os
 import posixpath
+import re
+import sys
 import warnings
 from collections.abc import Callable
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import (
     Any,
     TypeAlias,
@@ -16,6 +19,7 @@ from urllib.parse import ParseResult as URLParseResult
 from urllib.parse import urljoin, urlparse, urlunparse
 
 import dateutil.parser
+import dateutil.tz
 
 from pystac.errors import RequiredPropertyMissing
 
@@ -432,6 +436,33 @@ def str_to_datetime(s: str) -> datetime:
     Returns:
         str: The :class:`datetime.datetime` represented the by the string.
     """
+    return _str_to_datetime(s)
+
+
+# The canonical RFC 3339 timestamps written by PySTAC and most STAC producers
+_RFC3339_UTC = re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(\.\d{1,6})?Z")
+# The timestamps that datetime_to_str returns for the UTC datetimes they are parsed
+# to, which have either no or six fractional digits
+_DATETIME_STR_UTC = re.compile(
+    r"\d{4}-\d{2}-\d{2}T(?!24)\d{2}:\d{2}:\d{2}(\.(?!0{6})\d{6})?Z"
+)
+
+
+@lru_cache(maxsize=1024)
+def _str_to_datetime(s: str) -> datetime:
+    # Memoized, as catalogs often repeat the same timestamps. Anything that is not
+    # a canonical UTC timestamp, or that datetime.fromisoformat rejects, is parsed
+    # by dateutil, and the result is the same as dateutil's in both cases.
+    match = _RFC3339_UTC.fullmatch(s) if isinstance(s, str) else None
+    if match is not None:
+        timestamp, fraction = match.groups()
+        if fraction is not None:
+            # Python < 3.11 only parses 3 or 6 fractional digits
+            timestamp += fraction.ljust(7, "0")
+        try:
+            return datetime.fromisoformat(timestamp).replace(tzinfo=dateutil.tz.UTC)
+        except ValueError:
+            pass
     return dateutil.parser.isoparse(s)
 
 
@@ -612,3 +643,33 @@ def _is_url(href: str) -> bool:
     """Checks if an HREF is a url rather than a local path"""
     parsed = safe_urlparse(href)
     return parsed.scheme not in ["", "file"]
+
+
+def _intern(value: T) -> T:
+    """Interns plain strings, such as link rels and media types, which repeat across
+    many objects. Other values, including ``str`` enums, are returned unchanged."""
+    if type(value) is str:
+        return cast(T, sys.intern(value))
+    return value
+
+
+def _intern_all(values: list[T] | None) -> list[T] | None:
+    """Returns a copy of ``values`` with its plain strings interned, e.g. for the
+    ``stac_extensions`` or ``roles`` of deserialized objects."""
+    if not isinstance(values, list):
+        return values
+    return [_intern(v) for v in values]
+
+
+def _intern_keys(value: Any) -> Any:
+    """Returns a copy of ``value`` with the keys of all nested dicts interned, so
+    that the property and asset keys repeated across many objects share one string.
+    """
+    if isinstance(value, dict):
+        return {
+            (sys.intern(k) if type(k) is str else k): _intern_keys(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_intern_keys(v) for v in value]
+    return value
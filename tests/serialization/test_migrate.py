@@ -1,20 +1,29 @@
+from typing import Any
+
 import pytest
 
 import pystac
 from pystac import ExtensionTypeError
 from pystac.cache import CollectionCache
+from pystac.extensions.hooks import ExtensionHooks
 from pystac.extensions.item_assets import ItemAssetsExtension
+from pystac.extensions.version import VersionExtensionHooks
 from pystac.extensions.view import ViewExtension
 from pystac.serialization import (
     identify_stac_object,
     identify_stac_object_type,
     merge_common_properties,
+    migrate,
     migrate_to_latest,
+    needs_migration,
 )
+from pystac.serialization.identify import STACJSONDescription, STACVersionID
 from pystac.utils import get_required, str_to_datetime
 from tests.utils import TestCases
 from tests.utils.test_cases import ExampleInfo
 
+SCHEMA_URI = "https://example.com/v2.0/needs-migration-schema.json"
+
 
 class TestMigrate:
     @pytest.mark.parametrize("example", TestCases.get_examples_info())
@@ -129,3 +138,109 @@ def test_migrate_updates_license_from_proprietary() -> None:
 
     collection = pystac.Collection.from_file(path)
     assert collection.license == "other"
+
+
+@pytest.mark.parametrize("example", TestCases.get_examples_info())
+def test_needs_migration(example: ExampleInfo) -> None:
+    d = pystac.StacIO.default().read_json(example.path)
+    migrated_d = migrate_to_latest(d, identify_stac_object(d))
+
+    assert not needs_migration(migrated_d)
+    if not needs_migration(d):
+        assert migrated_d == d
+
+
+def test_current_item_does_not_need_migration(sample_item: pystac.Item) -> None:
+    d = sample_item.to_dict()
+    assert not needs_migration(d)
+
+    item = pystac.Item.from_dict(d, preserve_dict=True)
+    item.properties["foo"] = "bar"
+    assert "foo" not in d["properties"]
+
+
+def test_needs_migration_with_custom_migrate_hook(sample_item: pystac.Item) -> None:
+    class MigratingHooks(ExtensionHooks):
+        schema_uri = SCHEMA_URI
+        prev_extension_ids: set[str] = set()
+        stac_object_types = {pystac.STACObjectType.ITEM}
+
+        def migrate(
+            self,
+            obj: dict[str, Any],
+            version: STACVersionID,
+            info: STACJSONDescription,
+        ) -> None:
+            obj["properties"]["migrated"] = True
+            super().migrate(obj, version, info)
+
+    d = sample_item.to_dict()
+    pystac.EXTENSION_HOOKS.add_extension_hooks(MigratingHooks())
+    try:
+        assert needs_migration(d)
+        item = pystac.Item.from_dict(d, migrate=True)
+    finally:
+        pystac.EXTENSION_HOOKS.remove_extension_hooks(SCHEMA_URI)
+
+    assert item.properties["migrated"]
+    assert not needs_migration(d)
+
+
+def test_migration_plan_lists_only_applicable_hooks() -> None:
+    object_type = pystac.STACObjectType.ITEM
+    plan = pystac.EXTENSION_HOOKS._get_migration_plan(object_type, frozenset())
+    assert plan is pystac.EXTENSION_HOOKS._get_migration_plan(object_type, frozenset())
+    assert all(type(hooks).migrate is not ExtensionHooks.migrate for hooks in plan)
+
+    # The version hooks only migrate the previous extension ID
+    plan = pystac.EXTENSION_HOOKS._get_migration_plan(
+        object_type, frozenset(["version"])
+    )
+    assert any(isinstance(hooks, VersionExtensionHooks) for hooks in plan)
+
+
+def test_migration_plan_is_rebuilt_when_hooks_change() -> None:
+    object_type = pystac.STACObjectType.ITEM
+    plan = pystac.EXTENSION_HOOKS._get_migration_plan(object_type, frozenset())
+
+    class MigratingHooks(ExtensionHooks):
+        schema_uri = SCHEMA_URI
+        prev_extension_ids: set[str] = set()
+        stac_object_types = {pystac.STACObjectType.ITEM}
+
+        def migrate(
+            self,
+            obj: dict[str, Any],
+            version: STACVersionID,
+            info: STACJSONDescription,
+        ) -> None:
+            obj["properties"]["migrated"] = True
+            super().migrate(obj, version, info)
+
+    hooks = MigratingHooks()
+    pystac.EXTENSION_HOOKS.add_extension_hooks(hooks)
+    try:
+        assert hooks in pystac.EXTENSION_HOOKS._get_migration_plan(
+            object_type, frozenset()
+        )
+    finally:
+        pystac.EXTENSION_HOOKS.remove_extension_hooks(SCHEMA_URI)
+    assert pystac.EXTENSION_HOOKS._get_migration_plan(object_type, frozenset()) == plan
+
+
+def test_cached_migrations_are_read_only() -> None:
+    object_migrations = migrate._get_object_migrations()
+    removed_extension_migrations = migrate._get_removed_extension_migrations()
+    plan = migrate._get_migration_plan(
+        pystac.STACObjectType.COLLECTION, "0.9.0", frozenset(["eo", "dtr"])
+    )
+    assert set(plan.removed_extensions) == {"eo", "dtr"}
+    for mapping in (
+        object_migrations,
+        removed_extension_migrations,
+        plan.removed_extensions,
+    ):
+        with pytest.raises(TypeError):
+            mapping["other"] = None  # type: ignore
+    assert migrate._get_object_migrations() == object_migrations
+    assert "other" not in migrate._get_removed_extension_migrations()
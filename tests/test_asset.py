@@ -1,4 +1,6 @@
 import os
+import pickle
+from copy import deepcopy
 from pathlib import Path
 
 import pytest
@@ -102,3 +104,35 @@ def test_delete_asset_relative_no_owner_fails(tmp_asset: pystac.Asset) -> None:
 
     assert asset.href in str(e.value)
     assert os.path.exists(href)
+
+
+def test_asset_is_compact() -> None:
+    asset = pystac.Asset.from_dict({"href": "data.tif", "type": "image/tiff"})
+    other = pystac.Asset.from_dict({"href": "data.tif", "type": "image/tiff"})
+    assert not hasattr(asset, "__dict__")
+    assert asset.media_type is other.media_type
+
+    assert asset._extra_fields is None
+    asset.extra_fields["foo"] = "bar"
+    assert other.extra_fields == {}
+    assert asset.to_dict()["foo"] == "bar"
+    assert asset.clone().extra_fields == {"foo": "bar"}
+    assert deepcopy(asset).to_dict() == asset.to_dict()
+
+
+def test_asset_extra_fields_round_trip() -> None:
+    d = {"href": "data.tif", "roles": ["data"], "foo": {"bar": [1, 2]}}
+    asset = pystac.Asset.from_dict(d)
+    assert asset.extra_fields == {"foo": {"bar": [1, 2]}}
+    assert asset.to_dict() == d
+    assert pystac.Asset.from_dict(asset.to_dict()).to_dict() == d
+
+    # Created on first access, and written once it has fields
+    asset = pystac.Asset("data.tif")
+    assert asset.extra_fields == {}
+    assert "foo" not in asset.to_dict()
+    asset.extra_fields["foo"] = ["bar"]
+    assert pystac.Asset.from_dict(asset.to_dict()).extra_fields == {"foo": ["bar"]}
+    for copied in (pickle.loads(pickle.dumps(asset)), deepcopy(asset), asset.clone()):
+        assert copied.extra_fields == {"foo": ["bar"]}
+        assert copied.extra_fields["foo"] is not asset.extra_fields["foo"]
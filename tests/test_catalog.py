@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import posixpath
 import tempfile
+import threading
+import time
 import unittest
 from collections import defaultdict
 from collections.abc import Iterator
@@ -31,7 +34,9 @@ from pystac.layout import (
     HrefLayoutStrategy,
     TemplateLayoutStrategy,
 )
+from pystac.stac_io import DefaultAsyncStacIO, DefaultStacIO
 from pystac.utils import (
+    HREF,
     is_absolute_href,
     make_absolute_href,
     make_posix_style,
@@ -2030,3 +2035,388 @@ def test_get_root_link_cares_about_media_type(catalog: pystac.Catalog) -> None:
     )
     root_link = catalog.get_root_link()
     assert root_link and root_link.target != "./self.json"
+
+
+def test_walk_async_matches_walk(test_case_1_catalog: Catalog) -> None:
+    expected = [
+        (root.id, [c.id for c in children], [i.id for i in items])
+        for root, children, items in TestCases.case_1().walk()
+    ]
+
+    async def walk() -> list[tuple[str, list[str], list[str]]]:
+        return [
+            (root.id, [c.id for c in children], [i.id for i in items])
+            async for root, children, items in test_case_1_catalog.walk_async()
+        ]
+
+    assert asyncio.run(walk()) == expected
+
+
+def test_get_items_async(test_case_1_catalog: Catalog) -> None:
+    expected = [item.id for item in TestCases.case_1().get_items(recursive=True)]
+
+    async def get_items(*ids: str) -> list[str]:
+        return [
+            item.id
+            async for item in test_case_1_catalog.get_items_async(*ids, recursive=True)
+        ]
+
+    assert asyncio.run(get_items()) == expected
+    assert asyncio.run(get_items("area-2-1-imagery", "area-1-1-labels")) == [
+        "area-1-1-labels",
+        "area-2-1-imagery",
+    ]
+
+
+def test_walk_async_populates_resolved_object_cache(
+    test_case_1_catalog: Catalog,
+) -> None:
+    stac_io = MockStacIO()
+    test_case_1_catalog._stac_io = stac_io
+
+    async def walk() -> None:
+        async for _ in test_case_1_catalog.walk_async(
+            stac_io=DefaultAsyncStacIO(stac_io, max_concurrency=4)
+        ):
+            pass
+
+    asyncio.run(walk())
+    read_count = stac_io.mock.read_text.call_count
+    assert read_count > 0
+    for _, children, items in test_case_1_catalog.walk():
+        for obj in [*children, *items]:
+            href = obj.get_self_href()
+            assert href is not None
+            assert test_case_1_catalog._resolved_objects.get_by_href(href) is obj
+    # Everything is resolved and cached now, so walking again reads nothing.
+    asyncio.run(walk())
+    assert stac_io.mock.read_text.call_count == read_count
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_walk_with_max_workers(max_workers: int) -> None:
+    expected = [
+        (root.id, [c.id for c in children], [i.id for i in items])
+        for root, children, items in TestCases.case_1().walk()
+    ]
+    actual = [
+        (root.id, [c.id for c in children], [i.id for i in items])
+        for root, children, items in TestCases.case_1().walk(max_workers=max_workers)
+    ]
+    assert actual == expected
+
+
+def test_walk_with_max_workers_consumed_after_walk() -> None:
+    # The children and items of a finished walk are read without its executor
+    expected = [
+        (root.id, [c.id for c in children], [i.id for i in items])
+        for root, children, items in list(TestCases.case_1().walk())
+    ]
+    walked = list(TestCases.case_1().walk(max_workers=2))
+    actual = [
+        (root.id, [c.id for c in children], [i.id for i in items])
+        for root, children, items in walked
+    ]
+    assert actual == expected
+    assert any(items for _, _, items in expected)
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_get_items_with_max_workers_merges_common_properties(
+    tmp_path: Path, max_workers: int | None
+) -> None:
+    # The item only names its collection, which is found in the root's cache
+    extent = {
+        "spatial": {"bbox": [[-180, -90, 180, 90]]},
+        "temporal": {"interval": [["2020-01-01T00:00:00Z", None]]},
+    }
+    files = {
+        "catalog.json": {
+            "stac_version": "0.9.0",
+            "id": "root",
+            "description": "root",
+            "links": [{"rel": "child", "href": "./col/collection.json"}],
+        },
+        "col/collection.json": {
+            "stac_version": "0.9.0",
+            "stac_extensions": ["commons"],
+            "id": "a-collection",
+            "description": "a collection",
+            "license": "MIT",
+            "extent": extent,
+            "properties": {"eo:gsd": 30},
+            "links": [{"rel": "item", "href": "./item/item.json"}],
+        },
+        "col/item/item.json": {
+            "stac_version": "0.9.0",
+            "stac_extensions": ["commons"],
+            "type": "Feature",
+            "id": "an-item",
+            "collection": "a-collection",
+            "geometry": None,
+            "properties": {"datetime": "2020-01-01T00:00:00Z"},
+            "links": [],
+            "assets": {},
+        },
+    }
+    for name, d in files.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(json.dumps(d))
+
+    catalog = Catalog.from_file(str(tmp_path / "catalog.json"))
+    items = list(catalog.get_items(recursive=True, max_workers=max_workers))
+    assert [item.properties.get("gsd") for item in items] == [30]
+
+
+def test_get_items_with_max_workers_reads_in_threads(
+    test_case_1_catalog: Catalog,
+) -> None:
+    expected = [item.id for item in TestCases.case_1().get_items(recursive=True)]
+
+    thread_names: set[str] = set()
+
+    class ThreadRecordingStacIO(MockStacIO):
+        def read_text(self, source: Any, *args: Any, **kwargs: Any) -> str:
+            thread_names.add(threading.current_thread().name)
+            return super().read_text(source, *args, **kwargs)
+
+    test_case_1_catalog._stac_io = ThreadRecordingStacIO()
+    items = test_case_1_catalog.get_items(recursive=True, max_workers=4)
+    assert [item.id for item in items] == expected
+    assert thread_names
+    assert threading.current_thread().name not in thread_names
+    assert list(test_case_1_catalog.get_children(max_workers=2)) == list(
+        test_case_1_catalog.get_children()
+    )
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_get_items_with_prefetch_reads_ahead_within_window(
+    tmp_path: Path, max_workers: int | None
+) -> None:
+    catalog = Catalog("root", "root")
+    for i in range(10):
+        catalog.add_item(pystac.Item(f"item-{i}", None, None, datetime(2020, 1, 1), {}))
+    catalog.normalize_and_save(str(tmp_path), CatalogType.SELF_CONTAINED)
+
+    read_hrefs: list[str] = []
+    lock = threading.Lock()
+
+    class RecordingStacIO(DefaultStacIO):
+        def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+            with lock:
+                read_hrefs.append(str(source))
+            return super().read_text(source, *args, **kwargs)
+
+    catalog = Catalog.from_file(
+        str(tmp_path / "catalog.json"), stac_io=RecordingStacIO()
+    )
+    read_hrefs.clear()
+    ids = []
+    for n, item in enumerate(catalog.get_items(prefetch=2, max_workers=max_workers)):
+        # The item being handled plus at most two links ahead
+        assert len(read_hrefs) <= n + 3
+        ids.append(item.id)
+    assert ids == [f"item-{i}" for i in range(10)]
+    assert len(read_hrefs) == 10
+
+    with pytest.raises(ValueError):
+        list(catalog.get_children(prefetch=0))
+
+
+def test_walk_with_prefetch() -> None:
+    expected = [
+        (root.id, [c.id for c in children], [i.id for i in items])
+        for root, children, items in TestCases.case_1().walk()
+    ]
+    actual = [
+        (root.id, [c.id for c in children], [i.id for i in items])
+        for root, children, items in TestCases.case_1().walk(prefetch=1)
+    ]
+    assert actual == expected
+
+
+def test_walk_with_prefetch_consumed_after_walk(tmp_path: Path) -> None:
+    catalog = Catalog("root", "root")
+    for i in range(10):
+        catalog.add_item(pystac.Item(f"item-{i}", None, None, datetime(2020, 1, 1), {}))
+    catalog.normalize_and_save(str(tmp_path), CatalogType.SELF_CONTAINED)
+    href = str(tmp_path / "catalog.json")
+    expected = [f"item-{i}" for i in range(10)]
+
+    walked = list(Catalog.from_file(href).walk(prefetch=2))
+    assert [item.id for item in walked[0][2]] == expected
+
+    class SlowStacIO(DefaultStacIO):
+        def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+            time.sleep(0.01)
+            return super().read_text(source, *args, **kwargs)
+
+    # Reads that were read ahead, but not started, are cancelled when the walk
+    # ends, and are read again by the items
+    catalog = Catalog.from_file(href, stac_io=SlowStacIO())
+    walk = iter(catalog.walk(max_workers=1, prefetch=3))
+    _, _, items = next(walk)
+    remaining = iter(items)
+    first = next(remaining)
+    list(walk)
+    assert [first.id, *(item.id for item in remaining)] == expected
+
+
+def test_fully_resolve_with_max_workers(
+    tmp_path: Path, test_case_1_catalog: Catalog
+) -> None:
+    test_case_1_catalog.fully_resolve(max_workers=4)
+    test_case_1_catalog.save(dest_href=str(tmp_path))
+    assert len(list(tmp_path.glob("**/*.json"))) == 15
+
+
+def test_get_items_with_max_workers_unresolvable_link(catalog: Catalog) -> None:
+    catalog.add_link(pystac.Link("item", "/not/a/path/item.json"))
+    with pytest.raises(STACError):
+        list(catalog.get_items(max_workers=2))
+
+
+def test_save_with_max_workers_matches_sequential(
+    tmp_path: Path, test_case_1_catalog: Catalog
+) -> None:
+    test_case_1_catalog.fully_resolve()
+    test_case_1_catalog.save(
+        CatalogType.SELF_CONTAINED, dest_href=str(tmp_path / "sequential")
+    )
+    test_case_1_catalog.save(
+        CatalogType.SELF_CONTAINED, dest_href=str(tmp_path / "parallel"), max_workers=4
+    )
+    sequential = {
+        p.relative_to(tmp_path / "sequential"): p.read_text()
+        for p in (tmp_path / "sequential").glob("**/*.json")
+    }
+    parallel = {
+        p.relative_to(tmp_path / "parallel"): p.read_text()
+        for p in (tmp_path / "parallel").glob("**/*.json")
+    }
+    assert len(sequential) == 15
+    assert parallel == sequential
+
+
+def test_normalize_and_save_with_max_workers(
+    tmp_path: Path, test_case_1_catalog: Catalog
+) -> None:
+    test_case_1_catalog.normalize_and_save(
+        str(tmp_path), CatalogType.SELF_CONTAINED, max_workers=2
+    )
+    catalog = Catalog.from_file(str(tmp_path / "catalog.json"))
+    assert len(list(catalog.get_items(recursive=True))) == len(
+        list(test_case_1_catalog.get_items(recursive=True))
+    )
+
+
+def test_save_with_max_workers_reports_all_failures(
+    tmp_path: Path, test_case_1_catalog: Catalog
+) -> None:
+    class FailingStacIO(DefaultStacIO):
+        def write_text(self, dest: HREF, txt: str, *args: Any, **kwargs: Any) -> None:
+            if os.path.basename(str(dest)).startswith("area-1-1"):
+                raise OSError("disk full")
+            super().write_text(dest, txt, *args, **kwargs)
+
+    test_case_1_catalog.normalize_hrefs(str(tmp_path))
+    with pytest.raises(pystac.STACSaveError) as excinfo:
+        test_case_1_catalog.save(
+            CatalogType.SELF_CONTAINED, stac_io=FailingStacIO(), max_workers=4
+        )
+    failures = excinfo.value.failures
+    assert len(failures) == 2
+    assert all(isinstance(e, OSError) for e in failures.values())
+    # Everything else was still written
+    assert len(list(tmp_path.glob("**/*.json"))) == 13
+
+
+def test_save_compact_sorted(tmp_path: Path, test_case_1_catalog: Catalog) -> None:
+    test_case_1_catalog.normalize_and_save(
+        str(tmp_path), CatalogType.SELF_CONTAINED, compact=True, sort_keys=True
+    )
+    paths = list(tmp_path.glob("**/*.json"))
+    assert len(paths) == 15
+    for path in paths:
+        txt = path.read_text()
+        assert "\n" not in txt
+        d = json.loads(txt)
+        assert list(d) == sorted(d)
+
+
+def test_save_compact_from_stac_io(
+    tmp_path: Path, test_case_1_catalog: Catalog
+) -> None:
+    test_case_1_catalog.normalize_hrefs(str(tmp_path))
+    test_case_1_catalog.save(
+        CatalogType.SELF_CONTAINED,
+        stac_io=DefaultStacIO(compact=True),
+        max_workers=2,
+    )
+    assert all("\n" not in path.read_text() for path in tmp_path.glob("**/*.json"))
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_incremental_save(
+    tmp_path: Path, test_case_1_catalog: Catalog, max_workers: int | None
+) -> None:
+    result = test_case_1_catalog.normalize_and_save(
+        str(tmp_path), CatalogType.SELF_CONTAINED, max_workers=max_workers
+    )
+    assert result == pystac.SaveResult(written=15, skipped=0)
+    paths = list(tmp_path.glob("**/*.json"))
+    for path in paths:
+        os.utime(path, (0, 0))
+
+    item = next(test_case_1_catalog.get_items(recursive=True))
+    item.properties["incremental"] = True
+    result = test_case_1_catalog.save(incremental=True, max_workers=max_workers)
+    assert result == pystac.SaveResult(written=1, skipped=14)
+    changed = [p for p in paths if p.stat().st_mtime != 0]
+    assert changed == [Path(item.self_href)]
+    assert pystac.Item.from_file(item.self_href).properties["incremental"]
+
+    # Files that are missing or were edited are written again
+    Path(item.self_href).unlink()
+    (tmp_path / "catalog.json").write_text("{}")
+    result = test_case_1_catalog.save(incremental=True, max_workers=max_workers)
+    assert result == pystac.SaveResult(written=2, skipped=13)
+    assert pystac.Item.from_file(item.self_href).properties["incremental"]
+    assert Catalog.from_file(str(tmp_path / "catalog.json")).id == (
+        test_case_1_catalog.id
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"max_workers": 2},
+        {"incremental": True},
+        {"max_workers": 2, "incremental": True},
+    ],
+)
+def test_save_calls_overridden_save_object(
+    tmp_path: Path, kwargs: dict[str, Any]
+) -> None:
+    saved: list[str] = []
+
+    class RecordingItem(pystac.Item):
+        def save_object(self, *args: Any, **kwargs: Any) -> None:
+            saved.append(self.id)
+            super().save_object(*args, **kwargs)
+
+    catalog = Catalog("root", "root")
+    for i in range(3):
+        catalog.add_item(
+            RecordingItem(f"item-{i}", None, None, datetime(2020, 1, 1), {})
+        )
+    result = catalog.normalize_and_save(
+        str(tmp_path), CatalogType.SELF_CONTAINED, **kwargs
+    )
+    assert saved == ["item-0", "item-1", "item-2"]
+    assert result == pystac.SaveResult(written=4, skipped=0)
+    assert pystac.Item.from_file(str(tmp_path / "item-0" / "item-0.json")).id == (
+        "item-0"
+    )
@@ -665,6 +665,21 @@ def test_pickle_with_only_href_links(item: Item) -> None:
         assert str(original.target) == str(new.target)
 
 
+def test_pickle_state_uses_attribute_names_of_earlier_versions(
+    sample_item_dict: dict[str, Any],
+) -> None:
+    # Pickles have to load in earlier versions, where links and assets are
+    # plain attributes
+    item = Item._from_dict(sample_item_dict, lazy=True)
+    state = item.__getstate__()
+    assert "links" in state and "assets" in state
+    assert not {"_links", "_assets", "_raw_links", "_raw_assets"} & set(state)
+    assert list(state["assets"]) == list(sample_item_dict["assets"])
+    assert [link["rel"] for link in state["links"]] == [
+        link["rel"] for link in sample_item_dict["links"]
+    ]
+
+
 def test_copy_with_unresolveable_root(item: Item) -> None:
     item.add_link(
         pystac.Link(
@@ -686,3 +701,188 @@ def test_migrate_by_default() -> None:
         data = json.load(f)
     item = pystac.Item.from_dict(data)  # default used to be migrate=False
     assert item.ext.proj.code == "EPSG:32614"
+
+
+def test_lazy_item_from_stac_io() -> None:
+    href = TestCases.get_path("data-files/item/sample-item.json")
+    eager = Item.from_file(href)
+    stac_io = pystac.StacIO.default()
+    stac_io.lazy_items = True
+    item = stac_io.read_stac_object(href)
+    assert isinstance(item, Item)
+    assert item._raw_assets is not None
+    assert item._raw_links is not None
+    assert item.id == eager.id
+    assert item.bbox == eager.bbox
+    assert item.datetime == eager.datetime
+
+    assert item.assets["thumbnail"].owner is item
+    assert item._raw_assets is None
+    assert [link.to_dict() for link in item.links] == [
+        link.to_dict() for link in eager.links
+    ]
+    assert all(link.owner is item for link in item.links)
+    assert item.to_dict() == eager.to_dict()
+
+
+def test_lazy_item_changes_before_access(sample_item_dict: dict[str, Any]) -> None:
+    item = Item._from_dict(sample_item_dict, lazy=True)
+    item.add_asset("new", Asset("new.tif"))
+    item.add_link(Link("related", "https://example.com"))
+    assert list(item.assets) == ["analytic", "thumbnail", "new"]
+    assert item.links[-1].rel == "related"
+    assert len(item.links) == len(sample_item_dict["links"]) + 1
+
+    item = Item._from_dict(sample_item_dict, lazy=True)
+    item.assets = {}
+    item.clear_links()
+    assert "assets" not in item.to_dict() or item.to_dict()["assets"] == {}
+    assert item.to_dict()["links"] == []
+
+
+def test_lazy_item_pickle_and_clone(sample_item_dict: dict[str, Any]) -> None:
+    item = Item._from_dict(sample_item_dict, lazy=True)
+    roundtripped = pickle.loads(pickle.dumps(item))
+    assert roundtripped.to_dict() == item.to_dict()
+
+    item = Item._from_dict(sample_item_dict, lazy=True)
+    assert item.clone().to_dict() == Item.from_dict(sample_item_dict).to_dict()
+
+
+def test_lazy_item_to_dict_serializes_like_eager_item(
+    sample_item_dict: dict[str, Any],
+) -> None:
+    for link in sample_item_dict["links"]:
+        link["title"] = None
+    for asset in sample_item_dict["assets"].values():
+        asset.update(description=None, roles=None)
+    eager = Item.from_dict(deepcopy(sample_item_dict))
+    lazy = Item._from_dict(sample_item_dict, lazy=True)
+    assert json.dumps(lazy.to_dict()) == json.dumps(eager.to_dict())
+    assert json.dumps(lazy.to_dict(transform_hrefs=False)) == json.dumps(
+        eager.to_dict(transform_hrefs=False)
+    )
+
+
+def test_lazy_items_in_traversal() -> None:
+    catalog = pystac.Catalog.from_file(
+        TestCases.get_path("data-files/catalogs/test-case-1/catalog.json"),
+        stac_io=pystac.stac_io.DefaultStacIO(lazy_items=True),
+    )
+    expected = {
+        item.id: item.to_dict() for item in TestCases.case_1().get_items(recursive=True)
+    }
+    items = list(catalog.get_items(recursive=True))
+    assert items
+    assert all(item._raw_assets is not None for item in items)
+    assert {item.id: item.to_dict() for item in items} == expected
+
+
+def test_lazy_item_to_dict_reuses_unchanged_sections(
+    sample_item_dict: dict[str, Any],
+) -> None:
+    href = TestCases.get_path("data-files/item/sample-item.json")
+    eager = Item.from_dict(deepcopy(sample_item_dict), href=href)
+    item = Item._from_dict(sample_item_dict, href=href, lazy=True, preserve_dict=False)
+    item.properties["title"] = "A new title"
+    eager.properties["title"] = "A new title"
+    assert item.get_self_href() == href
+
+    d = item.to_dict(include_self_link=False)
+    assert d == eager.to_dict(include_self_link=False)
+    assert item._raw_links is not None
+    assert item._raw_assets is not None
+
+    # The result does not share the dicts the item was read from
+    d["assets"]["thumbnail"]["changed"] = True
+    d["links"][0]["changed"] = True
+    assert "changed" not in sample_item_dict["assets"]["thumbnail"]
+    assert "changed" not in sample_item_dict["links"][0]
+    assert item.to_dict(include_self_link=False) == eager.to_dict(
+        include_self_link=False
+    )
+    assert item._raw_links is not None
+
+    item.datetime = get_opt(item.datetime) + dateutil.relativedelta.relativedelta(
+        days=1
+    )
+    item.assets["thumbnail"].title = "A thumbnail"
+    d = item.to_dict(include_self_link=False)
+    assert d["assets"]["thumbnail"]["title"] == "A thumbnail"
+    assert d["properties"]["datetime"] == datetime_to_str(item.datetime)
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    (
+        "2016-05-03T13:22:30Z",
+        "2016-05-03T13:22:30.040000Z",
+        "2016-05-03T13:22:30.000Z",
+        "2016-05-03T13:22:30.040Z",
+        "2016-05-03T13:22:30.000000Z",
+        "2016-05-03T13:22:30+00:00",
+        "2016-05-03T15:22:30+02:00",
+        "2016-05-03T13:22:30z",
+        "2016-05-03T24:00:00Z",
+    ),
+)
+def test_lazy_item_to_dict_datetime_matches_eager(
+    sample_item_dict: dict[str, Any], timestamp: str
+) -> None:
+    sample_item_dict["properties"]["datetime"] = timestamp
+    eager = Item.from_dict(sample_item_dict)
+    lazy = Item._from_dict(sample_item_dict, lazy=True)
+    assert lazy.to_dict() == eager.to_dict()
+
+
+def test_lazy_item_to_dict_normalizes_links_and_assets(
+    sample_item_dict: dict[str, Any],
+) -> None:
+    sample_item_dict["links"] = [
+        {"href": "./collection.json", "rel": "collection", "type": None},
+        {"rel": "license", "href": "https://example.com", "title": None, "a": 1},
+        {"rel": "related", "href": "./related.json", "type": "application/json"},
+    ]
+    sample_item_dict["assets"] = {
+        "data": {"href": "./data.tif", "title": None, "roles": None, "a": None},
+        "metadata": {"roles": ["metadata"], "href": "./metadata.xml", "a": 1},
+        "thumbnail": {"href": "./thumbnail.png", "type": "image/png", "a": 1},
+    }
+    eager = Item.from_dict(deepcopy(sample_item_dict)).to_dict()
+    lazy = Item._from_dict(sample_item_dict, lazy=True).to_dict()
+    assert lazy == eager
+    assert [list(link) for link in lazy["links"]] == [
+        list(link) for link in eager["links"]
+    ]
+    assert [list(asset) for asset in lazy["assets"].values()] == [
+        list(asset) for asset in eager["assets"].values()
+    ]
+    assert eager["links"][0] == {"rel": "collection", "href": "./collection.json"}
+    assert eager["assets"]["data"] == {"href": "./data.tif", "a": None}
+
+
+def test_lazy_item_keeps_relative_asset_hrefs_valid(
+    sample_item_dict: dict[str, Any],
+) -> None:
+    sample_item_dict["assets"]["analytic"]["href"] = "./data/analytic.tif"
+    eager = Item.from_dict(sample_item_dict, href="/a/b/item.json")
+    lazy = Item._from_dict(sample_item_dict, href="/a/b/item.json", lazy=True)
+    for item in (eager, lazy):
+        item.set_self_href("/a/c/item.json")
+        item.set_self_href("/a/c/d/item.json")
+    assert lazy.assets["analytic"].href == "../../b/data/analytic.tif"
+    assert lazy.to_dict() == eager.to_dict()
+
+
+def test_from_dict_interns_stac_vocabulary(sample_item_dict: dict[str, Any]) -> None:
+    sample_item_dict["stac_extensions"] = [
+        "https://stac-extensions.github.io/eo/v1.1.0/schema.json"
+    ]
+    sample_item_dict["assets"] = {"data": {"href": "data.tif", "roles": ["data"]}}
+    first, second = (
+        Item.from_dict(json.loads(json.dumps(sample_item_dict))) for _ in range(2)
+    )
+    assert first.stac_extensions[0] is second.stac_extensions[0]
+    assert first.collection_id is second.collection_id
+    assert first.assets["data"].roles[0] is second.assets["data"].roles[0]  # type: ignore
+    assert first.links[0].rel is second.links[0].rel
@@ -1,3 +1,6 @@
+import pickle
+from copy import deepcopy
+
 import pytest
 
 from pystac import Collection
@@ -220,3 +223,43 @@ def test_item_assets_extension_asset_definition_is_deprecated() -> None:
     assert asset_definition.ext.eo.bands
     assert asset_definition.ext.eo.bands[0].name == "B1"
     assert asset_definition.owner is None
+
+
+def test_item_asset_definition_is_compact() -> None:
+    asset_defn = ItemAssetDefinition.create(
+        title="Data", description=None, media_type="image/tiff", roles=["data"]
+    )
+    assert not hasattr(asset_defn, "__dict__")
+    assert asset_defn.to_dict() == {
+        "title": "Data",
+        "type": "image/tiff",
+        "roles": ["data"],
+    }
+
+
+def test_item_asset_definition_extra_fields_round_trip() -> None:
+    asset_defn = ItemAssetDefinition.create(
+        title="Data",
+        description=None,
+        media_type=None,
+        roles=None,
+        extra_fields={"foo": {"bar": [1, 2]}},
+    )
+    d = {"title": "Data", "foo": {"bar": [1, 2]}}
+    assert asset_defn.to_dict() == d
+    assert ItemAssetDefinition(asset_defn.to_dict()).to_dict() == d
+
+    # Fields can be added to a definition that has none
+    asset_defn = ItemAssetDefinition({})
+    assert asset_defn.to_dict() == {}
+    asset_defn.apply(
+        title=None,
+        description=None,
+        media_type=None,
+        roles=None,
+        extra_fields={"foo": "bar"},
+    )
+    for copied in (pickle.loads(pickle.dumps(asset_defn)), deepcopy(asset_defn)):
+        assert copied.to_dict() == {"foo": "bar"}
+        assert copied.properties is not asset_defn.properties
+    assert asset_defn.create_asset("data.tif").extra_fields == {"foo": "bar"}
@@ -1,6 +1,8 @@
 import json
+import os
 from copy import deepcopy
 from os.path import relpath
+from pathlib import Path
 from typing import Any, cast
 
 import pytest
@@ -199,6 +201,62 @@ def test_from_dict_sets_root(item_collection_dict: dict[str, Any]) -> None:
         assert item.get_root() == catalog
 
 
+def test_from_dict_with_max_workers(
+    item_collection_dict: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(pystac.item_collection, "_MIN_CHUNK_SIZE", 1)
+    param_dict = deepcopy(item_collection_dict)
+    param_dict["features"] *= 5
+    catalog = pystac.Catalog(id="test", description="test desc")
+    expected = ItemCollection.from_dict(param_dict, root=catalog)
+    item_collection = ItemCollection.from_dict(
+        param_dict, preserve_dict=False, root=catalog, max_workers=2
+    )
+    assert param_dict["features"] == item_collection_dict["features"] * 5
+    assert item_collection.to_dict() == expected.to_dict()
+    assert len(item_collection) == len(item_collection_dict["features"]) * 5
+    for item in item_collection:
+        assert item.get_root() is catalog
+        assert all(link.owner is item for link in item.links)
+
+
+def test_from_dict_with_max_workers_warns(
+    item_collection_dict: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(pystac.item_collection, "_MIN_CHUNK_SIZE", 1)
+    feature = item_collection_dict["features"][0]
+    feature["stac_extensions"].append(
+        "https://stac-extensions.github.io/version/v1.0.0/schema.json"
+    )
+    feature["properties"]["deprecated"] = True
+    with pytest.warns(pystac.DeprecatedWarning, match="is deprecated"):
+        ItemCollection.from_dict(item_collection_dict, max_workers=2)
+
+
+def test_from_dict_with_max_workers_parses_small_inputs_serially(
+    item_collection_dict: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def no_pool(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("No process pool should be started")
+
+    monkeypatch.setattr(pystac.item_collection, "ProcessPoolExecutor", no_pool)
+    expected = ItemCollection.from_dict(item_collection_dict)
+    for max_workers in (1, 2):
+        item_collection = ItemCollection.from_dict(
+            item_collection_dict, max_workers=max_workers
+        )
+        assert item_collection.to_dict() == expected.to_dict()
+
+    monkeypatch.setattr(pystac.item_collection, "_MIN_CHUNK_SIZE", 1)
+    empty = {**item_collection_dict, "features": []}
+    assert len(ItemCollection.from_dict(empty, max_workers=2)) == 0
+    item_collection = ItemCollection.from_dict(item_collection_dict, max_workers=1)
+    assert item_collection.to_dict() == expected.to_dict()
+
+    with pytest.raises(ValueError, match="max_workers"):
+        ItemCollection.from_dict(item_collection_dict, max_workers=0)
+
+
 def test_to_dict_does_not_read_root_link_of_items() -> None:
     with MockDefaultStacIO() as mock_stac_io:
         item_collection = pystac.ItemCollection.from_file(ITEM_COLLECTION)
@@ -206,3 +264,217 @@ def test_to_dict_does_not_read_root_link_of_items() -> None:
         item_collection.to_dict()
 
         assert mock_stac_io.mock.read_text.call_count == 1
+
+
+def test_iter_from_file(item_collection_dict: dict[str, Any]) -> None:
+    items = list(ItemCollection.iter_from_file(ITEM_COLLECTION))
+    expected = ItemCollection.from_file(ITEM_COLLECTION)
+    assert [item.to_dict(transform_hrefs=False) for item in items] == [
+        item.to_dict(transform_hrefs=False) for item in expected
+    ]
+
+
+def test_iter_from_file_reads_incrementally(
+    item_collection_dict: dict[str, Any],
+) -> None:
+    chunks_read = 0
+
+    class ChunkedStacIO(pystac.stac_io.DefaultStacIO):
+        def read_chunks(self, source: Any, *args: Any, **kwargs: Any) -> Any:
+            nonlocal chunks_read
+            for chunk in self.read_chunks_from_href(str(source), chunk_size=7):
+                chunks_read += 1
+                yield chunk
+
+    total = -(-os.path.getsize(ITEM_COLLECTION) // 7)
+    items = ItemCollection.iter_from_file(ITEM_COLLECTION, stac_io=ChunkedStacIO())
+    first = next(items)
+    assert first.id == item_collection_dict["features"][0]["id"]
+    assert chunks_read < total
+    assert len(list(items)) == len(item_collection_dict["features"]) - 1
+    assert chunks_read == total
+
+
+def test_iter_from_file_uses_read_text_overrides() -> None:
+    with MockDefaultStacIO() as mock_stac_io:
+        items = list(ItemCollection.iter_from_file(ITEM_COLLECTION))
+        assert mock_stac_io.mock.read_text.call_count == 1
+    assert len(items) == 10
+
+
+@pytest.mark.parametrize(
+    "txt,expected",
+    [
+        ('{"features": []}', []),
+        ("{}", []),
+        (
+            '{"type": "FeatureCollection", "features": [{"a": 1}, {"b": [2, 3.5]}]}',
+            [{"a": 1}, {"b": [2, 3.5]}],
+        ),
+        ('{"features": [1, 20, 300], "links": [{"x": "]"}]}', [1, 20, 300]),
+        (
+            ' { "x" : {"features": [0]} , "features" : [ "\\u00e9", null ] } ',
+            ["é", None],
+        ),
+    ],
+)
+def test_iter_features(txt: str, expected: list[Any]) -> None:
+    class BytewiseStacIO(StacIO):
+        def read_text(self, source: Any, *args: Any, **kwargs: Any) -> str:
+            raise NotImplementedError
+
+        def write_text(self, dest: Any, txt: str, *args: Any, **kwargs: Any) -> None:
+            raise NotImplementedError
+
+        def read_chunks(self, source: Any, *args: Any, **kwargs: Any) -> Any:
+            data = txt.encode("utf-8")
+            for i in range(len(data)):
+                yield data[i : i + 1]
+
+    assert list(BytewiseStacIO().iter_features("a.json")) == expected
+
+
+@pytest.mark.parametrize("txt", ['{"features": [1, 2', '{"features": [1 2]}', "[]"])
+def test_iter_features_invalid(txt: str) -> None:
+    class TextStacIO(StacIO):
+        def read_text(self, source: Any, *args: Any, **kwargs: Any) -> str:
+            return txt
+
+        def write_text(self, dest: Any, txt: str, *args: Any, **kwargs: Any) -> None:
+            raise NotImplementedError
+
+    with pytest.raises(json.JSONDecodeError):
+        list(TextStacIO().iter_features("a.json"))
+
+
+def test_ndjson_round_trip(tmp_path: Path) -> None:
+    item_collection = ItemCollection.from_file(ITEM_COLLECTION)
+    dest = str(tmp_path / "items.ndjson")
+    item_collection.save_ndjson(dest)
+
+    with open(dest) as f:
+        lines = f.read().splitlines()
+    assert len(lines) == len(item_collection)
+    assert item_collection.to_ndjson().splitlines() == lines
+
+    read = ItemCollection.from_ndjson(dest)
+    assert [item.to_dict(transform_hrefs=False) for item in read] == [
+        item.to_dict(transform_hrefs=False) for item in item_collection
+    ]
+
+
+def test_save_ndjson_append(tmp_path: Path) -> None:
+    item_collection = ItemCollection.from_file(ITEM_COLLECTION)
+    dest = str(tmp_path / "nested" / "items.ndjson")
+    ItemCollection(item_collection.items[:3]).save_ndjson(dest, append=True)
+    ItemCollection(item_collection.items[3:]).save_ndjson(dest, append=True)
+    ids = [item.id for item in ItemCollection.iter_ndjson(dest)]
+    assert ids == [item.id for item in item_collection]
+
+
+def test_iter_ndjson_streams_lines() -> None:
+    class ChunkedStacIO(StacIO):
+        def read_text(self, source: Any, *args: Any, **kwargs: Any) -> str:
+            raise NotImplementedError
+
+        def write_text(self, dest: Any, txt: str, *args: Any, **kwargs: Any) -> None:
+            raise NotImplementedError
+
+        def read_chunks(self, source: Any, *args: Any, **kwargs: Any) -> Any:
+            yield b'{"a": 1}\n{"b"'
+            yield b": 2}\n\n"
+            yield b'{"c": "\xc3'
+            yield b'\xa9"}'
+
+    assert list(ChunkedStacIO().iter_ndjson("a.ndjson")) == [
+        {"a": 1},
+        {"b": 2},
+        {"c": "é"},
+    ]
+
+
+def test_save_ndjson_append_not_supported(tmp_path: Path) -> None:
+    class TextStacIO(StacIO):
+        def read_text(self, source: Any, *args: Any, **kwargs: Any) -> str:
+            raise NotImplementedError
+
+        def write_text(self, dest: Any, txt: str, *args: Any, **kwargs: Any) -> None:
+            with open(dest, "w") as f:
+                f.write(txt)
+
+    item_collection = ItemCollection.from_file(ITEM_COLLECTION)
+    dest = str(tmp_path / "items.ndjson")
+    item_collection.save_ndjson(dest, stac_io=TextStacIO())
+    assert len(list(ItemCollection.iter_ndjson(dest))) == len(item_collection)
+    with pytest.raises(NotImplementedError):
+        item_collection.save_ndjson(dest, stac_io=TextStacIO(), append=True)
+
+
+def _comparable(item: Item) -> dict[str, Any]:
+    d = item.to_dict(transform_hrefs=False)
+    for key in ("datetime", "start_datetime", "end_datetime", "created", "updated"):
+        if d["properties"].get(key) is not None:
+            d["properties"][key] = pystac.utils.str_to_datetime(d["properties"][key])
+    return d
+
+
+def test_arrow_round_trip() -> None:
+    pytest.importorskip("pyarrow")
+    item_collection = ItemCollection.from_file(ITEM_COLLECTION)
+    item_collection.extra_fields["context"] = {"returned": 10}
+
+    table = item_collection.to_arrow()
+    assert table.num_rows == len(item_collection)
+    assert str(table.schema.field("datetime").type) == "timestamp[us, tz=UTC]"
+    assert table.column("id").to_pylist() == [item.id for item in item_collection]
+
+    read = ItemCollection.from_arrow(table)
+    assert read.extra_fields == item_collection.extra_fields
+    assert [_comparable(item) for item in read] == [
+        _comparable(item) for item in item_collection
+    ]
+
+
+def test_arrow_heterogeneous_items() -> None:
+    pytest.importorskip("pyarrow")
+    items = [Item.from_file(path) for path in (SIMPLE_ITEM, CORE_ITEM, EXTENDED_ITEM)]
+    items[0].properties["mixed"] = 1
+    items[1].properties["mixed"] = "one"
+    items[2].geometry = None
+    items[2].bbox = None
+    item_collection = ItemCollection(items)
+
+    read = ItemCollection.from_arrow(item_collection.to_arrow())
+    assert [_comparable(item) for item in read] == [
+        _comparable(item) for item in item_collection
+    ]
+
+
+def test_arrow_property_with_item_field_name() -> None:
+    pytest.importorskip("pyarrow")
+    items = [Item.from_file(SIMPLE_ITEM), Item.from_file(SIMPLE_ITEM)]
+    items[0].properties["bbox"] = "a property"
+    item_collection = ItemCollection(items)
+
+    table = item_collection.to_arrow()
+    assert "properties.bbox" in table.column_names
+    read = ItemCollection.from_arrow(table)
+    assert [_comparable(item) for item in read] == [
+        _comparable(item) for item in item_collection
+    ]
+
+
+def test_parquet_round_trip(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    item_collection = ItemCollection.from_file(ITEM_COLLECTION)
+    path = tmp_path / "items.parquet"
+    item_collection.to_parquet(path)
+
+    read = ItemCollection.from_parquet(path)
+    assert [_comparable(item) for item in read] == [
+        _comparable(item) for item in item_collection
+    ]
+
+    first = item_collection[0]
+    filtered = ItemCollection.from_parquet(path, filters=[("id", "=", first.id)])
+    assert [item.id for item in filtered] == [first.id]
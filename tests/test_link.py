@@ -1,6 +1,9 @@
+import asyncio
 import json
 import os
+import pickle
 import unittest
+from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -361,3 +364,78 @@ def test_item_link_type(item: Item) -> None:
     # https://github.com/stac-utils/pystac/issues/1494
     link = Link.item(item)
     assert link.media_type == "application/geo+json"
+
+
+def test_resolve_stac_object_async(test_case_1_catalog: pystac.Catalog) -> None:
+    link = test_case_1_catalog.get_child_links()[0]
+    assert not link.is_resolved()
+    asyncio.run(link.resolve_stac_object_async(root=test_case_1_catalog))
+    assert link.is_resolved()
+    child = link.target
+    assert isinstance(child, pystac.Catalog)
+    assert child.get_parent() is test_case_1_catalog
+    assert child.get_root() is test_case_1_catalog
+
+
+def test_resolve_stac_object_async_error() -> None:
+    link = Link("child", "/not/a/path/catalog.json")
+    with pytest.raises(STACError):
+        asyncio.run(link.resolve_stac_object_async())
+
+
+def test_link_is_compact() -> None:
+    link = Link.from_dict({"rel": "self", "href": "/catalog.json", "type": "foo/bar"})
+    other = Link.from_dict({"rel": "self", "href": "/catalog.json", "type": "foo/bar"})
+    assert not hasattr(link, "__dict__")
+    assert isinstance(link, os.PathLike)
+    assert link.rel is other.rel
+    assert link.media_type is other.media_type
+
+    assert link._extra_fields is None
+    link.extra_fields["foo"] = "bar"
+    assert other.extra_fields == {}
+    assert link.to_dict()["foo"] == "bar"
+
+
+def test_link_pickle() -> None:
+    link = Link("child", "./child/catalog.json", extra_fields={"foo": "bar"})
+    unpickled = pickle.loads(pickle.dumps(link))
+    assert unpickled.to_dict() == link.to_dict()
+    assert unpickled.extra_fields is not link.extra_fields
+
+
+def test_relative_href_follows_target_and_owner(tmp_path: Path) -> None:
+    catalog = pystac.Catalog("test", "test")
+    item = Item("an-item", None, None, TEST_DATETIME, {})
+    catalog.add_item(item)
+    catalog.normalize_hrefs(str(tmp_path))
+    catalog.catalog_type = pystac.CatalogType.SELF_CONTAINED
+    item_link = catalog.get_single_link("item")
+    assert item_link is not None
+    assert item_link.to_dict()["href"] == "./an-item/an-item.json"
+    assert item_link.to_dict()["href"] == "./an-item/an-item.json"
+
+    item.set_self_href(str(tmp_path / "items" / "an-item.json"))
+    assert item_link.to_dict()["href"] == "./items/an-item.json"
+    catalog.set_self_href(str(tmp_path / "items" / "catalog.json"))
+    assert item_link.to_dict()["href"] == "./an-item.json"
+    catalog.catalog_type = pystac.CatalogType.ABSOLUTE_PUBLISHED
+    assert item_link.to_dict()["href"] == item.self_href
+
+
+def test_link_extra_fields_round_trip() -> None:
+    d = {"rel": "child", "href": "./child/catalog.json", "foo": {"bar": [1, 2]}}
+    link = Link.from_dict(d)
+    assert link.extra_fields == {"foo": {"bar": [1, 2]}}
+    assert link.to_dict() == d
+    assert Link.from_dict(link.to_dict()).to_dict() == d
+
+    # Created on first access, and written once it has fields
+    link = Link("child", "./child/catalog.json")
+    assert link.extra_fields == {}
+    assert "foo" not in link.to_dict()
+    link.extra_fields["foo"] = "bar"
+    assert Link.from_dict(link.to_dict()).extra_fields == {"foo": "bar"}
+    for copied in (pickle.loads(pickle.dumps(link)), deepcopy(link)):
+        assert copied.extra_fields == {"foo": "bar"}
+        assert copied.extra_fields is not link.extra_fields
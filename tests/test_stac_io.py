@@ -1,14 +1,33 @@
+import asyncio
+import datetime
+import hashlib
+import http.server
 import json
 import os
 import tempfile
+import threading
+import time
 import unittest
+import zipfile
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 import pystac
-from pystac.stac_io import DefaultStacIO, DuplicateKeyReportingMixin, StacIO
-from tests.utils import TestCases
+from pystac.stac_io import (
+    CachingStacIO,
+    DefaultAsyncStacIO,
+    DefaultStacIO,
+    DiskCacheStacIO,
+    DuplicateKeyReportingMixin,
+    SQLiteStacIO,
+    StacIO,
+    ZipStacIO,
+)
+from pystac.utils import HREF
+from tests.utils import MockStacIO, TestCases
 
 
 class StacIOTest(unittest.TestCase):
@@ -159,3 +178,746 @@ def test_save_http_href_errors(tmp_path: Path) -> None:
     catalog.set_self_href("http://pystac.test/catalog.json")
     with pytest.raises(NotImplementedError):
         catalog.save_object()
+
+
+def test_pooled_stac_io_reuses_pool_manager() -> None:
+    _ = pytest.importorskip("urllib3")
+    from pystac.stac_io import PooledStacIO
+
+    catalog = pystac.Catalog("an-id", "a description").to_dict()
+    response = unittest.mock.MagicMock(
+        status=200, data=json.dumps(catalog).encode("utf-8")
+    )
+    stac_io = PooledStacIO(headers={"Authorization": "api-key fake-api-key-value"})
+    pool_manager = stac_io.pool_manager
+    with unittest.mock.patch.object(
+        pool_manager, "request", return_value=response
+    ) as request:
+        for _ in range(3):
+            stac_io.read_json("https://example.com/catalog.json")
+    assert request.call_count == 3
+    assert stac_io.pool_manager is pool_manager
+    assert pool_manager.headers == stac_io.headers
+
+
+def test_pooled_stac_io_error_status() -> None:
+    _ = pytest.importorskip("urllib3")
+    from pystac.stac_io import PooledStacIO
+
+    stac_io = PooledStacIO()
+    response = unittest.mock.MagicMock(status=404, data=b"Not found")
+    with unittest.mock.patch.object(
+        stac_io.pool_manager, "request", return_value=response
+    ):
+        with pytest.raises(Exception, match="Could not read uri"):
+            stac_io.read_text("https://example.com/catalog.json")
+
+
+def test_pooled_stac_io_local_file() -> None:
+    _ = pytest.importorskip("urllib3")
+    from pystac.stac_io import PooledStacIO
+
+    stac_io = PooledStacIO()
+    item = stac_io.read_stac_object(
+        TestCases.get_path("data-files/item/sample-item.json")
+    )
+    assert isinstance(item, pystac.Item)
+
+
+def test_pooled_stac_io_rate_limit() -> None:
+    _ = pytest.importorskip("urllib3")
+    from pystac.stac_io import PooledStacIO
+
+    response = unittest.mock.MagicMock(status=200, data=b"{}")
+    stac_io = PooledStacIO(requests_per_second=20)
+    with unittest.mock.patch.object(
+        stac_io.pool_manager, "request", return_value=response
+    ):
+        start = time.monotonic()
+        for _ in range(5):
+            stac_io.read_json("https://example.com/catalog.json")
+        # Other hosts have their own bucket
+        stac_io.read_json("https://example.org/catalog.json")
+    assert 0.18 <= time.monotonic() - start < 1
+
+
+def test_pooled_stac_io_max_concurrent_requests() -> None:
+    _ = pytest.importorskip("urllib3")
+    from pystac.stac_io import PooledStacIO
+
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def request(*args: Any, **kwargs: Any) -> Any:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return unittest.mock.MagicMock(status=200, data=b"{}")
+
+    stac_io = PooledStacIO(max_concurrent_requests=2)
+    with unittest.mock.patch.object(stac_io.pool_manager, "request", request):
+        threads = [
+            threading.Thread(
+                target=stac_io.read_json, args=("https://example.com/catalog.json",)
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert max_in_flight == 2
+
+
+class _ThrottlingHandler(http.server.BaseHTTPRequestHandler):
+    # Responds to the first request with a 429 and a Retry-After of one second
+    requests: list[tuple[str, int, float]] = []
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        with self.lock:
+            status = 429 if not self.requests else 200
+            self.requests.append((self.path, status, time.monotonic()))
+        body = json.dumps({"id": self.path}).encode("utf-8")
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "1")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+def test_pooled_stac_io_honours_retry_after() -> None:
+    _ = pytest.importorskip("urllib3")
+    from pystac.stac_io import PooledStacIO
+
+    _ThrottlingHandler.requests = []
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _ThrottlingHandler)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    host = f"127.0.0.1:{server.server_address[1]}"
+    stac_io = PooledStacIO(requests_per_second=100, burst=10)
+    try:
+        thread = threading.Thread(
+            target=stac_io.read_json, args=(f"http://{host}/a.json",)
+        )
+        thread.start()
+        assert stac_io._limiter is not None
+        hosts = stac_io._limiter._hosts
+        deadline = time.monotonic() + 3
+        while time.monotonic() < deadline and not (
+            host in hosts and hosts[host].blocked_until > 0
+        ):
+            time.sleep(0.001)
+        # A request from another thread also waits for the Retry-After
+        assert stac_io.read_json(f"http://{host}/b.json") == {"id": "/b.json"}
+        thread.join()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    requests = _ThrottlingHandler.requests
+    assert sorted((path, status) for path, status, _ in requests) == [
+        ("/a.json", 200),
+        ("/a.json", 429),
+        ("/b.json", 200),
+    ]
+    assert min(t for _, _, t in requests[1:]) - requests[0][2] >= 0.9
+    assert hosts[host].blocked_until > 0
+
+
+def test_pooled_stac_io_back_off_retries_exhausted() -> None:
+    urllib3 = pytest.importorskip("urllib3")
+    from pystac.stac_io import PooledStacIO
+
+    throttled = unittest.mock.MagicMock(status=503, headers={})
+    throttled.get_redirect_location.return_value = False
+    stac_io = PooledStacIO(
+        retry=urllib3.util.Retry(total=2), requests_per_second=1000, burst=10
+    )
+    with unittest.mock.patch.object(
+        stac_io.pool_manager, "request", return_value=throttled
+    ) as request:
+        with pytest.raises(Exception, match="HTTP status 503"):
+            stac_io.read_text("https://example.com/catalog.json")
+    assert request.call_count == 3
+
+
+def test_default_async_stac_io_limits_concurrency() -> None:
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    class SlowStacIO(DefaultStacIO):
+        def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return super().read_text(source, *args, **kwargs)
+
+    stac_io = DefaultAsyncStacIO(SlowStacIO(), max_concurrency=2)
+    path = TestCases.get_path("data-files/item/sample-item.json")
+
+    async def read() -> list[dict[str, Any]]:
+        return await asyncio.gather(*(stac_io.read_json(path) for _ in range(8)))
+
+    dicts = asyncio.run(read())
+    assert len(dicts) == 8
+    assert all(d["id"] == dicts[0]["id"] for d in dicts)
+    assert max_in_flight <= 2
+    # Reusing the instance with a new event loop works
+    assert len(asyncio.run(read())) == 8
+
+
+def test_async_stac_io_read_stac_object() -> None:
+    stac_io = DefaultAsyncStacIO()
+    item = asyncio.run(
+        stac_io.read_stac_object(TestCases.get_path("data-files/item/sample-item.json"))
+    )
+    assert isinstance(item, pystac.Item)
+
+
+def test_async_stac_io_requires_positive_concurrency() -> None:
+    with pytest.raises(ValueError):
+        DefaultAsyncStacIO(max_concurrency=0)
+
+
+def test_default_stac_io_write_creates_missing_directories(tmp_path: Path) -> None:
+    stac_io = DefaultStacIO()
+    dest = tmp_path / "a" / "b" / "c.json"
+    stac_io.write_text(str(dest), "{}")
+    stac_io.write_text(str(tmp_path / "a" / "b" / "d.json"), "{}")
+    assert dest.read_text() == "{}"
+    assert (tmp_path / "a" / "b" / "d.json").exists()
+
+
+def test_read_json_prefers_bytes(tmp_path: Path) -> None:
+    class BytesStacIO(DefaultStacIO):
+        def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+            raise AssertionError("read_text should not be called")
+
+        def read_bytes(self, source: HREF, *args: Any, **kwargs: Any) -> bytes:
+            return super().read_bytes(source, *args, **kwargs)
+
+    d = BytesStacIO().read_json(TestCases.get_path("data-files/item/sample-item.json"))
+    assert d["type"] == "Feature"
+
+
+def test_save_json_prefers_bytes(tmp_path: Path) -> None:
+    class BytesStacIO(DefaultStacIO):
+        def write_text(self, dest: HREF, txt: str, *args: Any, **kwargs: Any) -> None:
+            raise AssertionError("write_text should not be called")
+
+        def write_bytes(
+            self, dest: HREF, data: bytes, *args: Any, **kwargs: Any
+        ) -> None:
+            assert isinstance(data, bytes)
+            super().write_bytes(dest, data, *args, **kwargs)
+
+    dest = tmp_path / "item.json"
+    BytesStacIO().save_json(str(dest), {"id": "an-id"})
+    assert json.loads(dest.read_text()) == {"id": "an-id"}
+
+
+def test_save_json_if_changed(tmp_path: Path) -> None:
+    writes = []
+
+    class TextStacIO(DefaultStacIO):
+        def write_text_to_href(self, href: str, txt: str) -> None:
+            writes.append(txt)
+            super().write_text_to_href(href, txt)
+
+    stac_io = TextStacIO(compact=True)
+    dest = str(tmp_path / "item.json")
+    assert stac_io.save_json_if_changed(dest, {"id": "a"})
+    assert not stac_io.save_json_if_changed(dest, {"id": "a"})
+    assert stac_io.save_json_if_changed(dest, {"id": "a"}, compact=False)
+    assert stac_io.save_json_if_changed(dest, {"id": "b"}, compact=False)
+    assert writes == ['{"id":"a"}', '{\n  "id": "a"\n}', '{\n  "id": "b"\n}']
+    assert stac_io.read_json(dest) == {"id": "b"}
+
+
+def test_save_json_if_changed_does_not_hide_read_errors(tmp_path: Path) -> None:
+    class UnreadableStacIO(DefaultStacIO):
+        def read_bytes(self, source: HREF, *args: Any, **kwargs: Any) -> bytes:
+            raise PermissionError(source)
+
+    dest = tmp_path / "item.json"
+    with pytest.raises(PermissionError):
+        UnreadableStacIO().save_json_if_changed(str(dest), {"id": "a"})
+    assert not dest.exists()
+
+
+def test_save_json_if_changed_does_not_read_urls() -> None:
+    written = []
+
+    class RemoteStacIO(DefaultStacIO):
+        def read_bytes(self, source: HREF, *args: Any, **kwargs: Any) -> bytes:
+            raise AssertionError("read_bytes should not be called")
+
+        def write_bytes(
+            self, dest: HREF, data: bytes, *args: Any, **kwargs: Any
+        ) -> None:
+            written.append(dest)
+
+    dest = "https://example.com/item.json"
+    assert RemoteStacIO().save_json_if_changed(dest, {"id": "a"})
+    assert written == [dest]
+
+
+def test_text_overrides_are_not_bypassed_by_bytes_hooks(tmp_path: Path) -> None:
+    calls = []
+
+    class TextStacIO(DefaultStacIO):
+        def read_text(self, source: HREF, *args: Any, **kwargs: Any) -> str:
+            calls.append("read_text")
+            return super().read_text(source, *args, **kwargs)
+
+        def write_text_to_href(self, href: str, txt: str) -> None:
+            calls.append("write_text_to_href")
+            super().write_text_to_href(href, txt)
+
+    stac_io = TextStacIO()
+    d = stac_io.read_json(TestCases.get_path("data-files/item/sample-item.json"))
+    stac_io.save_json(str(tmp_path / "item.json"), d)
+    assert calls == ["read_text", "write_text_to_href"]
+    assert json.loads((tmp_path / "item.json").read_text()) == d
+
+
+@pytest.mark.parametrize("compact", [True, False])
+def test_json_dumps_compact(compact: bool) -> None:
+    stac_io = DefaultStacIO(compact=compact)
+    txt = stac_io.json_dumps({"b": 1, "a": [1, 2]})
+    assert ("\n" in txt) is not compact
+    assert json.loads(txt) == {"b": 1, "a": [1, 2]}
+    # Per-call options take precedence over the instance's
+    assert "\n" not in stac_io.json_dumps({"a": 1}, compact=True)
+    assert "\n" in stac_io.json_dumps({"a": 1}, compact=False)
+
+
+def test_json_dumps_sort_keys() -> None:
+    stac_io = DefaultStacIO(sort_keys=True)
+    assert stac_io.json_dumps({"b": 1, "a": 2}, compact=True) == '{"a":2,"b":1}'
+    assert stac_io.json_dumps({"b": 1, "a": 2}, compact=True, sort_keys=False) == (
+        '{"b":1,"a":2}'
+    )
+
+
+def test_json_dumps_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pystac.stac_io, "orjson", None)
+    stac_io = DefaultStacIO(compact=True, sort_keys=True)
+    assert stac_io.json_dumps({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+    assert stac_io.json_dumps({"a": 1}, compact=False) == '{\n  "a": 1\n}'
+
+
+class _ConditionalHandler(http.server.BaseHTTPRequestHandler):
+    bodies: dict[str, bytes] = {}
+    requests: list[tuple[str, int]] = []
+
+    def do_GET(self) -> None:
+        body = self.bodies[self.path]
+        etag = '"' + hashlib.sha256(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.requests.append((self.path, 304))
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.requests.append((self.path, 200))
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def conditional_server() -> Iterator[str]:
+    _ConditionalHandler.bodies = {}
+    _ConditionalHandler.requests = []
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _ConditionalHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+def test_disk_cache_stac_io_revalidates(
+    tmp_path: Path, conditional_server: str
+) -> None:
+    body = json.dumps({"id": "an-id"}).encode("utf-8")
+    _ConditionalHandler.bodies["/catalog.json"] = body
+    href = conditional_server + "/catalog.json"
+
+    stac_io = DiskCacheStacIO(str(tmp_path))
+    assert stac_io.read_json(href) == {"id": "an-id"}
+    assert stac_io.read_json(href) == {"id": "an-id"}
+    assert _ConditionalHandler.requests == [
+        ("/catalog.json", 200),
+        ("/catalog.json", 304),
+    ]
+    assert stac_io.size == len(body)
+
+    # The cache is picked up by a new instance
+    assert DiskCacheStacIO(str(tmp_path)).read_json(href) == {"id": "an-id"}
+    assert _ConditionalHandler.requests[-1] == ("/catalog.json", 304)
+
+    # Changed objects are downloaded again
+    _ConditionalHandler.bodies["/catalog.json"] = json.dumps({"id": "b"}).encode()
+    assert stac_io.read_json(href) == {"id": "b"}
+    assert _ConditionalHandler.requests[-1] == ("/catalog.json", 200)
+
+
+@pytest.mark.block_network(allowed_hosts=["127.0.0.1"])
+def test_disk_cache_stac_io_evicts_least_recently_used(
+    tmp_path: Path, conditional_server: str
+) -> None:
+    for name in "abc":
+        _ConditionalHandler.bodies[f"/{name}.json"] = b'{"id": "' + b"x" * 90 + b'"}'
+    stac_io = DiskCacheStacIO(str(tmp_path), max_size=250)
+    stac_io.read_json(conditional_server + "/a.json")
+    stac_io.read_json(conditional_server + "/b.json")
+    stac_io.read_json(conditional_server + "/a.json")
+    stac_io.read_json(conditional_server + "/c.json")
+    assert stac_io.size <= 250
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+    _ConditionalHandler.requests.clear()
+    stac_io.read_json(conditional_server + "/a.json")
+    stac_io.read_json(conditional_server + "/b.json")
+    assert _ConditionalHandler.requests == [("/a.json", 304), ("/b.json", 200)]
+
+    stac_io.clear()
+    assert stac_io.size == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_caching_stac_io_serves_repeated_reads_from_memory() -> None:
+    wrapped = MockStacIO()
+    stac_io = CachingStacIO(wrapped)
+    path = TestCases.get_path("data-files/item/sample-item.json")
+
+    d = stac_io.read_json(path)
+    d["id"] = "modified"
+    assert stac_io.read_json(path)["id"] != "modified"
+    assert isinstance(stac_io.read_stac_object(path), pystac.Item)
+    assert wrapped.mock.read_text.call_count == 1
+    assert (stac_io.hits, stac_io.misses) == (2, 1)
+    assert stac_io.size == os.path.getsize(path)
+
+
+def test_sqlite_stac_io_save_json_if_changed(tmp_path: Path) -> None:
+    dumps = []
+
+    class CountingSQLiteStacIO(SQLiteStacIO):
+        def _json_dumps_bytes(
+            self, json_dict: dict[str, Any], *args: Any, **kwargs: Any
+        ) -> bytes:
+            dumps.append(json_dict["id"])
+            return super()._json_dumps_bytes(json_dict, *args, **kwargs)
+
+    with CountingSQLiteStacIO(str(tmp_path / "catalog.db")) as stac_io:
+        assert stac_io.save_json_if_changed("/catalog/a.json", {"id": "a"})
+        assert not stac_io.save_json_if_changed("/catalog/a.json", {"id": "a"})
+        assert stac_io.save_json_if_changed("/catalog/a.json", {"id": "b"})
+        assert stac_io.read_json("/catalog/a.json") == {"id": "b"}
+    # Each dict is serialized once, whether or not it is written
+    assert dumps == ["a", "a", "b"]
+
+
+def test_caching_stac_io_uses_settings_of_wrapped_stac_io() -> None:
+    wrapped = DefaultStacIO(
+        headers={"User-Agent": "pystac"},
+        compact=True,
+        lazy_items=True,
+        intern_keys=True,
+    )
+    stac_io = CachingStacIO(wrapped)
+    assert stac_io.headers == {"User-Agent": "pystac"}
+    assert stac_io.compact and stac_io.lazy_items and stac_io.intern_keys
+    assert not stac_io.sort_keys
+
+    item = stac_io.read_stac_object(
+        TestCases.get_path("data-files/item/sample-item.json")
+    )
+    assert isinstance(item, pystac.Item)
+    assert item._raw_links is not None
+
+    stac_io.sort_keys = True
+    assert wrapped.sort_keys
+
+
+def test_caching_stac_io_as_shared_default() -> None:
+    path = TestCases.get_path(
+        "data-files/examples/0.9.0/extensions/commons/examples/landsat-item.json"
+    )
+    stac_io = CachingStacIO()
+    pystac.StacIO.set_default(lambda: stac_io)
+    try:
+        # Reading the item also reads its collection to merge its properties
+        first = pystac.StacIO.default().read_stac_object(path)
+        assert (stac_io.hits, stac_io.misses) == (0, 2)
+        second = pystac.StacIO.default().read_stac_object(path)
+        assert (stac_io.hits, stac_io.misses) == (2, 2)
+    finally:
+        pystac.StacIO.set_default(DefaultStacIO)
+    assert first.to_dict(transform_hrefs=False) == second.to_dict(transform_hrefs=False)
+    assert isinstance(first, pystac.Item)
+    assert "eo:bands" in first.properties
+
+
+def test_caching_stac_io_evicts_least_recently_used() -> None:
+    paths = [
+        TestCases.get_path("data-files/item/sample-item.json"),
+        TestCases.get_path("data-files/collections/multi-extent.json"),
+    ]
+    stac_io = CachingStacIO(max_size=max(os.path.getsize(p) for p in paths))
+    for path in paths:
+        stac_io.read_json(path)
+    stac_io.read_json(paths[1])
+    stac_io.read_json(paths[0])
+    assert (stac_io.hits, stac_io.misses) == (1, 3)
+    assert stac_io.size <= stac_io.max_size
+
+    stac_io.clear()
+    assert (stac_io.hits, stac_io.misses, stac_io.size) == (0, 0, 0)
+
+
+def test_caching_stac_io_invalidates_on_write(tmp_path: Path) -> None:
+    stac_io = CachingStacIO()
+    dest = str(tmp_path / "item.json")
+    stac_io.save_json(dest, {"id": "a"})
+    assert stac_io.read_json(dest) == {"id": "a"}
+    stac_io.save_json(dest, {"id": "b"})
+    assert stac_io.read_json(dest) == {"id": "b"}
+    assert (stac_io.hits, stac_io.misses) == (0, 2)
+
+
+def test_pooled_stac_io_streams_features() -> None:
+    _ = pytest.importorskip("urllib3")
+    from pystac.stac_io import PooledStacIO
+
+    data = json.dumps({"type": "FeatureCollection", "features": [{"id": "a"}]})
+    response = unittest.mock.MagicMock(status=200)
+    response.stream.return_value = iter([data[:10].encode(), data[10:].encode()])
+    stac_io = PooledStacIO()
+    with unittest.mock.patch.object(
+        stac_io.pool_manager, "request", return_value=response
+    ) as request:
+        features = list(stac_io.iter_features("https://example.com/search.json"))
+    assert features == [{"id": "a"}]
+    assert request.call_args.kwargs["preload_content"] is False
+    response.release_conn.assert_called_once()
+
+
+def test_zip_stac_io_round_trip(tmp_path: Path) -> None:
+    catalog = TestCases.case_1()
+    archive = str(tmp_path / "catalog.zip")
+    with ZipStacIO(archive, mode="w") as stac_io:
+        catalog.normalize_and_save(
+            stac_io.root_href, pystac.CatalogType.SELF_CONTAINED, stac_io=stac_io
+        )
+    assert list(tmp_path.iterdir()) == [tmp_path / "catalog.zip"]
+
+    stac_io = ZipStacIO(archive, mode="r")
+    assert "catalog.json" in stac_io.namelist()
+    read = pystac.Catalog.from_file(archive + "/catalog.json", stac_io=stac_io)
+    assert sorted(item.id for item in read.get_items(recursive=True)) == sorted(
+        item.id for item in catalog.get_items(recursive=True)
+    )
+    with pytest.raises(FileNotFoundError):
+        stac_io.read_text(archive + "/not-a-member.json")
+    stac_io.close()
+
+
+def test_zip_stac_io_rewrites_duplicate_members(tmp_path: Path) -> None:
+    archive = str(tmp_path / "catalog.zip")
+    with ZipStacIO(archive) as stac_io:
+        stac_io.save_json(archive + "/a.json", {"id": "first"})
+        stac_io.save_json(archive + "/b.json", {"id": "b"})
+        stac_io.save_json(archive + "/a.json", {"id": "second"})
+        assert stac_io.read_json(archive + "/a.json") == {"id": "second"}
+
+    with zipfile.ZipFile(archive) as zf:
+        assert sorted(zf.namelist()) == ["a.json", "b.json"]
+
+    with ZipStacIO(archive, mode="a") as stac_io:
+        stac_io.save_json(archive + "/c.json", {"id": "c"})
+        assert stac_io.read_json(archive + "/a.json") == {"id": "second"}
+    assert ZipStacIO(archive, mode="r").namelist() == ["a.json", "b.json", "c.json"]
+
+
+def test_zip_stac_io_outside_archive(tmp_path: Path) -> None:
+    with ZipStacIO(str(tmp_path / "catalog.zip")) as stac_io:
+        item = stac_io.read_stac_object(
+            TestCases.get_path("data-files/item/sample-item.json")
+        )
+        stac_io.save_json(str(tmp_path / "item.json"), item.to_dict())
+    assert (tmp_path / "item.json").exists()
+
+
+def _polygon(min_x: float, min_y: float, max_x: float, max_y: float) -> dict[str, Any]:
+    return {
+        "type": "Polygon",
+        "coordinates": [
+            [
+                [min_x, min_y],
+                [max_x, min_y],
+                [max_x, max_y],
+                [min_x, max_y],
+                [min_x, min_y],
+            ]
+        ],
+    }
+
+
+def _sqlite_catalog() -> pystac.Catalog:
+    catalog = pystac.Catalog("root", "root")
+    collection = pystac.Collection(
+        "landsat",
+        "landsat",
+        pystac.Extent(
+            pystac.SpatialExtent([[-10.0, -10.0, 30.0, 10.0]]),
+            pystac.TemporalExtent(
+                [[datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc), None]]
+            ),
+        ),
+    )
+    catalog.add_child(collection)
+    for i in range(4):
+        bbox = [i * 10.0 - 10, -10.0, i * 10.0, 10.0]
+        collection.add_item(
+            pystac.Item(
+                f"item-{i}",
+                _polygon(*bbox),
+                bbox,
+                datetime.datetime(2020, 1, 1 + i, tzinfo=datetime.timezone.utc),
+                {},
+            )
+        )
+    catalog.add_item(
+        pystac.Item(
+            "range",
+            _polygon(100, 50, 110, 60),
+            [100.0, 50.0, 0.0, 110.0, 60.0, 10.0],
+            None,
+            {
+                "start_datetime": "2019-12-01T00:00:00+01:00",
+                "end_datetime": "2020-01-02T12:00:00Z",
+            },
+        )
+    )
+    return catalog
+
+
+def test_sqlite_stac_io_round_trip(tmp_path: Path) -> None:
+    path = str(tmp_path / "catalog.db")
+    with SQLiteStacIO(path) as stac_io:
+        _sqlite_catalog().normalize_and_save(
+            "/catalog", pystac.CatalogType.SELF_CONTAINED, stac_io=stac_io
+        )
+    assert list(tmp_path.iterdir()) == [tmp_path / "catalog.db"]
+
+    with SQLiteStacIO(path) as stac_io:
+        assert "/catalog/catalog.json" in stac_io.hrefs()
+        catalog = pystac.Catalog.from_file("/catalog/catalog.json", stac_io=stac_io)
+        assert sorted(item.id for item in catalog.get_items(recursive=True)) == [
+            "item-0",
+            "item-1",
+            "item-2",
+            "item-3",
+            "range",
+        ]
+        stac_io.delete("/catalog/catalog.json")
+        with pytest.raises(FileNotFoundError):
+            stac_io.read_text("/catalog/catalog.json")
+
+        # HREFs that are not stored are read from the file system
+        item = stac_io.read_stac_object(
+            TestCases.get_path("data-files/item/sample-item.json")
+        )
+        assert item.id == "CS3-20160503_132131_05"
+
+
+def test_sqlite_stac_io_search(tmp_path: Path) -> None:
+    with SQLiteStacIO(str(tmp_path / "catalog.db")) as stac_io:
+        _sqlite_catalog().normalize_and_save(
+            "/catalog", pystac.CatalogType.SELF_CONTAINED, stac_io=stac_io
+        )
+
+        def ids(**kwargs: Any) -> list[str]:
+            return sorted(obj.id for obj in stac_io.search(**kwargs))
+
+        assert ids(ids=["item-1", "landsat"]) == ["item-1", "landsat"]
+        assert ids(collections=["landsat"]) == ["item-0", "item-1", "item-2", "item-3"]
+        assert ids(bbox=[5, 0, 15, 1]) == ["item-1", "item-2", "landsat"]
+        assert ids(bbox=[105, 55, 106, 56]) == ["range"]
+        assert ids(
+            datetime=(
+                datetime.datetime(2020, 1, 2),
+                datetime.datetime(2020, 1, 3),
+            )
+        ) == ["item-1", "item-2", "landsat", "range"]
+        assert ids(datetime=(datetime.datetime(2020, 1, 3), None)) == [
+            "item-2",
+            "item-3",
+            "landsat",
+        ]
+        assert ids(object_type=pystac.STACObjectType.CATALOG) == ["root"]
+
+        items = list(stac_io.search(ids=["item-0"]))
+        assert isinstance(items[0], pystac.Item)
+        assert items[0].get_self_href() == "/catalog/landsat/item-0/item-0.json"
+
+
+def test_sqlite_stac_io_batch_rolls_back(tmp_path: Path) -> None:
+    with SQLiteStacIO(str(tmp_path / "catalog.db")) as stac_io:
+        stac_io.save_json("/a.json", {"id": "a"})
+        with pytest.raises(RuntimeError):
+            with stac_io.batch():
+                stac_io.save_json("/b.json", {"id": "b"})
+                with stac_io.batch():
+                    stac_io.save_json("/c.json", {"id": "c"})
+                assert stac_io.hrefs() == ["/a.json", "/b.json", "/c.json"]
+                raise RuntimeError()
+        assert stac_io.hrefs() == ["/a.json"]
+        with stac_io.batch():
+            stac_io.write_text("/not-json.txt", "text")
+        assert stac_io.read_text("/not-json.txt") == "text"
+
+
+def test_stac_io_intern_keys(sample_item_dict: dict[str, Any]) -> None:
+    sample_item_dict["properties"]["my:property"] = {"my:nested": 1}
+    item_json = json.dumps(sample_item_dict)
+    stac_io = DefaultStacIO(intern_keys=True)
+
+    first, second = (
+        stac_io.stac_object_from_dict(json.loads(item_json)) for _ in range(2)
+    )
+    assert isinstance(first, pystac.Item) and isinstance(second, pystac.Item)
+    assert first.to_dict() == second.to_dict()
+    first_keys = {key: key for key in first.properties}
+    for key in second.properties:
+        assert key is first_keys[key]
+    (first_nested,) = first.properties["my:property"]
+    (second_nested,) = second.properties["my:property"]
+    assert first_nested is second_nested
@@ -4,6 +4,7 @@ import time
 import unittest
 from datetime import datetime, timedelta, timezone
 
+import dateutil.parser
 import pytest
 from dateutil import tz
 
@@ -515,3 +516,22 @@ def test_stringenum_repr() -> None:
         THIS = "this"
 
     assert repr(SomeEnum.THIS) == "'this'"
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        "2020-07-23T00:00:00Z",
+        "2020-07-23T00:00:00.0Z",
+        "2020-07-23T00:00:00.012Z",
+        "2020-07-23T00:00:00.01234Z",
+        "2020-07-23T00:00:00.012345Z",
+        "2000-01-01T24:00:00Z",
+    ],
+)
+def test_str_to_datetime_matches_dateutil(timestamp: str) -> None:
+    expected = dateutil.parser.isoparse(timestamp)
+    dt = str_to_datetime(timestamp)
+    assert dt == expected
+    assert dt.tzinfo is expected.tzinfo
+    assert str_to_datetime(timestamp) is dt